@@ -0,0 +1,59 @@
+import random
+from typing import Dict, Iterator, List
+
+TITLES = ("Python Developer", "Java Developer", "Data Scientist", "DevOps Engineer", "Frontend Developer",
+          "Go Developer", "QA Engineer", "Аналитик данных", "Системный администратор", "Тестировщик")
+LEVELS = ("", "Junior ", "Middle ", "Senior ", "Lead ")
+SKILLS = ("Python", "Django", "FastAPI", "SQL", "PostgreSQL", "Docker", "Kubernetes", "Java", "Spring", "React",
+          "TypeScript", "Go", "Linux", "Git", "Kafka", "Redis", "ClickHouse", "Pandas", "Airflow", "CI/CD")
+CURRENCIES = ("RUR", "RUR", "RUR", "RUR", "USD", "EUR", "KZT")
+
+
+def make_hh_items(count: int, seed: int = 0) -> Iterator[Dict]:
+    """
+    Генератор синтетических вакансий в формате API hh.ru.
+    Одинаковые count и seed всегда дают одинаковые данные, поэтому результаты замеров сопоставимы между коммитами.
+    :param count: Количество вакансий.
+    :param seed: Зерно генератора случайных чисел.
+    :return: Итератор вакансий (словарей).
+    """
+    rng = random.Random(seed)
+    for idx in range(count):
+        currency = rng.choice(CURRENCIES)
+        scale = 1 if currency == "RUR" else 0.01 if currency in ("USD", "EUR") else 5
+        salary_from = int(rng.randint(40, 400) * 1000 * scale) if rng.random() < 0.7 else None
+        salary_to = int((salary_from or 40000 * scale) * rng.uniform(1.0, 1.8)) if rng.random() < 0.6 else None
+        salary = None
+        if salary_from is not None or salary_to is not None:
+            salary = {"from": salary_from, "to": salary_to, "currency": currency, "gross": rng.random() < 0.3}
+        skills = ", ".join(rng.sample(SKILLS, rng.randint(2, 6)))
+        yield {
+            "id": str(10_000_000 + idx),
+            "name": f"{rng.choice(LEVELS)}{rng.choice(TITLES)}",
+            "url": f"https://api.hh.ru/vacancies/{10_000_000 + idx}?host=hh.ru",
+            "salary": salary,
+            "snippet": {"requirement": f"Опыт работы с {skills}. Умение работать в команде."},
+            "published_at": f"2024-05-{1 + idx % 28:02d}T{idx % 24:02d}:00:00+0300",
+        }
+
+
+def make_records(count: int, seed: int = 0) -> List[Dict]:
+    """
+    Синтетические вакансии в формате Vacancy.to_dict (как в файлах хранилища).
+    :param count: Количество вакансий.
+    :param seed: Зерно генератора случайных чисел.
+    :return: Список словарей.
+    """
+    records = []
+    for item in make_hh_items(count, seed):
+        salary = item["salary"] or {}
+        records.append({
+            "title": item["name"],
+            "url": item["url"],
+            "salary_from": salary.get("from"),
+            "salary_to": salary.get("to"),
+            "description": item["snippet"]["requirement"],
+            "currency": salary.get("currency") or "RUR",
+            "gross": salary.get("gross"),
+        })
+    return records
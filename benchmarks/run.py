@@ -0,0 +1,406 @@
+"""
+Замеры производительности основных этапов: выгрузка, разбор, ранжирование, фильтрация и сохранение вакансий.
+
+Запуск из корня репозитория:
+    python -m benchmarks.run --scales 1000,100000 --output benchmarks/report.json
+    python -m benchmarks.run --scales 1000,100000 --baseline old_report.json --threshold 1.25
+
+Для каждого замера фиксируется лучшее время из нескольких повторов и пиковый объем памяти (tracemalloc),
+отчет сохраняется в JSON и может сравниваться с отчетом другого коммита.
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Sequence
+from benchmarks.generators import make_hh_items, make_records
+from benchmarks.stub_server import StubHHServer
+from src.api import HeadHunterAPI
+from src.file_handler import JSONFileHandler, JSONLinesFileHandler, SQLiteFileHandler
+from src.matcher import KeywordMatcher
+from src.utils import top_salary_vacancies
+from src.vacancy import Vacancy
+
+DEFAULT_SCALES = (1000, 100_000)
+FILTER_WORDS = ("Django", "Kafka", "ClickHouse")
+
+# Подготовка замера: по масштабу и рабочей папке возвращает функцию, время которой измеряется
+Setup = Callable[[int, str], Callable[[], object]]
+
+
+class Benchmark:
+    """
+    Описание замера: подготовка данных не входит в измеряемое время.
+    """
+
+    def __init__(self, name: str, setup: Setup, max_scale: Optional[int] = None):
+        """
+        :param name: Название замера.
+        :param setup: Подготовка замера.
+        :param max_scale: Максимальный масштаб (для заведомо медленных путей, например поштучного сохранения).
+        """
+        self.name = name
+        self.setup = setup
+        self.max_scale = max_scale
+
+
+@lru_cache(maxsize=2)
+def _hh_items(scale: int) -> List[Dict]:
+    """
+    Синтетические вакансии в формате API hh.ru (кешируются между замерами одного масштаба).
+    :param scale: Количество вакансий.
+    :return: Список элементов ответа API.
+    """
+    return list(make_hh_items(scale))
+
+
+@lru_cache(maxsize=2)
+def _records(scale: int) -> List[Dict]:
+    """
+    Синтетические записи хранилища (кешируются между замерами одного масштаба).
+    :param scale: Количество записей.
+    :return: Список записей.
+    """
+    return make_records(scale)
+
+
+@lru_cache(maxsize=2)
+def _vacancies(scale: int) -> List[Vacancy]:
+    """
+    Синтетические вакансии (кешируются между замерами одного масштаба).
+    :param scale: Количество вакансий.
+    :return: Список вакансий.
+    """
+    return Vacancy.from_hh_items(_hh_items(scale))
+
+
+def _fresh_path(workdir: str, name: str) -> str:
+    """
+    Путь к файлу хранилища без следов прошлого повтора (блокировка, журналы SQLite).
+    :param workdir: Рабочая папка.
+    :param name: Имя файла.
+    :return: Путь к файлу.
+    """
+    path = os.path.join(workdir, name)
+    for suffix in ("", ".lock", "-wal", "-shm"):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+    return path
+
+
+def _setup_from_hh_items(scale: int, workdir: str) -> Callable[[], object]:
+    """
+    Замер пакетного создания вакансий из элементов ответа API hh.ru.
+    :param scale: Количество вакансий.
+    :param workdir: Рабочая папка для файлов хранилищ.
+    :return: Измеряемая функция.
+    """
+    items = _hh_items(scale)
+    return lambda: Vacancy.from_hh_items(items)
+
+
+def _setup_from_dicts(scale: int, workdir: str) -> Callable[[], object]:
+    """
+    Замер создания вакансий из сохраненных записей без повторной проверки (trusted).
+    :param scale: Количество вакансий.
+    :param workdir: Рабочая папка для файлов хранилищ.
+    :return: Измеряемая функция.
+    """
+    records = _records(scale)
+    return lambda: Vacancy.from_dicts(records, trusted=True)
+
+
+def _setup_rank(scale: int, workdir: str) -> Callable[[], object]:
+    """
+    Замер выбора топ-10 вакансий по зарплате.
+    :param scale: Количество вакансий.
+    :param workdir: Рабочая папка для файлов хранилищ.
+    :return: Измеряемая функция.
+    """
+    vacancies = _vacancies(scale)
+    return lambda: top_salary_vacancies(vacancies, 10)
+
+
+def _setup_filter(scale: int, workdir: str) -> Callable[[], object]:
+    """
+    Замер фильтрации вакансий по ключевым словам в описании.
+    :param scale: Количество вакансий.
+    :param workdir: Рабочая папка для файлов хранилищ.
+    :return: Измеряемая функция.
+    """
+    vacancies = _vacancies(scale)
+    matcher = KeywordMatcher(FILTER_WORDS)
+    return lambda: [vacancy for vacancy in vacancies if matcher.matches(vacancy.get_description())]
+
+
+def _setup_json_add_many(scale: int, workdir: str) -> Callable[[], object]:
+    """
+    Замер пакетного сохранения записей в JSON-файл.
+    :param scale: Количество вакансий.
+    :param workdir: Рабочая папка для файлов хранилищ.
+    :return: Измеряемая функция.
+    """
+    records = _records(scale)
+    handler = JSONFileHandler(_fresh_path(workdir, "add_many.json"))
+    return lambda: handler.add_many(records)
+
+
+def _setup_json_add_data(scale: int, workdir: str) -> Callable[[], object]:
+    """
+    Замер поштучного сохранения записей в JSON-файл (каждая запись перезаписывает файл).
+    :param scale: Количество вакансий.
+    :param workdir: Рабочая папка для файлов хранилищ.
+    :return: Измеряемая функция.
+    """
+    records = _records(scale)
+    handler = JSONFileHandler(_fresh_path(workdir, "add_data.json"))
+
+    def run():
+        for record in records:
+            handler.add_data(record)
+
+    return run
+
+
+def _setup_json_delete_data(scale: int, workdir: str) -> Callable[[], object]:
+    """
+    Замер удаления одной записи из заполненного JSON-файла.
+    :param scale: Количество вакансий.
+    :param workdir: Рабочая папка для файлов хранилищ.
+    :return: Измеряемая функция.
+    """
+    records = _records(scale)
+    handler = JSONFileHandler(_fresh_path(workdir, "delete_data.json"))
+    handler.add_many(records)
+    return lambda: handler.delete_data({"url": records[0]["url"]})
+
+
+def _setup_jsonl_add_many(scale: int, workdir: str) -> Callable[[], object]:
+    """
+    Замер пакетного сохранения записей в файл JSON Lines.
+    :param scale: Количество вакансий.
+    :param workdir: Рабочая папка для файлов хранилищ.
+    :return: Измеряемая функция.
+    """
+    records = _records(scale)
+    handler = JSONLinesFileHandler(_fresh_path(workdir, "add_many.jsonl"))
+    return lambda: handler.add_many(records)
+
+
+def _setup_sqlite_add_many(scale: int, workdir: str) -> Callable[[], object]:
+    """
+    Замер пакетного сохранения записей в базу SQLite (соединение закрывается после замера).
+    :param scale: Количество вакансий.
+    :param workdir: Рабочая папка для файлов хранилищ.
+    :return: Измеряемая функция.
+    """
+    records = _records(scale)
+    handler = SQLiteFileHandler(_fresh_path(workdir, "add_many.db"))
+
+    def run():
+        try:
+            handler.add_many(records)
+        finally:
+            handler.close()
+
+    return run
+
+
+BENCHMARKS = [
+    Benchmark("vacancy_from_hh_items", _setup_from_hh_items),
+    Benchmark("vacancy_from_dicts_trusted", _setup_from_dicts),
+    Benchmark("rank_top_salary", _setup_rank),
+    Benchmark("filter_keywords", _setup_filter),
+    Benchmark("json_add_many", _setup_json_add_many),
+    Benchmark("json_add_data", _setup_json_add_data, max_scale=1000),  # Поштучное сохранение: файл на каждую запись
+    Benchmark("json_delete_data", _setup_json_delete_data),
+    Benchmark("jsonl_add_many", _setup_jsonl_add_many),
+    Benchmark("sqlite_add_many", _setup_sqlite_add_many),
+]
+
+
+def measure(run_factory: Callable[[], Callable[[], object]], repeat: int = 3) -> Dict[str, float]:
+    """
+    Замер времени и пиковой памяти. Время — лучший результат из repeat запусков без трассировки памяти
+    (трассировка замедляет код); память — отдельный запуск под tracemalloc, учитываются только
+    выделения внутри измеряемой функции.
+    :param run_factory: Функция, готовящая новый экземпляр замера.
+    :param repeat: Количество повторов для замера времени.
+    :return: Словарь с ключами seconds и peak_bytes.
+    """
+    times = []
+    for _ in range(repeat):
+        run = run_factory()
+        gc.collect()
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+
+    run = run_factory()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"seconds": min(times), "peak_bytes": peak}
+
+
+def fetch_benchmarks(latency: float, pages: int, repeat: int) -> List[Dict]:
+    """
+    Замеры HeadHunterAPI.get_vacancies против локальной заглушки с задержкой: последовательно и в потоках.
+    :param latency: Задержка ответа заглушки в секундах.
+    :param pages: Количество страниц.
+    :param repeat: Количество повторов.
+    :return: Результаты замеров.
+    """
+    results = []
+    with StubHHServer(latency=latency, total=pages * 50) as server:
+        for name, workers in (("fetch_sequential", 1), ("fetch_concurrent", 8)):
+            def run_factory(workers=workers):
+                api = HeadHunterAPI()
+                api.BASE_URL = server.url
+                return lambda: api.get_vacancies("Python", pages=pages, max_workers=workers)
+
+            results.append({"name": name, "scale": pages, **measure(run_factory, repeat)})
+    return results
+
+
+def run_benchmarks(scales: Sequence[int] = DEFAULT_SCALES, repeat: int = 3, only: Optional[Sequence[str]] = None,
+                   latency: float = 0.05, fetch_pages: int = 20, log: Callable[[str], None] = print) -> Dict:
+    """
+    Запуск набора замеров.
+    :param scales: Масштабы (количество вакансий).
+    :param repeat: Количество повторов для замера времени.
+    :param only: Названия замеров для запуска (None — все).
+    :param latency: Задержка заглушки API в секундах (для замеров выгрузки).
+    :param fetch_pages: Количество страниц для замеров выгрузки (0 — не замерять выгрузку).
+    :param log: Функция вывода прогресса.
+    :return: Отчет: сведения об окружении и список результатов.
+    """
+    results = []
+    workdir = tempfile.mkdtemp(prefix="benchmarks_")
+    try:
+        for scale in scales:
+            for benchmark in BENCHMARKS:
+                if only and benchmark.name not in only:
+                    continue
+                if benchmark.max_scale is not None and scale > benchmark.max_scale:
+                    log(f"{benchmark.name:<28} {scale:>9}  пропущен (max_scale={benchmark.max_scale})")
+                    continue
+                result = {"name": benchmark.name, "scale": scale,
+                          **measure(lambda: benchmark.setup(scale, workdir), repeat)}
+                results.append(result)
+                log(_format_result(result))
+            _hh_items.cache_clear()
+            _records.cache_clear()
+            _vacancies.cache_clear()
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    if fetch_pages and (not only or {"fetch_sequential", "fetch_concurrent"} & set(only)):
+        for result in fetch_benchmarks(latency, fetch_pages, repeat):
+            if not only or result["name"] in only:
+                results.append(result)
+                log(_format_result(result))
+    return {"meta": _environment(latency), "results": results}
+
+
+def compare(report: Dict, baseline: Dict, threshold: float = 1.25) -> List[Dict]:
+    """
+    Сравнение отчета с базовым: замеры, ставшие медленнее или прожорливее больше чем в threshold раз.
+    :param report: Текущий отчет.
+    :param baseline: Базовый отчет (например, с предыдущего коммита).
+    :param threshold: Допустимое отношение текущего значения к базовому.
+    :return: Список регрессий с отношениями времени и памяти.
+    """
+    previous = {(result["name"], result["scale"]): result for result in baseline["results"]}
+    regressions = []
+    for result in report["results"]:
+        base = previous.get((result["name"], result["scale"]))
+        if base is None:
+            continue
+        time_ratio = result["seconds"] / base["seconds"] if base["seconds"] else 1.0
+        memory_ratio = result["peak_bytes"] / base["peak_bytes"] if base["peak_bytes"] else 1.0
+        if time_ratio > threshold or memory_ratio > threshold:
+            regressions.append({"name": result["name"], "scale": result["scale"],
+                                "time_ratio": round(time_ratio, 3), "memory_ratio": round(memory_ratio, 3)})
+    return regressions
+
+
+def _format_result(result: Dict) -> str:
+    """
+    Строка отчета о замере для вывода в консоль.
+    :param result: Результат замера.
+    :return: Отформатированная строка.
+    """
+    return (f"{result['name']:<28} {result['scale']:>9}  {result['seconds'] * 1000:>10.2f} мс  "
+            f"{result['peak_bytes'] / 2 ** 20:>9.2f} МиБ")
+
+
+def _environment(latency: float) -> Dict:
+    """
+    Окружение замеров для отчета: коммит, версия Python, платформа и время запуска.
+    :param latency: Задержка заглушки API в секундах.
+    :return: Словарь с описанием окружения.
+    """
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "stub_latency": latency,
+    }
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Точка входа замеров: выполнение, сохранение отчета и сравнение с базовым отчетом.
+    :param argv: Аргументы командной строки (по умолчанию sys.argv[1:]).
+    :return: Код завершения: 0 — успех, 1 — найдены регрессии.
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run", description="Замеры производительности.")
+    parser.add_argument("--scales", default=",".join(map(str, DEFAULT_SCALES)),
+                        help="Масштабы через запятую (например, 1000,100000,1000000).")
+    parser.add_argument("--repeat", type=int, default=3, help="Количество повторов каждого замера.")
+    parser.add_argument("--only", help="Названия замеров через запятую.")
+    parser.add_argument("--latency", type=float, default=0.05, help="Задержка заглушки API в секундах.")
+    parser.add_argument("--fetch-pages", type=int, default=20, help="Страниц в замерах выгрузки (0 — пропустить).")
+    parser.add_argument("-o", "--output", help="Файл для отчета в формате JSON.")
+    parser.add_argument("--baseline", help="Отчет для сравнения (например, с предыдущего коммита).")
+    parser.add_argument("--threshold", type=float, default=1.25, help="Допустимое замедление относительно базового.")
+    args = parser.parse_args(argv)
+
+    scales = [int(scale) for scale in args.scales.split(",") if scale]
+    only = args.only.split(",") if args.only else None
+    report = run_benchmarks(scales, args.repeat, only, args.latency, args.fetch_pages)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, ensure_ascii=False, indent=4)
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as file:
+            regressions = compare(report, json.load(file), args.threshold)
+        for regression in regressions:
+            print(f"Регрессия: {regression['name']} ({regression['scale']}): время x{regression['time_ratio']}, "
+                  f"память x{regression['memory_ratio']}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple, Type
+from urllib.parse import parse_qs, urlparse
+from benchmarks.generators import make_hh_items
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """
+    Обработчик заглушки API hh.ru: отдает страницы синтетических вакансий с заданной задержкой.
+    """
+
+    server: "StubHHServer"
+
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query)
+        page = int(query.get("page", ["0"])[0])
+        per_page = int(query.get("per_page", ["50"])[0])
+        time.sleep(self.server.latency)
+        body = self.server.page_body(page, per_page)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubHHServer(ThreadingHTTPServer):
+    """
+    Локальная заглушка API hh.ru для замеров сетевой части и тестов клиента без обращения к hh.ru.
+    Запускается в фоновом потоке как контекстный менеджер; адрес для клиента — свойство url.
+    По умолчанию отдает страницы синтетических вакансий; тесты передают свой обработчик
+    (ошибки, ETag, зависший ответ).
+    """
+
+    daemon_threads = True
+
+    def __init__(self, latency: float = 0.05, total: int = 2000, seed: int = 0,
+                 handler: Optional[Type[BaseHTTPRequestHandler]] = None):
+        """
+        Инициализация заглушки.
+        :param latency: Задержка ответа на каждую страницу в секундах.
+        :param total: Общее количество вакансий в выдаче.
+        :param seed: Зерно генератора вакансий.
+        :param handler: Класс обработчика запросов (по умолчанию — страницы синтетических вакансий).
+        """
+        super().__init__(("127.0.0.1", 0), handler or _StubHandler)
+        self.latency = latency
+        self.total = total
+        self.seed = seed
+        # Вакансии генерируются при первом запросе страницы: собственным обработчикам они не нужны
+        self._items: Optional[List[Dict]] = None
+        self._pages: Dict[Tuple[int, int], bytes] = {}
+        self._thread = threading.Thread(target=self.serve_forever, args=(0.05,), daemon=True)
+
+    @property
+    def url(self) -> str:
+        """
+        Адрес выдачи вакансий для клиента (подставляется в BASE_URL).
+        :return: URL заглушки.
+        """
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/vacancies"
+
+    def page_body(self, page: int, per_page: int) -> bytes:
+        """
+        Тело ответа для страницы (сериализуется один раз, чтобы замер не включал работу заглушки).
+        :param page: Номер страницы.
+        :param per_page: Количество вакансий на странице.
+        :return: JSON-ответ в байтах.
+        """
+        key = (page, per_page)
+        if key not in self._pages:
+            if self._items is None:
+                self._items = list(make_hh_items(self.total, self.seed))
+            items = self._items[page * per_page:(page + 1) * per_page]
+            pages = -(-self.total // per_page)
+            self._pages[key] = json.dumps({"items": items, "pages": pages, "found": self.total},
+                                          ensure_ascii=False).encode("utf-8")
+        return self._pages[key]
+
+    def __enter__(self) -> "StubHHServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.shutdown()
+        self.server_close()
@@ -1,3 +1,5 @@
+import sys
+from src import cli
 from src.utils import user_interaction
 
 
@@ -8,7 +10,11 @@ def main():
     - Отображает вакансии пользователю.
     - Позволяет фильтровать и сортировать вакансии.
     - Сохраняет вакансии в файл.
+    Если переданы аргументы командной строки, работает в пакетном режиме без вопросов пользователю
+    (см. python main.py --help).
     """
+    if len(sys.argv) > 1:
+        sys.exit(cli.main(sys.argv[1:]))
     user_interaction()  # Вызов функции для начала взаимодействия с пользователем
 
 
@@ -0,0 +1,283 @@
+import math
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from src.currency import ExchangeRates
+from src.file_handler import FileHandler
+from src.matcher import KeywordMatcher
+from src.search_index import tokenize
+from src.vacancy import Vacancy
+
+SALARY_KEYS = ("salary_from", "salary_to", "average")
+
+# Слова уровня позиции, которые не влияют на кластер названия ("Senior Python Developer" -> "python developer")
+SENIORITY_WORDS = frozenset({
+    "junior", "middle", "senior", "lead", "principal", "head", "chief", "intern", "trainee", "jr", "sr",
+    "младший", "старший", "ведущий", "главный", "стажер", "начинающий", "руководитель",
+})
+
+
+class QuantileSketch:
+    """
+    Приближенные квантили с гарантированной относительной погрешностью (схема DDSketch).
+    Значения раскладываются по логарифмическим корзинам, поэтому память зависит от разброса
+    значений (сотни корзин для зарплат), а не от их количества; наброски можно объединять.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        """
+        Инициализация наброска.
+        :param relative_accuracy: Допустимая относительная погрешность квантилей (например, 0.01 — 1%).
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("Относительная погрешность должна быть в диапазоне (0, 1).")
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._buckets: Dict[int, int] = {}
+        self._zero_count = 0  # Нулевые значения не имеют логарифма и хранятся отдельно
+        self.count = 0
+
+    def add(self, value: float) -> None:
+        """
+        Добавление неотрицательного значения.
+        :param value: Значение.
+        """
+        if value <= 0:
+            self._zero_count += 1
+        else:
+            index = math.ceil(math.log(value) / self._log_gamma)
+            self._buckets[index] = self._buckets.get(index, 0) + 1
+        self.count += 1
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """
+        Объединение с наброском той же точности (например, посчитанным по другой части данных).
+        :param other: Другой набросок.
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Объединять можно только наброски с одинаковой погрешностью.")
+        for index, count in other._buckets.items():
+            self._buckets[index] = self._buckets.get(index, 0) + count
+        self._zero_count += other._zero_count
+        self.count += other.count
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Приближенное значение квантиля.
+        :param q: Уровень квантиля в диапазоне [0, 1] (0.5 — медиана).
+        :return: Значение квантиля или None, если значений нет.
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("Уровень квантиля должен быть в диапазоне [0, 1].")
+        if self.count == 0:
+            return None
+        rank = q * (self.count - 1)
+        seen = self._zero_count
+        if rank < seen:
+            return 0.0
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if rank < seen:
+                # Середина корзины (gamma^(i-1), gamma^i] с учетом относительной погрешности
+                return 2 * self._gamma ** index / (self._gamma + 1)
+        return 2 * self._gamma ** max(self._buckets) / (self._gamma + 1)
+
+
+class SalaryStats:
+    """
+    Потоковая статистика зарплат за один проход: количество, минимум, максимум, среднее
+    и стандартное отклонение (алгоритм Уэлфорда), гистограмма с фиксированной шириной корзин
+    и приближенные квантили. Память не зависит от количества обработанных записей.
+    """
+
+    def __init__(self, bin_width: float = 10000, relative_accuracy: float = 0.01):
+        """
+        Инициализация статистики.
+        :param bin_width: Ширина корзины гистограммы.
+        :param relative_accuracy: Относительная погрешность квантилей.
+        """
+        if bin_width <= 0:
+            raise ValueError("Ширина корзины гистограммы должна быть положительной.")
+        self.bin_width = bin_width
+        self.count = 0
+        self.missing = 0  # Вакансии без зарплаты
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self.mean = 0.0
+        self._m2 = 0.0  # Сумма квадратов отклонений от среднего
+        self._bins: Dict[int, int] = {}
+        self._sketch = QuantileSketch(relative_accuracy)
+
+    def add(self, value: Optional[float]) -> None:
+        """
+        Учет одного значения зарплаты.
+        :param value: Зарплата (None — зарплата не указана).
+        """
+        if value is None:
+            self.missing += 1
+            return
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        bin_index = int(value // self.bin_width)
+        self._bins[bin_index] = self._bins.get(bin_index, 0) + 1
+        self._sketch.add(value)
+
+    def merge(self, other: "SalaryStats") -> None:
+        """
+        Объединение со статистикой, посчитанной по другой части данных.
+        :param other: Другая статистика с той же шириной корзин.
+        """
+        if other.bin_width != self.bin_width:
+            raise ValueError("Объединять можно только статистики с одинаковой шириной корзин.")
+        self.missing += other.missing
+        if other.count == 0:
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self._m2 += other._m2 + delta * delta * self.count * other.count / total
+        self.mean += delta * other.count / total
+        self.count = total
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+        for bin_index, count in other._bins.items():
+            self._bins[bin_index] = self._bins.get(bin_index, 0) + count
+        self._sketch.merge(other._sketch)
+
+    @property
+    def std(self) -> Optional[float]:
+        """
+        Стандартное отклонение зарплаты (None, если значений нет).
+        """
+        if self.count == 0:
+            return None
+        return math.sqrt(self._m2 / self.count)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Приближенный квантиль зарплаты.
+        :param q: Уровень квантиля в диапазоне [0, 1].
+        :return: Значение квантиля или None, если значений нет.
+        """
+        return self._sketch.quantile(q)
+
+    def percentiles(self, levels: Sequence[float] = (25, 50, 75, 90)) -> Dict[float, Optional[float]]:
+        """
+        Приближенные процентили зарплаты.
+        :param levels: Уровни процентилей от 0 до 100.
+        :return: Словарь уровень -> значение.
+        """
+        return {level: self.quantile(level / 100) for level in levels}
+
+    def histogram(self) -> List[Tuple[float, float, int]]:
+        """
+        Гистограмма зарплат: только непустые корзины в порядке возрастания.
+        :return: Список (нижняя граница включительно, верхняя граница, количество).
+        """
+        return [(index * self.bin_width, (index + 1) * self.bin_width, self._bins[index])
+                for index in sorted(self._bins)]
+
+    def to_dict(self, levels: Sequence[float] = (25, 50, 75, 90)) -> Dict:
+        """
+        Сводка статистики в виде словаря (например, для сохранения в JSON).
+        :param levels: Уровни процентилей от 0 до 100.
+        :return: Словарь со статистикой.
+        """
+        return {
+            "count": self.count,
+            "missing": self.missing,
+            "min": self.min,
+            "max": self.max,
+            "mean": self.mean if self.count else None,
+            "std": self.std,
+            "percentiles": {str(level): value for level, value in self.percentiles(levels).items()},
+            "histogram": [list(bin_) for bin_ in self.histogram()],
+        }
+
+
+def cluster_title(title: str) -> str:
+    """
+    Кластер названия вакансии: слова в нижнем регистре без указания уровня позиции.
+    :param title: Название вакансии.
+    :return: Название кластера (исходное название в нижнем регистре, если все слова — уровень позиции).
+    """
+    words = tokenize(title)
+    return " ".join(word for word in words if word not in SENIORITY_WORDS) or " ".join(words)
+
+
+def by_title_cluster(record: Dict) -> List[str]:
+    """
+    Группировка по кластеру названия.
+    :param record: Вакансия в формате Vacancy.to_dict.
+    :return: Список из одного названия группы.
+    """
+    return [cluster_title(record["title"])]
+
+
+def by_keywords(keywords: Iterable[str]) -> Callable[[Dict], List[str]]:
+    """
+    Группировка по ключевым словам в названии и описании: вакансия попадает в группу каждого найденного слова.
+    :param keywords: Ключевые слова (например, поисковые запросы).
+    :return: Функция группировки.
+    """
+    matcher = KeywordMatcher(keywords)
+
+    def group(record: Dict) -> List[str]:
+        return sorted(matcher.find(f"{record['title']} {record.get('description') or ''}"))
+
+    return group
+
+
+def salary_of(record: Dict, key: str = "average", rates: Optional[ExchangeRates] = None) -> Optional[float]:
+    """
+    Зарплата сохраненной вакансии по правилам Vacancy.average_salary, при необходимости в базовой валюте.
+    :param record: Вакансия в формате Vacancy.to_dict.
+    :param key: Ключ: "salary_from", "salary_to" или "average".
+    :param rates: Таблица курсов для приведения к базовой валюте (None — без пересчета).
+    :return: Зарплата или None, если она не указана.
+    """
+    if key == "average":
+        value = Vacancy.average_of(record.get("salary_from"), record.get("salary_to"))
+    elif key in SALARY_KEYS:
+        value = record.get(key)
+    else:
+        raise ValueError(f"Неизвестный ключ зарплаты: {key}. Допустимые: {', '.join(SALARY_KEYS)}.")
+    if value is None or rates is None:
+        return value
+    return value * rates.factor(record.get("currency") or Vacancy.DEFAULT_CURRENCY, record.get("gross"))
+
+
+def aggregate(records: Iterable[Dict], group_by: Optional[Callable[[Dict], Iterable[str]]] = None,
+              key: str = "average", rates: Optional[ExchangeRates] = None, bin_width: float = 10000,
+              relative_accuracy: float = 0.01) -> Dict[str, SalaryStats]:
+    """
+    Статистика зарплат по группам за один проход по записям.
+    :param records: Вакансии в формате Vacancy.to_dict (например, handler.iter_data()).
+    :param group_by: Функция, возвращающая группы записи (None — одна группа "all").
+    :param key: Ключ: "salary_from", "salary_to" или "average".
+    :param rates: Таблица курсов для приведения к базовой валюте.
+    :param bin_width: Ширина корзины гистограммы.
+    :param relative_accuracy: Относительная погрешность квантилей.
+    :return: Словарь группа -> статистика.
+    """
+    stats: Dict[str, SalaryStats] = {}
+    for record in records:
+        value = salary_of(record, key, rates)
+        for group in (group_by(record) if group_by is not None else ("all",)):
+            group_stats = stats.get(group)
+            if group_stats is None:
+                group_stats = stats[group] = SalaryStats(bin_width, relative_accuracy)
+            group_stats.add(value)
+    return stats
+
+
+def aggregate_handler(handler: FileHandler, **kwargs) -> Dict[str, SalaryStats]:
+    """
+    Статистика зарплат по сохраненным вакансиям: записи читаются потоком через iter_data.
+    :param handler: Хранилище вакансий.
+    :param kwargs: Параметры aggregate (group_by, key, rates, bin_width, relative_accuracy).
+    :return: Словарь группа -> статистика.
+    """
+    return aggregate(handler.iter_data(), **kwargs)
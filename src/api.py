@@ -1,6 +1,46 @@
+import asyncio
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 import requests
-from typing import List
+from requests.adapters import HTTPAdapter
+from typing import AsyncIterator, Iterator, List, Optional, Tuple, Union
+from src.cache import ResponseCache
+from src.metrics import metrics
+from src.throttling import CircuitBreaker, RetryPolicy, TokenBucket
+
+try:
+    import aiohttp
+except ImportError:  # aiohttp нужен только асинхронному клиенту
+    aiohttp = None
+
+# Исключения транспорта, которые асинхронный клиент превращает в ConnectionError
+_ASYNC_TRANSPORT_ERRORS = (asyncio.TimeoutError, OSError) + ((aiohttp.ClientError,) if aiohttp else ())
+
+
+def _build_params(keyword: str, page: int, params: Optional[dict] = None) -> dict:
+    """
+    Формирует параметры запроса одной страницы вакансий hh.ru.
+    :param keyword: Ключевое слово для поиска вакансий.
+    :param page: Номер страницы (начиная с 0).
+    :param params: Дополнительные параметры запроса (например, order_by, date_from).
+    :return: Словарь параметров запроса.
+    """
+    return {
+        "text": keyword,
+        "per_page": 50,  # Максимальное количество вакансий на странице
+        "page": page,
+        **(params or {}),
+    }
+
+
+def _status_error(status_code: int, reason: str) -> ValueError:
+    """
+    Формирует исключение для неуспешного ответа API.
+    :param status_code: HTTP статус-код ответа.
+    :param reason: Текстовое описание статуса.
+    :return: Исключение ValueError с описанием ошибки.
+    """
+    return ValueError(f"Ошибка подключения к API: статус-код {status_code} — {reason}")
 
 
 class JobPlatformAPI(ABC):
@@ -27,52 +67,426 @@ class JobPlatformAPI(ABC):
         """
         pass
 
+    @abstractmethod
+    def iter_vacancies(self, keyword: str, pages: int = 1) -> Iterator[dict]:
+        """
+        Лениво получает вакансии с платформы постранично.
+        :param keyword: Ключевое слово для поиска вакансий.
+        :param pages: Максимальное количество страниц для запроса.
+        :return: Итератор вакансий в формате словарей.
+        """
+        pass
+
 
 class HeadHunterAPI(JobPlatformAPI):
     """
     Класс для работы с API HeadHunter, наследуется от JobPlatformAPI.
     """
     BASE_URL = "https://api.hh.ru/vacancies"
+    USER_AGENT = "Search-for-vacancies/0.1.0"
 
-    def _connect_to_api(self, **kwargs) -> requests.Response:
+    def __init__(
+        self,
+        session: Optional[requests.Session] = None,
+        transport: Optional[HTTPAdapter] = None,
+        timeout: float = 10.0,
+        pool_size: int = 10,
+        rate_limiter: Optional[TokenBucket] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        cache: Optional[ResponseCache] = None,
+    ):
+        """
+        Инициализация клиента с долгоживущей HTTP-сессией.
+        :param session: Готовая сессия (например, для тестов). Если не передана, создается новая.
+        :param transport: Транспорт (адаптер requests), монтируемый в создаваемую сессию вместо стандартного.
+        :param timeout: Таймаут одного запроса в секундах.
+        :param pool_size: Размер пула соединений (должен быть не меньше числа параллельных запросов).
+        :param rate_limiter: Общий для всех запросов ограничитель частоты (по умолчанию без ограничения).
+        :param retry_policy: Политика повторов (по умолчанию RetryPolicy()).
+        :param circuit_breaker: Предохранитель (по умолчанию CircuitBreaker()).
+        :param cache: Дисковый кеш ответов (по умолчанию не используется).
+        """
+        self.timeout = timeout
+        self._cache = cache
+        self._rate_limiter = rate_limiter
+        self._retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self._circuit_breaker = circuit_breaker if circuit_breaker is not None else CircuitBreaker()
+        self._session = session if session is not None else self._create_session(transport, pool_size)
+
+    def __enter__(self) -> "HeadHunterAPI":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Закрывает HTTP-сессию и освобождает соединения пула.
+        """
+        self._session.close()
+
+    def _create_session(self, transport: Optional[HTTPAdapter], pool_size: int) -> requests.Session:
+        """
+        Приватный метод создания сессии с пулом keep-alive соединений и сжатием gzip.
+        :param transport: Пользовательский адаптер или None для стандартного HTTPAdapter.
+        :param pool_size: Размер пула соединений.
+        :return: Настроенная сессия requests.
+        """
+        session = requests.Session()
+        adapter = transport if transport is not None else HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update({
+            "User-Agent": self.USER_AGENT,
+            "Accept-Encoding": "gzip, deflate",
+            "Connection": "keep-alive",
+        })
+        return session
+
+    def _connect_to_api(self, headers: Optional[dict] = None, **kwargs) -> requests.Response:
         """
         Приватный метод подключения к API hh.ru.
+        Временные ошибки (429, 5xx, сбои соединения) повторяются согласно политике повторов,
+        каждая попытка проходит через ограничитель частоты и предохранитель.
+        :param headers: Дополнительные заголовки (например, для условного запроса).
         :param kwargs: Параметры подключения (например, text, page, per_page).
-        :return: Ответ от API hh.ru.
+        :return: Ответ от API hh.ru (200 или 304 на условный запрос).
         """
-        try:
-            response = requests.get(self.BASE_URL, params=kwargs)
-            if response.status_code == 200:
-                return response
+        extra = {"headers": headers} if headers else {}
+
+        for attempt in range(self._retry_policy.max_retries + 1):
+            self._circuit_breaker.before_request()
+            if self._rate_limiter is not None:
+                self._rate_limiter.acquire()
+
+            retry_after = None
+            metrics.inc("api_requests")
+            try:
+                with metrics.timer("api_request"):
+                    response = self._session.get(self.BASE_URL, params=kwargs, timeout=self.timeout, **extra)
+            except requests.RequestException as e:
+                error = ConnectionError(f"Ошибка соединения с API hh.ru: {e}")
             else:
-                raise ValueError(
-                    f"Ошибка подключения к API: статус-код {response.status_code} — {response.reason}"
-                )
-        except requests.RequestException as e:
-            raise ConnectionError(f"Ошибка соединения с API hh.ru: {e}")
+                if response.status_code == 200 or (response.status_code == 304 and headers):
+                    self._circuit_breaker.record_success()
+                    return response
+                error = _status_error(response.status_code, response.reason)
+                if not self._retry_policy.should_retry(response.status_code):
+                    # Ошибка запроса, а не сервера: повтор не поможет, но сервер доступен
+                    self._circuit_breaker.record_success()
+                    raise error
+                retry_after = response.headers.get("Retry-After")
 
-    def get_vacancies(self, keyword: str, pages: int = 1) -> List[dict]:
+            self._circuit_breaker.record_failure()
+            if attempt == self._retry_policy.max_retries:
+                raise error
+            metrics.inc("api_retries")
+            self._retry_policy.wait(attempt, retry_after)
+
+    @staticmethod
+    def _decode(response: requests.Response) -> dict:
+        """
+        Приватный метод разбора тела ответа с учетом объема полученных данных и времени разбора.
+        :param response: Ответ от API hh.ru.
+        :return: Тело ответа.
+        """
+        with metrics.timer("api_decode"):
+            payload = response.json()
+        metrics.inc("api_bytes_read", len(response.content))
+        return payload
+
+    @staticmethod
+    def _read(response: requests.Response) -> bytes:
+        """
+        Приватный метод получения тела ответа без разбора JSON с учетом объема полученных данных.
+        :param response: Ответ от API hh.ru.
+        :return: Тело ответа.
+        """
+        content = response.content
+        metrics.inc("api_bytes_read", len(content))
+        return content
+
+    def _fetch(self, query: dict, raw: bool = False) -> Union[dict, bytes]:
+        """
+        Приватный метод получения тела ответа с учетом кеша: свежая запись отдается без запроса,
+        устаревшая перепроверяется условным запросом, новый ответ сохраняется в кеш.
+        :param query: Параметры запроса.
+        :param raw: Не разбирать новый ответ, а вернуть его тело как есть (записи кеша уже разобраны).
+        :return: Тело ответа: словарь или, при raw=True и ответе от API, байты.
+        """
+        if self._cache is None:
+            # Вызов приватного метода подключения
+            response = self._connect_to_api(**query)
+            return self._read(response) if raw else self._decode(response)
+
+        key = self._cache.make_key(query)
+        entry = self._cache.get(key)
+        if entry is not None and self._cache.is_fresh(entry):
+            metrics.inc("api_cache_hits")
+            return entry["payload"]
+
+        headers = self._cache.conditional_headers(entry) if entry is not None else None
+        response = self._connect_to_api(headers=headers, **query)
+        if response.status_code == 304:
+            metrics.inc("api_cache_revalidated")
+            self._cache.refresh(key, entry)
+            return entry["payload"]
+
+        metrics.inc("api_cache_misses")
+        etag, last_modified = response.headers.get("ETag"), response.headers.get("Last-Modified")
+        if raw:
+            content = self._read(response)
+            self._cache.put_raw(key, content, etag, last_modified)
+            return content
+        payload = self._decode(response)
+        self._cache.put(key, payload, etag, last_modified)
+        return payload
+
+    def _fetch_page(self, keyword: str, page: int, params: Optional[dict] = None) -> dict:
+        """
+        Приватный метод получения одной страницы вакансий.
+        :param keyword: Ключевое слово для поиска вакансий.
+        :param page: Номер страницы (начиная с 0).
+        :param params: Дополнительные параметры запроса.
+        :return: Тело ответа API (вакансии в поле items, число страниц в поле pages).
+        """
+        return self._fetch(_build_params(keyword, page, params))
+
+    def iter_pages(self, keyword: str, pages: int = 1, params: Optional[dict] = None) -> Iterator[List[dict]]:
+        """
+        Генератор страниц вакансий: следующая страница запрашивается только по мере потребления.
+        Останавливается раньше, если API сообщает, что страниц меньше запрошенного (поле pages).
+        :param keyword: Ключевое слово для поиска вакансий.
+        :param pages: Максимальное количество страниц для обработки.
+        :param params: Дополнительные параметры запроса (например, order_by, date_from).
+        :return: Итератор списков вакансий по страницам.
+        """
+        for page in range(pages):
+            data = self._fetch_page(keyword, page, params)
+            yield data.get("items", [])
+            if page + 1 >= data.get("pages", pages):
+                return
+
+    def iter_vacancies(self, keyword: str, pages: int = 1, params: Optional[dict] = None) -> Iterator[dict]:
+        """
+        Генератор вакансий с hh.ru, работающий в постоянной памяти.
+        :param keyword: Ключевое слово для поиска вакансий.
+        :param pages: Максимальное количество страниц для обработки.
+        :param params: Дополнительные параметры запроса (например, order_by, date_from).
+        :return: Итератор вакансий (словарей) из API hh.ru.
+        """
+        for items in self.iter_pages(keyword, pages, params):
+            yield from items
+
+    def get_raw_page(self, keyword: str, page: int, params: Optional[dict] = None) -> Union[dict, bytes]:
+        """
+        Получение одной страницы вакансий без разбора JSON — для передачи разбора в пул процессов.
+        Ответ API возвращается как есть и сохраняется в кеш без разбора; запись из кеша
+        возвращается уже разобранной, так как она прочитана из файла.
+        :param keyword: Ключевое слово для поиска вакансий.
+        :param page: Номер страницы (начиная с 0).
+        :param params: Дополнительные параметры запроса.
+        :return: Тело ответа API (байты) или разобранная запись кеша (словарь).
+        """
+        return self._fetch(_build_params(keyword, page, params), raw=True)
+
+    def get_vacancies(self, keyword: str, pages: int = 1, max_workers: int = 1) -> List[dict]:
         """
         Метод получения вакансий с hh.ru.
+        При max_workers > 1 страницы запрашиваются параллельно, но результат
+        всё равно возвращается в порядке страниц.
         :param keyword: Ключевое слово для поиска вакансий.
         :param pages: Количество страниц для обработки.
+        :param max_workers: Максимальное число одновременных запросов (по умолчанию 1 — последовательно).
         :return: Список вакансий (словарей) из API hh.ru.
         """
-        vacancies = []
+        if max_workers < 1:
+            raise ValueError("Количество потоков должно быть положительным числом.")
 
-        for page in range(pages):
-            # Подготовка параметров запроса
-            params = {
-                "text": keyword,
-                "per_page": 50,  # Максимальное количество вакансий на странице
-                "page": page,
-            }
+        if max_workers == 1 or pages <= 1:
+            return list(self.iter_vacancies(keyword, pages))
 
-            # Вызов приватного метода подключения
-            response = self._connect_to_api(**params)
+        vacancies = []
 
-            # Извлечение данных из ответа
-            items = response.json().get("items", [])
-            vacancies.extend(items)
+        # Executor.map сохраняет порядок страниц независимо от порядка ответов
+        with ThreadPoolExecutor(max_workers=min(max_workers, pages)) as executor:
+            responses = executor.map(lambda page: self._fetch_page(keyword, page), range(pages))
+            for page, data in enumerate(responses):
+                vacancies.extend(data.get("items", []))
+                if page + 1 >= data.get("pages", pages):
+                    break
 
         return vacancies
+
+
+class AsyncJobPlatformAPI(ABC):
+    """
+    Абстрактный класс для асинхронной работы с API вакансий.
+    """
+
+    @abstractmethod
+    async def _connect_to_api(self, **kwargs) -> dict:
+        """
+        Асинхронно подключается к API сервиса. Реализация зависит от платформы.
+        :param kwargs: Параметры подключения.
+        :return: Тело ответа API в виде словаря.
+        """
+        pass
+
+    @abstractmethod
+    async def get_vacancies(self, keyword: str, pages: int = 1) -> List[dict]:
+        """
+        Асинхронно получает список вакансий с платформы.
+        :param keyword: Ключевое слово для поиска вакансий.
+        :param pages: Количество страниц для запроса.
+        :return: Список вакансий в формате словарей.
+        """
+        pass
+
+    @abstractmethod
+    def iter_pages(self, keyword: str, pages: int = 1) -> AsyncIterator[Tuple[int, List[dict]]]:
+        """
+        Асинхронный генератор страниц вакансий в порядке их получения.
+        :param keyword: Ключевое слово для поиска вакансий.
+        :param pages: Количество страниц для запроса.
+        :return: Пары (номер страницы, список вакансий).
+        """
+        pass
+
+
+class AsyncHeadHunterAPI(AsyncJobPlatformAPI):
+    """
+    Асинхронный клиент API HeadHunter на aiohttp, наследуется от AsyncJobPlatformAPI.
+    """
+    BASE_URL = HeadHunterAPI.BASE_URL
+    USER_AGENT = HeadHunterAPI.USER_AGENT
+
+    def __init__(self, session: Optional["aiohttp.ClientSession"] = None, timeout: float = 10.0,
+                 max_concurrency: int = 10, rate_limiter: Optional[TokenBucket] = None,
+                 retry_policy: Optional[RetryPolicy] = None, circuit_breaker: Optional[CircuitBreaker] = None):
+        """
+        Инициализация асинхронного клиента.
+        :param session: Готовая сессия aiohttp (например, для тестов). Если не передана, создается при первом запросе.
+        :param timeout: Таймаут одного запроса в секундах.
+        :param max_concurrency: Максимальное число одновременных запросов.
+        :param rate_limiter: Общий для всех запросов ограничитель частоты (по умолчанию без ограничения).
+        :param retry_policy: Политика повторов (по умолчанию RetryPolicy()).
+        :param circuit_breaker: Предохранитель (по умолчанию CircuitBreaker()).
+        """
+        if session is None and aiohttp is None:
+            raise ImportError("Для асинхронного клиента требуется пакет aiohttp: pip install aiohttp")
+        if max_concurrency < 1:
+            raise ValueError("Количество одновременных запросов должно быть положительным числом.")
+        self.timeout = timeout
+        self._session = session
+        self._owns_session = session is None
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._rate_limiter = rate_limiter
+        self._retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self._circuit_breaker = circuit_breaker if circuit_breaker is not None else CircuitBreaker()
+
+    async def __aenter__(self) -> "AsyncHeadHunterAPI":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Закрывает сессию, если она была создана самим клиентом.
+        """
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        """
+        Приватный метод ленивого создания сессии (aiohttp требует запущенный цикл событий).
+        :return: Сессия aiohttp.
+        """
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                headers={"User-Agent": self.USER_AGENT, "Accept-Encoding": "gzip, deflate"},
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self._session
+
+    async def _connect_to_api(self, **kwargs) -> dict:
+        """
+        Приватный метод асинхронного подключения к API hh.ru.
+        Повторы, ограничение частоты и предохранитель работают так же, как в HeadHunterAPI,
+        но ожидание не блокирует цикл событий.
+        :param kwargs: Параметры подключения (например, text, page, per_page).
+        :return: Тело ответа API hh.ru.
+        """
+        for attempt in range(self._retry_policy.max_retries + 1):
+            self._circuit_breaker.before_request()
+            if self._rate_limiter is not None:
+                await asyncio.sleep(self._rate_limiter.reserve())
+
+            retry_after = None
+            metrics.inc("api_requests")
+            try:
+                async with self._semaphore:
+                    async with self._get_session().get(self.BASE_URL, params=kwargs) as response:
+                        if response.status == 200:
+                            data = await response.json()
+                            metrics.inc("api_bytes_read", len(await response.read()))
+                            self._circuit_breaker.record_success()
+                            return data
+                        error = _status_error(response.status, response.reason)
+                        if not self._retry_policy.should_retry(response.status):
+                            # Ошибка запроса, а не сервера: повтор не поможет, но сервер доступен
+                            self._circuit_breaker.record_success()
+                            raise error
+                        retry_after = response.headers.get("Retry-After")
+            except _ASYNC_TRANSPORT_ERRORS as e:
+                error = ConnectionError(f"Ошибка соединения с API hh.ru: {e}")
+
+            self._circuit_breaker.record_failure()
+            if attempt == self._retry_policy.max_retries:
+                raise error
+            metrics.inc("api_retries")
+            await asyncio.sleep(self._retry_policy.get_delay(attempt, retry_after))
+
+    async def _fetch_page(self, keyword: str, page: int) -> Tuple[int, List[dict]]:
+        """
+        Приватный метод получения одной страницы вакансий.
+        :param keyword: Ключевое слово для поиска вакансий.
+        :param page: Номер страницы (начиная с 0).
+        :return: Пара (номер страницы, список вакансий).
+        """
+        data = await self._connect_to_api(**_build_params(keyword, page))
+        return page, data.get("items", [])
+
+    async def iter_pages(self, keyword: str, pages: int = 1) -> AsyncIterator[Tuple[int, List[dict]]]:
+        """
+        Асинхронный генератор страниц: отдает страницы по мере получения ответов.
+        При закрытии генератора незавершенные запросы отменяются.
+        :param keyword: Ключевое слово для поиска вакансий.
+        :param pages: Количество страниц для обработки.
+        :return: Пары (номер страницы, список вакансий).
+        """
+        tasks = [asyncio.ensure_future(self._fetch_page(keyword, page)) for page in range(pages)]
+        try:
+            for future in asyncio.as_completed(tasks):
+                yield await future
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def get_vacancies(self, keyword: str, pages: int = 1) -> List[dict]:
+        """
+        Асинхронный метод получения вакансий с hh.ru.
+        :param keyword: Ключевое слово для поиска вакансий.
+        :param pages: Количество страниц для обработки.
+        :return: Список вакансий (словарей) в порядке страниц.
+        """
+        results = [None] * pages
+        async for page, items in self.iter_pages(keyword, pages):
+            results[page] = items
+        return [item for items in results for item in items]
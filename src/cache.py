@@ -0,0 +1,219 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+
+
+class ResponseCache:
+    """
+    Дисковый кеш ответов API с ограничением времени жизни (TTL) и размера (LRU).
+    Каждый ответ хранится в отдельном JSON-файле; время последнего обращения
+    отражается во времени модификации файла. Порядок вытеснения хранится в памяти:
+    папка просматривается один раз при первой записи, дальше вытеснение стоит O(1).
+    Кеш общий для потоков клиента, поэтому порядок вытеснения изменяется под блокировкой.
+    """
+
+    def __init__(self, directory: str = os.path.join("data", "cache"), ttl: float = 600.0,
+                 max_entries: int = 1000, clock: Callable[[], float] = time.time):
+        """
+        Инициализация кеша.
+        :param directory: Папка для хранения ответов (по умолчанию data/cache).
+        :param ttl: Время жизни ответа в секундах, после которого он требует повторной проверки.
+        :param max_entries: Максимальное количество хранимых ответов.
+        :param clock: Источник текущего времени.
+        """
+        if max_entries < 1:
+            raise ValueError("Размер кеша должен быть положительным числом.")
+        self._directory = directory
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._clock = clock
+        self._lru: Optional[OrderedDict] = None  # Пути записей от давно не использованных к свежим
+        self._lru_lock = threading.Lock()
+
+        # Создаем папку кеша, если ее нет
+        os.makedirs(self._directory, exist_ok=True)
+
+    @staticmethod
+    def make_key(params: Dict) -> str:
+        """
+        Формирует ключ кеша по нормализованным параметрам запроса.
+        Поисковая строка приводится к нижнему регистру с единичными пробелами,
+        поэтому "Python " и "python" попадают в одну запись.
+        :param params: Параметры запроса (text, page, per_page и др.).
+        :return: Ключ кеша.
+        """
+        normalized = {key: str(value) for key, value in params.items()}
+        if "text" in normalized:
+            normalized["text"] = " ".join(normalized["text"].casefold().split())
+        raw = json.dumps(normalized, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        """
+        Приватный метод получения пути к файлу записи.
+        :param key: Ключ кеша.
+        :return: Путь к файлу.
+        """
+        return os.path.join(self._directory, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Получение записи кеша (в том числе устаревшей — она нужна для условного запроса).
+        :param key: Ключ кеша.
+        :return: Словарь с полями payload, etag, last_modified, stored_at или None.
+        """
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                entry = json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        self._touch(path)
+        return entry
+
+    def is_fresh(self, entry: Dict) -> bool:
+        """
+        Проверяет, не истек ли срок жизни записи.
+        :param entry: Запись кеша.
+        :return: True, если запись можно отдавать без обращения к API.
+        """
+        return self._clock() - entry["stored_at"] < self._ttl
+
+    @staticmethod
+    def conditional_headers(entry: Dict) -> Dict[str, str]:
+        """
+        Формирует заголовки условного запроса по валидаторам записи.
+        :param entry: Запись кеша.
+        :return: Заголовки If-None-Match / If-Modified-Since (могут отсутствовать).
+        """
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def put(self, key: str, payload: Dict, etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
+        """
+        Сохранение ответа в кеш с последующим вытеснением давно не использованных записей.
+        :param key: Ключ кеша.
+        :param payload: Тело ответа API.
+        :param etag: Значение заголовка ETag, если есть.
+        :param last_modified: Значение заголовка Last-Modified, если есть.
+        """
+        entry = {
+            "payload": payload,
+            "etag": etag,
+            "last_modified": last_modified,
+            "stored_at": self._clock(),
+        }
+        self._write(self._path(key), entry)
+        self._evict()
+
+    def put_raw(self, key: str, content: bytes, etag: Optional[str] = None,
+                last_modified: Optional[str] = None) -> None:
+        """
+        Сохранение тела ответа без разбора JSON: тело вставляется в запись как есть,
+        поэтому запись читается методом get так же, как записи, сохраненные методом put.
+        :param key: Ключ кеша.
+        :param content: Тело ответа API (JSON в UTF-8).
+        :param etag: Значение заголовка ETag, если есть.
+        :param last_modified: Значение заголовка Last-Modified, если есть.
+        """
+        fields = json.dumps({"etag": etag, "last_modified": last_modified, "stored_at": self._clock()},
+                            ensure_ascii=False)
+        self._write_text(self._path(key), '{"payload": ' + content.decode("utf-8") + ", " + fields[1:])
+        self._evict()
+
+    def refresh(self, key: str, entry: Dict) -> None:
+        """
+        Продлевает срок жизни записи после ответа 304 Not Modified.
+        :param key: Ключ кеша.
+        :param entry: Запись кеша.
+        """
+        self._write(self._path(key), dict(entry, stored_at=self._clock()))
+
+    def clear(self) -> None:
+        """
+        Удаление всех записей кеша.
+        """
+        for name in os.listdir(self._directory):
+            if name.endswith(".json"):
+                os.remove(os.path.join(self._directory, name))
+        with self._lru_lock:
+            self._lru = OrderedDict()
+
+    def _write(self, path: str, entry: Dict) -> None:
+        """
+        Приватный метод сохранения записи кеша в файл.
+        :param path: Путь к файлу записи.
+        :param entry: Запись кеша.
+        """
+        self._write_text(path, json.dumps(entry, ensure_ascii=False))
+
+    def _write_text(self, path: str, text: str) -> None:
+        """
+        Приватный метод атомарной записи: сначала во временный файл, затем переименование.
+        :param path: Путь к файлу записи.
+        :param text: Запись кеша в формате JSON.
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                file.write(text)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        self._touch(path)
+
+    def _touch(self, path: str) -> None:
+        """
+        Приватный метод отметки обращения к записи для LRU-вытеснения.
+        :param path: Путь к файлу записи.
+        """
+        now = self._clock()
+        try:
+            os.utime(path, (now, now))
+        except FileNotFoundError:
+            pass  # Запись могла быть вытеснена параллельным процессом
+        with self._lru_lock:
+            if self._lru is not None:
+                self._lru[path] = None
+                self._lru.move_to_end(path)
+
+    def _load_lru(self) -> OrderedDict:
+        """
+        Приватный метод построения порядка вытеснения по времени модификации файлов (один раз на экземпляр).
+        Вызывается под блокировкой порядка вытеснения.
+        :return: Пути записей от давно не использованных к свежим.
+        """
+        if self._lru is None:
+            entries = []
+            for name in os.listdir(self._directory):
+                if name.endswith(".json"):
+                    path = os.path.join(self._directory, name)
+                    try:
+                        entries.append((os.path.getmtime(path), path))
+                    except FileNotFoundError:
+                        continue
+            self._lru = OrderedDict((path, None) for _, path in sorted(entries))
+        return self._lru
+
+    def _evict(self) -> None:
+        """
+        Приватный метод вытеснения давно не использованных записей сверх лимита.
+        """
+        with self._lru_lock:
+            lru = self._load_lru()
+            while len(lru) > self._max_entries:
+                path, _ = lru.popitem(last=False)
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
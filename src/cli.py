@@ -0,0 +1,210 @@
+import argparse
+import sys
+from argparse import Namespace
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from src.api import HeadHunterAPI
+from src.cache import ResponseCache
+from src.file_handler import FileHandler, JSONFileHandler, JSONLinesFileHandler, SQLiteFileHandler
+from src.matcher import KeywordMatcher
+from src.metrics import metrics, profile
+from src.pipeline import harvest, harvest_keywords, sync_keywords
+from src.render import FORMATS
+from src.service import SearchService, serve
+from src.sync import IncrementalSync
+from src.throttling import TokenBucket
+from src.utils import display_vacancies, top_salary_vacancies
+from src.vacancy import Vacancy
+
+# Хранилища: название -> (класс обработчика, имя файла по умолчанию)
+BACKENDS = {
+    "json": (JSONFileHandler, "vacancies.json"),
+    "jsonl": (JSONLinesFileHandler, "vacancies.jsonl"),
+    "sqlite": (SQLiteFileHandler, "vacancies.db"),
+}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Парсер аргументов пакетного режима.
+    :return: Парсер argparse.
+    """
+    parser = argparse.ArgumentParser(
+        prog="main.py",
+        description="Пакетная выгрузка вакансий hh.ru по нескольким ключевым словам без интерактивных вопросов.",
+    )
+    parser.add_argument("keywords", nargs="*", help="Ключевые слова для поиска вакансий.")
+    parser.add_argument("-f", "--keywords-file",
+                        help="Файл с ключевыми словами, по одному в строке (# — комментарий).")
+    parser.add_argument("-p", "--pages", type=int, default=1, help="Количество страниц на ключевое слово.")
+    parser.add_argument("-t", "--top", type=int, default=0, help="Вывести топ-N вакансий по зарплате.")
+    parser.add_argument("--format", choices=list(FORMATS), default="text", dest="fmt",
+                        help="Формат вывода топа: подробный текст, таблица, JSON Lines или CSV.")
+    parser.add_argument("--filter", nargs="+", default=[], metavar="WORD",
+                        help="Сохранять только вакансии, в описании которых есть одно из слов.")
+    parser.add_argument("-b", "--backend", choices=sorted(BACKENDS), default="json", help="Хранилище вакансий.")
+    parser.add_argument("-o", "--output", help="Имя файла хранилища (по умолчанию зависит от хранилища).")
+    parser.add_argument("-w", "--workers", type=int, default=8, help="Количество одновременно обрабатываемых слов.")
+    parser.add_argument("--processes", type=int, default=1,
+                        help="Количество процессов для создания вакансий (больше 1 — разбор на нескольких ядрах).")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Запрашивать только вакансии, опубликованные после прошлого запуска (отметки в data).")
+    parser.add_argument("--rate", type=float, help="Ограничение частоты запросов к API (запросов в секунду).")
+    parser.add_argument("--no-cache", action="store_true", help="Не использовать дисковый кеш ответов API.")
+    parser.add_argument("--serve", action="store_true",
+                        help="Запустить HTTP-сервис поиска (/search?q=...&top=...&min_salary=...) "
+                             "вместо разовой выгрузки.")
+    parser.add_argument("--host", default="127.0.0.1", help="Адрес HTTP-сервиса.")
+    parser.add_argument("--port", type=int, default=8000, help="Порт HTTP-сервиса.")
+    parser.add_argument("--refresh-interval", type=float, default=3600.0,
+                        help="Период фонового обновления данных сервиса в секундах.")
+    parser.add_argument("--metrics", metavar="FILE",
+                        help="Сохранить метрики выгрузки (время этапов, запросы, кеш, байты) в JSON-файл.")
+    parser.add_argument("--profile", metavar="FILE", help="Сохранить профиль cProfile выгрузки в файл.")
+    parser.add_argument("--trace-memory", action="store_true",
+                        help="Отслеживать пиковое потребление памяти (tracemalloc; значение попадает в метрики).")
+    return parser
+
+
+def load_keywords(keywords: Iterable[str], keywords_file: Optional[str] = None) -> List[str]:
+    """
+    Сбор ключевых слов из аргументов и файла без повторов (без учета регистра и лишних пробелов).
+    :param keywords: Ключевые слова из командной строки.
+    :param keywords_file: Путь к файлу с ключевыми словами (необязательно).
+    :return: Список ключевых слов в порядке первого появления.
+    """
+    candidates = list(keywords)
+    if keywords_file:
+        with open(keywords_file, "r", encoding="utf-8") as file:
+            candidates.extend(line for line in file if not line.lstrip().startswith("#"))
+
+    unique: Dict[str, str] = {}
+    for keyword in candidates:
+        keyword = " ".join(keyword.split())
+        if keyword:
+            unique.setdefault(keyword.casefold(), keyword)
+    return list(unique.values())
+
+
+def make_handler(backend: str, output: Optional[str] = None) -> FileHandler:
+    """
+    Создание обработчика выбранного хранилища.
+    :param backend: Название хранилища: "json", "jsonl" или "sqlite".
+    :param output: Имя файла (None — имя по умолчанию для хранилища).
+    :return: Обработчик хранилища.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Неизвестное хранилище: {backend}. Допустимые: {', '.join(sorted(BACKENDS))}.")
+    handler_class, default_filename = BACKENDS[backend]
+    return handler_class(output or default_filename)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Точка входа пакетного режима.
+    :param argv: Аргументы командной строки (по умолчанию sys.argv[1:]).
+    :return: Код завершения: 0 — успех, 1 — часть слов не обработана, 2 — ошибка аргументов.
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.pages < 1 or args.workers < 1 or args.processes < 1 or args.top < 0:
+        parser.error("--pages, --workers и --processes должны быть положительными, --top — неотрицательным.")
+    try:
+        keywords = load_keywords(args.keywords, args.keywords_file)
+    except OSError as e:
+        parser.error(f"Не удалось прочитать файл ключевых слов: {e}")
+    if not keywords:
+        parser.error("Не заданы ключевые слова.")
+    if args.incremental and (args.serve or args.filter or args.processes > 1):
+        # Синхронизация сразу записывает новые вакансии в хранилище: отфильтровать или разобрать их иначе нельзя
+        parser.error("--incremental несовместим с --serve, --filter и --processes.")
+
+    rate_limiter = TokenBucket(args.rate) if args.rate else None
+    cache = None if args.no_cache else ResponseCache()
+    api = HeadHunterAPI(pool_size=args.workers, rate_limiter=rate_limiter, cache=cache)
+    # Профиль и метрики охватывают и разовую выгрузку, и работу сервиса до остановки
+    with profile(args.profile, args.trace_memory):
+        code = run_service(args, keywords, api) if args.serve else run_batch(args, keywords, api)
+    if args.metrics:
+        metrics.write_json(args.metrics)
+    return code
+
+
+def run_service(args: Namespace, keywords: List[str], api: HeadHunterAPI) -> int:
+    """
+    Работа HTTP-сервиса поиска до прерывания (Ctrl+C).
+    :param args: Разобранные аргументы командной строки.
+    :param keywords: Ключевые слова.
+    :param api: Клиент API hh.ru (закрывается после остановки сервиса).
+    :return: Код завершения 0.
+    """
+    handler = make_handler(args.backend, args.output)
+    try:
+        with api:
+            serve(SearchService(api, keywords, args.pages, args.workers, args.refresh_interval, handler),
+                  args.host, args.port)
+    finally:
+        if isinstance(handler, SQLiteFileHandler):
+            handler.close()
+    return 0
+
+
+def collect_vacancies(args: Namespace, keywords: List[str],
+                      api: HeadHunterAPI) -> Tuple[List[Vacancy], Dict[str, Exception]]:
+    """
+    Полная выгрузка вакансий по словам с фильтрацией по описанию.
+    :param args: Разобранные аргументы командной строки.
+    :param keywords: Ключевые слова.
+    :param api: Клиент API hh.ru (закрывается после выгрузки).
+    :return: Уникальные вакансии и ошибки по словам.
+    """
+    with api:
+        if args.processes > 1:
+            vacancies, errors = harvest(api, keywords, args.pages, args.workers, args.processes)
+        else:
+            vacancies, errors = harvest_keywords(api, keywords, args.pages, args.workers)
+
+    if args.filter:
+        matcher = KeywordMatcher(args.filter)
+        with metrics.timer("filter"):
+            vacancies = [vacancy for vacancy in vacancies if matcher.matches(vacancy.get_description())]
+    return vacancies, errors
+
+
+def run_batch(args: Namespace, keywords: List[str], api: HeadHunterAPI) -> int:
+    """
+    Разовая выгрузка: сбор вакансий по словам (полный или только новых), сохранение и вывод топа.
+    :param args: Разобранные аргументы командной строки.
+    :param keywords: Ключевые слова.
+    :param api: Клиент API hh.ru (закрывается после выгрузки).
+    :return: Код завершения: 0 — успех, 1 — часть слов не обработана.
+    """
+    handler = make_handler(args.backend, args.output)
+    try:
+        if args.incremental:
+            # Новые вакансии каждого слова записываются в хранилище вместе со сдвигом его отметки
+            with api:
+                vacancies, errors = sync_keywords(IncrementalSync(api, handler), keywords, args.pages, args.workers)
+        else:
+            vacancies, errors = collect_vacancies(args, keywords, api)
+            handler.add_many(vacancy.to_dict() for vacancy in vacancies)
+    finally:
+        if isinstance(handler, SQLiteFileHandler):
+            handler.close()
+
+    for keyword, error in errors.items():
+        print(f"Ошибка при обработке запроса '{keyword}': {error}", file=sys.stderr)
+    # Машиночитаемый вывод не смешивается со сводкой: она уходит в stderr
+    machine_readable = args.fmt in ("jsonl", "csv")
+    print(f"Обработано запросов: {len(keywords) - len(errors)} из {len(keywords)}, "
+          f"сохранено вакансий: {len(vacancies)} ({args.backend}).",
+          file=sys.stderr if machine_readable else sys.stdout)
+    if args.top:
+        try:
+            top_vacancies = top_salary_vacancies(vacancies, args.top)
+        except ValueError as e:
+            print(f"Не удалось составить топ по зарплате: {e}", file=sys.stderr)
+            return 1
+        if not machine_readable:
+            print("\nТоп вакансий по зарплате:")
+        display_vacancies(top_vacancies, fmt=args.fmt)
+    return 1 if errors else 0
@@ -0,0 +1,271 @@
+import heapq
+import math
+import sys
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+from src.currency import ExchangeRates
+from src.vacancy import Vacancy
+
+# Битовая маска отсутствующих значений зарплаты и признака gross
+_FROM_IS_NULL = 1
+_TO_IS_NULL = 2
+_GROSS = 4
+_NET = 8
+
+
+class _StringColumn:
+    """
+    Колонка строк, упакованных в общий буфер UTF-8 со смещениями:
+    вместо отдельного объекта str на каждую запись хранится один bytearray и массив смещений.
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._offsets = array("Q", [0])
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, idx: int) -> str:
+        return self._buffer[self._offsets[idx]:self._offsets[idx + 1]].decode("utf-8")
+
+    def append(self, value: str) -> None:
+        self._buffer += value.encode("utf-8")
+        self._offsets.append(len(self._buffer))
+
+    def nbytes(self) -> int:
+        return len(self._buffer) + self._offsets.itemsize * len(self._offsets)
+
+    def copy(self) -> "_StringColumn":
+        column = _StringColumn()
+        column._buffer = bytearray(self._buffer)
+        column._offsets = array("Q", self._offsets)
+        return column
+
+
+class VacancyCollection:
+    """
+    Колоночное хранилище вакансий для аналитики больших наборов.
+    Зарплаты хранятся в компактных массивах array с маской пропусков, средняя зарплата вычисляется
+    один раз при добавлении, названия интернируются, а ссылки и описания упакованы в буферы.
+    Сортировка и фильтрация работают по колонкам без вызова методов Vacancy,
+    объекты Vacancy создаются лениво только для запрошенных строк.
+    """
+
+    SALARY_KEYS = ("salary_from", "salary_to", "average")
+
+    def __init__(self, vacancies: Iterable[Vacancy] = ()):
+        """
+        Инициализация коллекции.
+        :param vacancies: Начальный набор вакансий.
+        """
+        self._titles: List[str] = []
+        self._urls = _StringColumn()
+        self._descriptions = _StringColumn()
+        self._salary_from = array("q")
+        self._salary_to = array("q")
+        self._average = array("d")  # NaN, если зарплата не указана
+        self._null_mask = bytearray()
+        self._currency_codes: List[str] = []  # Словарь валют: номер -> код
+        self._currency_ids: Dict[str, int] = {}
+        self._currencies = array("H")  # Номер валюты в словаре для каждой строки (до 65536 валют)
+        self.extend(vacancies)
+
+    @classmethod
+    def from_dicts(cls, records: Iterable[Dict]) -> "VacancyCollection":
+        """
+        Построение коллекции из сохраненных словарей (формат Vacancy.to_dict) без создания объектов Vacancy.
+        :param records: Словари с данными вакансий.
+        :return: Коллекция вакансий.
+        """
+        collection = cls()
+        for record in records:
+            collection._append(record["title"], record["url"], record.get("salary_from"),
+                               record.get("salary_to"), record["description"],
+                               record.get("currency") or Vacancy.DEFAULT_CURRENCY, record.get("gross"))
+        return collection
+
+    def __len__(self) -> int:
+        return len(self._titles)
+
+    def __getitem__(self, idx: int) -> Vacancy:
+        """
+        Ленивое создание объекта Vacancy для строки коллекции.
+        :param idx: Номер строки.
+        :return: Вакансия.
+        """
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError("Номер вакансии вне диапазона коллекции.")
+        mask = self._null_mask[idx]
+        # Данные прошли валидацию при добавлении, повторная проверка не нужна
+        return Vacancy.from_dict({
+            "title": self._titles[idx],
+            "url": self._urls[idx],
+            "salary_from": None if mask & _FROM_IS_NULL else self._salary_from[idx],
+            "salary_to": None if mask & _TO_IS_NULL else self._salary_to[idx],
+            "description": self._descriptions[idx],
+            "currency": self._currency_codes[self._currencies[idx]],
+            "gross": True if mask & _GROSS else False if mask & _NET else None,
+        }, trusted=True)
+
+    def __iter__(self) -> Iterator[Vacancy]:
+        for idx in range(len(self)):
+            yield self[idx]
+
+    def _append(self, title: str, url: str, salary_from: Optional[int], salary_to: Optional[int],
+                description: str, currency: str = Vacancy.DEFAULT_CURRENCY, gross: Optional[bool] = None) -> None:
+        """
+        Приватный метод добавления строки в колонки.
+        """
+        currency_id = self._currency_ids.get(currency)
+        if currency_id is None:
+            currency_id = self._currency_ids[currency] = len(self._currency_codes)
+            self._currency_codes.append(currency)
+        self._currencies.append(currency_id)
+        self._titles.append(sys.intern(title))
+        self._urls.append(url)
+        self._descriptions.append(description)
+        self._salary_from.append(salary_from if salary_from is not None else 0)
+        self._salary_to.append(salary_to if salary_to is not None else 0)
+        self._null_mask.append((_FROM_IS_NULL if salary_from is None else 0) |
+                               (_TO_IS_NULL if salary_to is None else 0) |
+                               (_GROSS if gross else _NET if gross is False else 0))
+        average = Vacancy.average_of(salary_from, salary_to)
+        self._average.append(math.nan if average is None else average)
+
+    def append(self, vacancy: Vacancy) -> None:
+        """
+        Добавление вакансии в коллекцию.
+        :param vacancy: Вакансия.
+        """
+        self._append(vacancy.get_title(), vacancy.get_url(), vacancy.get_salary_from(),
+                     vacancy.get_salary_to(), vacancy.get_description(), vacancy.get_currency(), vacancy.get_gross())
+
+    def extend(self, vacancies: Iterable[Vacancy]) -> None:
+        """
+        Добавление нескольких вакансий в коллекцию.
+        :param vacancies: Вакансии.
+        """
+        for vacancy in vacancies:
+            self.append(vacancy)
+
+    def nbytes(self) -> int:
+        """
+        Приблизительный объем памяти колонок (без учета общих интернированных названий).
+        :return: Размер в байтах.
+        """
+        columns = (self._salary_from, self._salary_to, self._average, self._currencies)
+        return (sum(column.itemsize * len(column) for column in columns) + len(self._null_mask)
+                + self._urls.nbytes() + self._descriptions.nbytes() + 8 * len(self._titles))
+
+    def normalized(self, rates: ExchangeRates, net: bool = True) -> "VacancyCollection":
+        """
+        Копия коллекции с зарплатами в базовой валюте таблицы курсов.
+        Множитель вычисляется один раз для каждой пары (валюта, gross), а затем применяется
+        ко всей колонке, поэтому при сравнении зарплат пересчет не выполняется.
+        :param rates: Таблица курсов.
+        :param net: Приводить зарплаты до вычета налогов к сумме на руки.
+        :return: Новая коллекция; строки сохраняют порядок и номера исходной.
+        """
+        gross_flags = _GROSS | _NET
+        factors = {}
+        for currency_id, code in enumerate(self._currency_codes):
+            for flags, gross in ((0, None), (_GROSS, True), (_NET, False)):
+                factors[currency_id, flags] = rates.factor(code, gross, net)
+        row_factors = [factors[currency_id, mask & gross_flags]
+                       for currency_id, mask in zip(self._currencies, self._null_mask)]
+
+        result = VacancyCollection()
+        result._titles = list(self._titles)
+        result._urls = self._urls.copy()
+        result._descriptions = self._descriptions.copy()
+        result._salary_from = array("q", (round(value * factor)
+                                          for value, factor in zip(self._salary_from, row_factors)))
+        result._salary_to = array("q", (round(value * factor) for value, factor in zip(self._salary_to, row_factors)))
+        result._average = array("d", (value * factor for value, factor in zip(self._average, row_factors)))
+        # После приведения к сумме на руки признак gross у всех указанных зарплат становится False
+        result._null_mask = bytearray(
+            (mask & ~gross_flags) | (_NET if net and mask & gross_flags else mask & gross_flags)
+            for mask in self._null_mask
+        )
+        result._currency_codes = [rates.base]
+        result._currency_ids = {rates.base: 0}
+        result._currencies = array("H", [0]) * len(self)
+        return result
+
+    def _sort_keys(self, key: str, nulls_last: bool) -> Sequence[float]:
+        """
+        Приватный метод получения колонки ключей сортировки по убыванию, в которой пропуски заменены
+        на -inf (в конце) или +inf (в начале). Колонка строится одним проходом цикла Python по массивам
+        (без векторных операций), зато без создания объектов Vacancy.
+        :param key: Ключ: "salary_from", "salary_to" или "average".
+        :param nulls_last: Располагать вакансии без зарплаты в конце.
+        :return: Колонка ключей.
+        """
+        if key not in self.SALARY_KEYS:
+            raise ValueError(f"Неизвестный ключ ранжирования: {key}. Допустимые: {', '.join(self.SALARY_KEYS)}.")
+        null = -math.inf if nulls_last else math.inf
+        if key == "average":
+            return array("d", (null if value != value else value for value in self._average))
+        column, flag = (self._salary_from, _FROM_IS_NULL) if key == "salary_from" else (self._salary_to, _TO_IS_NULL)
+        return array("d", (null if mask & flag else value for value, mask in zip(column, self._null_mask)))
+
+    def argsort(self, key: str = "average", descending: bool = True, nulls_last: bool = True) -> List[int]:
+        """
+        Номера строк в порядке сортировки по зарплате. Сравнения выполняются над числами колонки,
+        без вызова методов сравнения Vacancy; при равных значениях сохраняется порядок добавления.
+        :param key: Ключ: "salary_from", "salary_to" или "average".
+        :param descending: Сортировка по убыванию.
+        :param nulls_last: Располагать вакансии без зарплаты в конце.
+        :return: Список номеров строк.
+        """
+        keys = self._sort_keys(key, nulls_last if descending else not nulls_last)
+        return sorted(range(len(self)), key=keys.__getitem__, reverse=descending)
+
+    def filter_by_salary(self, min_salary: Optional[float] = None, max_salary: Optional[float] = None,
+                         key: str = "average") -> List[int]:
+        """
+        Номера строк, зарплата которых попадает в диапазон. Вакансии без зарплаты не попадают в результат.
+        Проверка — обычный проход Python по колонке ключей.
+        :param min_salary: Нижняя граница включительно (None — без ограничения).
+        :param max_salary: Верхняя граница включительно (None — без ограничения).
+        :param key: Ключ: "salary_from", "salary_to" или "average".
+        :return: Список номеров строк в порядке добавления.
+        """
+        low = -math.inf if min_salary is None else min_salary
+        high = math.inf if max_salary is None else max_salary
+        keys = self._sort_keys(key, nulls_last=True)
+        return [idx for idx, value in enumerate(keys) if value != -math.inf and low <= value <= high]
+
+    def top_n_indices(self, top_n: int, key: str = "average", nulls_last: bool = True) -> List[int]:
+        """
+        Номера строк топ-N по убыванию зарплаты: выбор кучей за O(n log k) по колонке ключей.
+        :param top_n: Количество вакансий.
+        :param key: Ключ: "salary_from", "salary_to" или "average".
+        :param nulls_last: Располагать вакансии без зарплаты в конце.
+        :return: Список номеров строк.
+        """
+        if top_n <= 0:
+            return []
+        keys = self._sort_keys(key, nulls_last)
+        return heapq.nlargest(top_n, range(len(self)), key=keys.__getitem__)
+
+    def top_n(self, top_n: int, key: str = "average", nulls_last: bool = True) -> List[Vacancy]:
+        """
+        Топ-N вакансий по убыванию зарплаты.
+        :param top_n: Количество вакансий.
+        :param key: Ключ: "salary_from", "salary_to" или "average".
+        :param nulls_last: Располагать вакансии без зарплаты в конце.
+        :return: Список вакансий.
+        """
+        return self.take(self.top_n_indices(top_n, key, nulls_last))
+
+    def take(self, indices: Iterable[int]) -> List[Vacancy]:
+        """
+        Создание объектов Vacancy для выбранных строк.
+        :param indices: Номера строк.
+        :return: Список вакансий.
+        """
+        return [self[idx] for idx in indices]
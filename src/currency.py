@@ -0,0 +1,92 @@
+import json
+import os
+from functools import lru_cache
+from typing import Dict, Optional
+
+# Таблица курсов по умолчанию (формат справочника валют hh.ru)
+DEFAULT_RATES_PATH = os.path.join("data", "currency_rates.json")
+
+
+class ExchangeRates:
+    """
+    Таблица курсов валют для приведения зарплат к базовой валюте.
+    Курс задается как в справочнике hh.ru: сколько единиц валюты стоит одна единица базовой,
+    поэтому сумма в базовой валюте равна сумме, деленной на курс.
+    """
+
+    def __init__(self, rates: Dict[str, float], base: str = "RUR", income_tax: float = 0.13):
+        """
+        Инициализация таблицы курсов.
+        :param rates: Курсы валют относительно базовой (код валюты -> курс).
+        :param base: Код базовой валюты.
+        :param income_tax: Ставка налога для перевода зарплаты до вычета налогов (gross) в сумму на руки.
+        """
+        if not 0 <= income_tax < 1:
+            raise ValueError("Ставка налога должна быть в диапазоне [0, 1).")
+        self._rates = {code.upper(): float(rate) for code, rate in rates.items()}
+        self._rates.setdefault(base.upper(), 1.0)
+        if any(rate <= 0 for rate in self._rates.values()):
+            raise ValueError("Курсы валют должны быть положительными числами.")
+        self.base = base.upper()
+        self.income_tax = income_tax
+
+    @classmethod
+    def from_file(cls, path: str = DEFAULT_RATES_PATH) -> "ExchangeRates":
+        """
+        Загрузка таблицы курсов из локального JSON-файла с кешированием:
+        файл перечитывается, только если он изменился.
+        :param path: Путь к файлу вида {"base": "RUR", "income_tax": 0.13, "rates": {"USD": 0.011, ...}}.
+        :return: Таблица курсов.
+        """
+        return _load_rates(os.path.abspath(path), os.path.getmtime(path))
+
+    def has_rate(self, currency: str) -> bool:
+        """
+        Проверяет, есть ли в таблице курс валюты.
+        :param currency: Код валюты.
+        :return: True, если сумму в этой валюте можно перевести в базовую.
+        """
+        return currency.upper() in self._rates
+
+    def factor(self, currency: str, gross: Optional[bool] = None, net: bool = True) -> float:
+        """
+        Множитель для перевода суммы в базовую валюту.
+        :param currency: Код валюты суммы.
+        :param gross: Сумма указана до вычета налогов (None — неизвестно, налог не учитывается).
+        :param net: Приводить суммы до вычета налогов к сумме на руки.
+        :return: Множитель.
+        """
+        rate = self._rates.get(currency.upper())
+        if rate is None:
+            raise ValueError(f"Нет курса для валюты {currency}.")
+        multiplier = 1.0 / rate
+        if net and gross:
+            multiplier *= 1.0 - self.income_tax
+        return multiplier
+
+    def convert(self, amount: Optional[int], currency: str, gross: Optional[bool] = None,
+                net: bool = True) -> Optional[int]:
+        """
+        Перевод одной суммы в базовую валюту.
+        :param amount: Сумма (None, если не указана).
+        :param currency: Код валюты суммы.
+        :param gross: Сумма указана до вычета налогов.
+        :param net: Приводить суммы до вычета налогов к сумме на руки.
+        :return: Сумма в базовой валюте, округленная до целого, или None.
+        """
+        if amount is None:
+            return None
+        return round(amount * self.factor(currency, gross, net))
+
+
+@lru_cache(maxsize=8)
+def _load_rates(path: str, mtime: float) -> ExchangeRates:
+    """
+    Чтение файла курсов; результат кешируется по пути и времени изменения файла.
+    :param path: Абсолютный путь к файлу.
+    :param mtime: Время изменения файла (часть ключа кеша).
+    :return: Таблица курсов.
+    """
+    with open(path, "r", encoding="utf-8") as file:
+        data = json.load(file)
+    return ExchangeRates(data["rates"], data.get("base", "RUR"), data.get("income_tax", 0.13))
@@ -1,7 +1,114 @@
+import itertools
 import os
 import json
+import sqlite3
+import stat
+import tempfile
+import threading
 from abc import ABC, abstractmethod
-from typing import List, Dict
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+from src.metrics import metrics
+from src.vacancy import Vacancy
+
+try:
+    import fcntl
+except ImportError:  # Windows: блокировка через msvcrt
+    fcntl = None
+    import msvcrt
+
+
+@contextmanager
+def file_lock(path: str) -> Iterator[None]:
+    """
+    Эксклюзивная рекомендательная блокировка файла между процессами.
+    Блокируется отдельный файл "<path>.lock", поэтому сам файл данных можно атомарно заменять.
+    :param path: Путь к защищаемому файлу.
+    """
+    with open(f"{path}.lock", "a+b") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        else:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _file_mode(path: str) -> int:
+    """
+    Права доступа для файла данных: права существующего файла или, для нового файла,
+    права по умолчанию с учетом umask (tempfile.mkstemp создает файл с правами 0600).
+    :param path: Путь к итоговому файлу.
+    :return: Права доступа.
+    """
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def atomic_write(path: str, write: Callable[[TextIO], None]) -> None:
+    """
+    Атомарная запись файла: данные пишутся во временный файл в той же папке,
+    сбрасываются на диск (fsync) и только затем заменяют исходный файл.
+    При сбое на любом этапе исходный файл остается нетронутым, права доступа файла сохраняются.
+    :param path: Путь к итоговому файлу.
+    :param write: Функция, записывающая содержимое в открытый текстовый файл.
+    """
+    directory = os.path.dirname(path) or "."
+    with metrics.timer("storage_write"):
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                write(file)
+                file.flush()
+                os.fsync(file.fileno())
+                metrics.inc("storage_bytes_written", os.fstat(file.fileno()).st_size)
+            os.chmod(tmp_path, _file_mode(path))
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        if hasattr(os, "O_DIRECTORY"):
+            # Фиксируем на диске и саму запись о переименовании в каталоге
+            dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+
+
+def _record_key(data: Dict) -> str:
+    """
+    Формирует устойчивый ключ записи для дедупликации.
+    Вакансии идентифицируются по идентификатору hh.ru из ссылки (или по самой ссылке),
+    записи без ссылки — по полному содержимому.
+    :param data: Словарь с данными.
+    :return: Ключ записи.
+    """
+    url = data.get("url")
+    if url:
+        return Vacancy.identity_of(url)
+    return json.dumps(data, sort_keys=True, ensure_ascii=False)
+
+
+def _matches(entry: Dict, criteria: Dict) -> bool:
+    """
+    Проверяет, удовлетворяет ли запись всем условиям критерия.
+    :param entry: Словарь с данными.
+    :param criteria: Словарь с критериями (например, {"title": "Python Developer"}).
+    :return: True, если все поля критерия совпадают.
+    """
+    return all(entry.get(k) == v for k, v in criteria.items())
 
 
 class FileHandler(ABC):
@@ -17,6 +124,14 @@ class FileHandler(ABC):
         """
         pass
 
+    def iter_data(self) -> Iterator[Dict]:
+        """
+        Потоковое чтение данных. Реализация по умолчанию загружает файл целиком;
+        наследники переопределяют метод, чтобы читать записи порциями в ограниченной памяти.
+        :return: Итератор словарей с данными.
+        """
+        return iter(self.get_data())
+
     @abstractmethod
     def add_data(self, data: Dict) -> None:
         """
@@ -25,6 +140,15 @@ class FileHandler(ABC):
         """
         pass
 
+    def add_many(self, data: Iterable[Dict]) -> None:
+        """
+        Пакетное добавление данных в файл. Реализация по умолчанию добавляет записи по одной;
+        наследники переопределяют метод, чтобы читать и записывать файл один раз на пакет.
+        :param data: Записи для добавления.
+        """
+        for entry in data:
+            self.add_data(entry)
+
     @abstractmethod
     def delete_data(self, criteria: Dict) -> None:
         """
@@ -54,21 +178,28 @@ class JSONFileHandler(FileHandler):
     def _read_file(self) -> List[Dict]:
         """
         Приватный метод чтения данных из JSON-файла.
+        Поврежденный файл не подменяется пустым списком, иначе следующая запись уничтожила бы все данные.
         :return: Список словарей с данными.
         """
         try:
-            with open(self._filename, "r", encoding="utf-8") as file:
-                return json.load(file)
-        except (FileNotFoundError, json.JSONDecodeError):
-            return []  # Возвращает пустой список, если файл не найден или поврежден
+            with metrics.timer("storage_read"), open(self._filename, "r", encoding="utf-8") as file:
+                content = file.read()
+                metrics.inc("storage_bytes_read", os.fstat(file.fileno()).st_size)
+        except FileNotFoundError:
+            return []  # Возвращает пустой список, если файл не найден
+        if not content.strip():
+            return []
+        try:
+            return json.loads(content)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Файл {self._filename} поврежден: {e}")
 
     def _write_file(self, data: List[Dict]) -> None:
         """
-        Приватный метод записи данных в JSON-файл.
+        Приватный метод атомарной записи данных в JSON-файл.
         :param data: Список словарей для записи.
         """
-        with open(self._filename, "w", encoding="utf-8") as file:
-            json.dump(data, file, ensure_ascii=False, indent=4)
+        atomic_write(self._filename, lambda file: json.dump(data, file, ensure_ascii=False, indent=4))
 
     def get_data(self) -> List[Dict]:
         """
@@ -82,22 +213,485 @@ class JSONFileHandler(FileHandler):
         Добавление данных в JSON-файл без создания дублирующих записей.
         :param data: Словарь с данными для добавления.
         """
-        all_data = self._read_file()
-        if data not in all_data:  # Проверка на дублирование данных
-            all_data.append(data)
-            self._write_file(all_data)
+        self.add_many([data])
+
+    def add_many(self, data: Iterable[Dict]) -> None:
+        """
+        Пакетное добавление с обновлением: файл читается и записывается один раз,
+        дубликаты ищутся по ключу записи (идентификатору вакансии) за O(1).
+        Запись с уже известным ключом заменяет сохраненную.
+        :param data: Записи для добавления.
+        """
+        with file_lock(self._filename):
+            all_data = self._read_file()
+            positions = {_record_key(entry): idx for idx, entry in enumerate(all_data)}
+            written = skipped = 0
+
+            for entry in data:
+                key = _record_key(entry)
+                idx = positions.get(key)
+                if idx is None:
+                    positions[key] = len(all_data)
+                    all_data.append(entry)
+                    written += 1
+                elif all_data[idx] != entry:
+                    all_data[idx] = entry
+                    written += 1
+                else:
+                    skipped += 1
+
+            if written:
+                self._write_file(all_data)
+        metrics.inc("storage_records_written", written)
+        metrics.inc("storage_records_skipped", skipped)
 
     def delete_data(self, criteria: Dict) -> None:
         """
         Удаление данных из JSON-файла по критерию.
         :param criteria: Словарь с критериями для удаления (например, {"title": "Python Developer"}).
         """
-        all_data = self._read_file()
-        filtered_data = [
-            entry for entry in all_data
-            if not all(entry.get(k) == v for k, v in criteria.items())
-        ]
-        self._write_file(filtered_data)
+        with file_lock(self._filename):
+            all_data = self._read_file()
+            filtered_data = [entry for entry in all_data if not _matches(entry, criteria)]
+            if len(filtered_data) != len(all_data):
+                self._write_file(filtered_data)
+
+
+class JSONLinesFileHandler(FileHandler):
+    """
+    Класс для работы с файлами в формате JSON Lines (одна запись на строку).
+    Добавление дописывает строки в конец файла (при чтении побеждает последняя строка с тем же ключом),
+    удаление записывает «надгробие» с критерием, а физическая очистка выполняется методом compact().
+    """
+
+    TOMBSTONE_KEY = "__deleted__"
+    _TOMBSTONE_PREFIX = '{"' + TOMBSTONE_KEY + '"'
+
+    def __init__(self, filename: str = "vacancies.jsonl"):
+        """
+        Инициализация экземпляра с именем файла.
+        :param filename: Имя файла (по умолчанию "vacancies.jsonl").
+        """
+        self._directory = "data"  # Папка для хранения файлов
+        self._filename = os.path.join(self._directory, filename)
+        self._index: Optional[Dict[str, Tuple[str, Optional[str]]]] = None  # Ключ -> (отпечаток, ссылка)
+        self._index_size = 0  # Размер файла, которому соответствует индекс
+
+        # Создаем папку data, если ее нет
+        if not os.path.exists(self._directory):
+            os.makedirs(self._directory)
+
+    @classmethod
+    def from_json_file(cls, source: str, filename: str = "vacancies.jsonl") -> "JSONLinesFileHandler":
+        """
+        Миграция из формата JSONFileHandler (один JSON-массив) в JSON Lines.
+        :param source: Путь к исходному JSON-файлу (например, data/vacancies.json).
+        :param filename: Имя нового файла JSON Lines.
+        :return: Обработчик нового файла с перенесенными записями.
+        """
+        with open(source, "r", encoding="utf-8") as file:
+            records = json.load(file)
+        handler = cls(filename)
+        handler.add_many(records)
+        return handler
+
+    def _scan(self, file: TextIO) -> Tuple[Dict[str, Tuple[int, Optional[str]]], List[Tuple[int, Dict]], int]:
+        """
+        Приватный метод первого прохода по файлу: для каждого ключа запоминается номер последней строки
+        и ссылка, а не сами записи, поэтому память зависит от числа ключей, а не от объема данных.
+        Надгробие по ссылке (так обновления записывались раньше) снимается по ключу за O(1),
+        остальные надгробия проверяются на втором проходе.
+        :param file: Открытый файл.
+        :return: Ключ -> (номер последней строки, ссылка), надгробия с произвольным критерием
+                 в виде (номер строки, критерий) и число прочитанных строк.
+        """
+        latest: Dict[str, Tuple[int, Optional[str]]] = {}
+        tombstones: List[Tuple[int, Dict]] = []
+        line_no = -1
+        for line_no, line in enumerate(file):
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # Недописанная строка после сбоя
+            if not line.startswith(self._TOMBSTONE_PREFIX):
+                latest[_record_key(entry)] = (line_no, entry.get("url"))
+                continue
+            criteria = entry[self.TOMBSTONE_KEY]
+            if set(criteria) != {"url"}:
+                tombstones.append((line_no, criteria))
+            elif criteria["url"]:
+                key = Vacancy.identity_of(criteria["url"])
+                if latest.get(key, (None, None))[1] == criteria["url"]:
+                    del latest[key]
+        return latest, tombstones, line_no + 1
+
+    def iter_data(self) -> Iterator[Dict]:
+        """
+        Потоковое чтение актуальных записей в два прохода по одному открытому файлу: первый находит
+        последнюю строку каждого ключа, второй читает построчно и отдает только эти строки,
+        пропуская записи, удаленные более поздними надгробиями. Память не зависит от объема записей.
+        Файл открывается один раз, поэтому одновременное сжатие (замена файла) не смешивает
+        строки старой и новой версии.
+        :return: Итератор словарей с данными в порядке последнего изменения.
+        """
+        try:
+            with open(self._filename, "r", encoding="utf-8") as file:
+                metrics.inc("storage_bytes_read", os.fstat(file.fileno()).st_size)
+                latest, tombstones, line_count = self._scan(file)
+                if not latest:
+                    return
+                live_lines = {line_no for line_no, _ in latest.values()}
+                file.seek(0)
+                for line_no, line in enumerate(file):
+                    if line_no >= line_count:
+                        break  # Строки, дописанные после первого прохода, в этот снимок не входят
+                    if line_no not in live_lines:
+                        continue
+                    entry = json.loads(line)
+                    if not any(deleted_at > line_no and _matches(entry, criteria)
+                               for deleted_at, criteria in tombstones):
+                        yield entry
+        except FileNotFoundError:
+            return
+
+    def get_data(self) -> List[Dict]:
+        """
+        Получение всех данных из файла.
+        :return: Список словарей с данными.
+        """
+        return list(self.iter_data())
+
+    def _get_index(self) -> Dict[str, Tuple[str, Optional[str]]]:
+        """
+        Приватный метод получения индекса ключей (вызывается под блокировкой файла).
+        Индекс строится одним проходом по файлу и перестраивается, только если файл
+        изменил другой процесс (размер файла отличается от запомненного).
+        :return: Словарь ключ записи -> (отпечаток содержимого, сохраненная ссылка).
+        """
+        size = self._file_size()
+        if self._index is None or size != self._index_size:
+            self._index = {_record_key(entry): (Vacancy.fingerprint_of(entry), entry.get("url"))
+                           for entry in self.iter_data()}
+            self._index_size = size
+        return self._index
+
+    def _file_size(self) -> int:
+        """
+        Приватный метод получения размера файла.
+        :return: Размер файла в байтах (0, если файла нет).
+        """
+        try:
+            return os.path.getsize(self._filename)
+        except FileNotFoundError:
+            return 0
+
+    def _append_lines(self, lines: List[str]) -> None:
+        """
+        Приватный метод дописывания строк в конец файла (вызывается под блокировкой файла).
+        Если последняя строка файла недописана (сбой при записи), она отделяется переводом строки.
+        :param lines: Строки для добавления (без перевода строки).
+        """
+        if not lines:
+            return
+        prefix = ""
+        try:
+            with open(self._filename, "rb") as file:
+                file.seek(0, os.SEEK_END)
+                if file.tell() > 0:
+                    file.seek(-1, os.SEEK_END)
+                    if file.read(1) != b"\n":
+                        prefix = "\n"
+        except FileNotFoundError:
+            pass
+        with metrics.timer("storage_write"), open(self._filename, "a", encoding="utf-8") as file:
+            size = os.fstat(file.fileno()).st_size
+            file.write(prefix + "\n".join(lines) + "\n")
+            file.flush()
+            os.fsync(file.fileno())
+            metrics.inc("storage_bytes_written", os.fstat(file.fileno()).st_size - size)
+
+    def add_data(self, data: Dict) -> None:
+        """
+        Добавление данных в конец файла без создания дублирующих записей.
+        :param data: Словарь с данными для добавления.
+        """
+        self.add_many([data])
+
+    def add_many(self, data: Iterable[Dict]) -> None:
+        """
+        Пакетное добавление с обновлением: новые и измененные записи дописываются в конец файла,
+        новая строка с известным идентификатором заменяет прежнюю при чтении.
+        Изменение определяется сравнением отпечатков содержимого.
+        :param data: Записи для добавления.
+        """
+        with file_lock(self._filename):
+            index = self._get_index()
+            lines = []
+            written = skipped = 0
+            for entry in data:
+                key = _record_key(entry)
+                fingerprint = Vacancy.fingerprint_of(entry)
+                previous = index.get(key)
+                if previous is not None and previous[0] == fingerprint:
+                    skipped += 1
+                    continue
+                lines.append(json.dumps(entry, ensure_ascii=False))
+                index[key] = (fingerprint, entry.get("url"))
+                written += 1
+            self._append_lines(lines)
+            self._index_size = self._file_size()
+        metrics.inc("storage_records_written", written)
+        metrics.inc("storage_records_skipped", skipped)
+
+    def delete_data(self, criteria: Dict) -> None:
+        """
+        Удаление данных по критерию: в файл дописывается надгробие, сами записи удаляются при compact().
+        :param criteria: Словарь с критериями для удаления (например, {"title": "Python Developer"}).
+        """
+        with file_lock(self._filename):
+            self._append_lines([json.dumps({self.TOMBSTONE_KEY: criteria}, ensure_ascii=False)])
+        self._index = None  # Какие ключи удалены, станет известно при следующем чтении
+
+    def compact(self) -> None:
+        """
+        Сжатие файла: переписывает только актуальные записи, убирая надгробия и удаленные строки.
+        Новый файл сначала пишется во временный, затем атомарно заменяет старый.
+        """
+        if not os.path.exists(self._filename):
+            return
+        with file_lock(self._filename):
+            records = self.iter_data()
+            atomic_write(
+                self._filename,
+                lambda file: file.writelines(json.dumps(entry, ensure_ascii=False) + "\n" for entry in records),
+            )
+
+
+class SQLiteFileHandler(FileHandler):
+    """
+    Класс для хранения вакансий в базе SQLite.
+    Записи уникальны по идентификатору вакансии, ссылка проиндексирована уникальным индексом,
+    зарплаты — обычными индексами, поэтому поиск, фильтрация по зарплате и выбор топа выполняются на стороне базы.
+    """
+
+    _COLUMNS = ("url", "title", "salary_from", "salary_to")
+    _SALARY_KEYS = {
+        "salary_from": "salary_from",
+        "salary_to": "salary_to",
+        "average": "(COALESCE(salary_from, salary_to) + COALESCE(salary_to, salary_from)) / 2.0",
+    }
+    _SCHEMA_VERSION = 1  # Версия схемы в PRAGMA user_version: 1 — ключи по идентификаторам вакансий
+
+    def __init__(self, filename: str = "vacancies.db"):
+        """
+        Инициализация экземпляра с именем файла базы данных.
+        :param filename: Имя файла (по умолчанию "vacancies.db").
+        """
+        self._directory = "data"  # Папка для хранения файлов
+        self._filename = os.path.join(self._directory, filename)
+
+        # Создаем папку data, если ее нет
+        if not os.path.exists(self._directory):
+            os.makedirs(self._directory)
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self._filename, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        with self._connection:
+            self._connection.executescript("""
+                CREATE TABLE IF NOT EXISTS vacancies (
+                    id INTEGER PRIMARY KEY,
+                    key TEXT NOT NULL UNIQUE,
+                    url TEXT,
+                    title TEXT,
+                    salary_from INTEGER,
+                    salary_to INTEGER,
+                    data TEXT NOT NULL
+                );
+                CREATE UNIQUE INDEX IF NOT EXISTS idx_vacancies_url ON vacancies (url);
+                CREATE INDEX IF NOT EXISTS idx_vacancies_salary_from ON vacancies (salary_from);
+                CREATE INDEX IF NOT EXISTS idx_vacancies_salary_to ON vacancies (salary_to);
+            """)
+            if self._connection.execute("PRAGMA user_version").fetchone()[0] < self._SCHEMA_VERSION:
+                self._migrate_keys()
+                self._connection.execute(f"PRAGMA user_version = {self._SCHEMA_VERSION}")
+
+    def _migrate_keys(self) -> None:
+        """
+        Приватный метод перевода ключей старых баз (ссылка) на идентификаторы вакансий.
+        Выполняется один раз: после него база получает версию схемы _SCHEMA_VERSION.
+        Если одна вакансия сохранена под разными ссылками, остается последняя добавленная запись.
+        """
+        rows = self._connection.execute("SELECT id, key, url FROM vacancies WHERE key = url ORDER BY id").fetchall()
+        for row_id, key, url in rows:
+            new_key = Vacancy.identity_of(url)
+            if new_key == key:
+                continue
+            existing = self._connection.execute("SELECT id FROM vacancies WHERE key = ?", (new_key,)).fetchone()
+            if existing is not None and existing[0] > row_id:
+                self._connection.execute("DELETE FROM vacancies WHERE id = ?", (row_id,))
+                continue
+            if existing is not None:
+                self._connection.execute("DELETE FROM vacancies WHERE id = ?", existing)
+            self._connection.execute("UPDATE vacancies SET key = ? WHERE id = ?", (new_key, row_id))
+
+    def __enter__(self) -> "SQLiteFileHandler":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Закрывает соединение с базой данных.
+        """
+        self._connection.close()
+
+    def _query(self, sql: str, params: tuple = ()) -> List[Dict]:
+        """
+        Приватный метод выполнения запроса, возвращающего записи.
+        :param sql: SQL-запрос, выбирающий колонку data.
+        :param params: Параметры запроса.
+        :return: Список словарей с данными.
+        """
+        with metrics.timer("storage_read"), self._lock:
+            rows = self._connection.execute(sql, params).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def get_data(self) -> List[Dict]:
+        """
+        Получение всех данных из базы в порядке добавления.
+        :return: Список словарей с данными.
+        """
+        return self._query("SELECT data FROM vacancies ORDER BY id")
+
+    def iter_data(self, batch_size: int = 1000) -> Iterator[Dict]:
+        """
+        Потоковое чтение записей порциями по первичному ключу: в памяти находится не больше одной порции,
+        а блокировка соединения не удерживается между порциями.
+        :param batch_size: Размер порции.
+        :return: Итератор словарей с данными в порядке добавления.
+        """
+        last_id = 0
+        while True:
+            with self._lock:
+                rows = self._connection.execute(
+                    "SELECT id, data FROM vacancies WHERE id > ? ORDER BY id LIMIT ?", (last_id, batch_size)
+                ).fetchall()
+            if not rows:
+                return
+            for _, data in rows:
+                yield json.loads(data)
+            last_id = rows[-1][0]
+
+    def add_data(self, data: Dict) -> None:
+        """
+        Добавление данных в базу без создания дублирующих записей.
+        :param data: Словарь с данными для добавления.
+        """
+        self.add_many([data])
+
+    def add_many(self, data: Iterable[Dict]) -> None:
+        """
+        Пакетное добавление с обновлением в одной транзакции.
+        Запись с уже известным ключом (идентификатором вакансии) обновляется, только если ее содержимое изменилось.
+        :param data: Записи для добавления.
+        """
+        # zip берет запись раньше счетчика, поэтому после прохода счетчик равен числу записей
+        counter = itertools.count()
+        rows = (
+            (
+                _record_key(entry),
+                entry.get("url"),
+                entry.get("title"),
+                entry.get("salary_from"),
+                entry.get("salary_to"),
+                json.dumps(entry, ensure_ascii=False),
+            )
+            for entry, _ in zip(data, counter)
+        )
+        with metrics.timer("storage_write"), self._lock, self._connection:
+            cursor = self._connection.executemany(
+                """
+                INSERT INTO vacancies (key, url, title, salary_from, salary_to, data)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (key) DO UPDATE SET
+                    url = excluded.url,
+                    title = excluded.title,
+                    salary_from = excluded.salary_from,
+                    salary_to = excluded.salary_to,
+                    data = excluded.data
+                WHERE data != excluded.data
+                """,
+                rows,
+            )
+        # Неизмененные записи не попадают в rowcount: условие WHERE отменяет их обновление
+        metrics.inc("storage_records_written", cursor.rowcount)
+        metrics.inc("storage_records_skipped", next(counter) - cursor.rowcount)
+
+    def delete_data(self, criteria: Dict) -> None:
+        """
+        Удаление данных по критерию.
+        Критерии по проиндексированным колонкам выполняются одним SQL-запросом,
+        остальные — проверкой сохраненных записей.
+        :param criteria: Словарь с критериями для удаления (например, {"title": "Python Developer"}).
+        """
+        with self._lock, self._connection:
+            if set(criteria) <= set(self._COLUMNS):
+                conditions = " AND ".join(
+                    f"{column} IS NULL" if value is None else f"{column} = ?" for column, value in criteria.items()
+                )
+                params = tuple(value for value in criteria.values() if value is not None)
+                self._connection.execute(f"DELETE FROM vacancies WHERE {conditions or '1'}", params)
+                return
+
+            rows = self._connection.execute("SELECT id, data FROM vacancies").fetchall()
+            ids = [(row_id,) for row_id, data in rows if _matches(json.loads(data), criteria)]
+            self._connection.executemany("DELETE FROM vacancies WHERE id = ?", ids)
+
+    def get_by_url(self, url: str) -> Optional[Dict]:
+        """
+        Поиск вакансии по ссылке через уникальный индекс.
+        :param url: Ссылка на вакансию.
+        :return: Словарь с данными или None.
+        """
+        found = self._query("SELECT data FROM vacancies WHERE url = ?", (url,))
+        return found[0] if found else None
+
+    def get_by_salary(self, min_salary: Optional[int] = None, max_salary: Optional[int] = None) -> List[Dict]:
+        """
+        Фильтрация вакансий по диапазону зарплаты на стороне базы.
+        :param min_salary: Нижняя граница: salary_from не меньше указанной (None — без ограничения).
+        :param max_salary: Верхняя граница: salary_to не больше указанной (None — без ограничения).
+        :return: Список словарей с данными.
+        """
+        conditions, params = [], []
+        if min_salary is not None:
+            conditions.append("salary_from >= ?")
+            params.append(min_salary)
+        if max_salary is not None:
+            conditions.append("salary_to <= ?")
+            params.append(max_salary)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        return self._query(f"SELECT data FROM vacancies {where} ORDER BY id", tuple(params))
+
+    def get_top_by_salary(self, top_n: int, key: str = "salary_from") -> List[Dict]:
+        """
+        Выбор топ-N вакансий по зарплате на стороне базы. Вакансии без зарплаты не учитываются.
+        :param top_n: Количество вакансий.
+        :param key: Ключ сортировки: "salary_from", "salary_to" или "average".
+        :return: Список словарей с данными, упорядоченный по убыванию зарплаты.
+        """
+        if key not in self._SALARY_KEYS:
+            raise ValueError(f"Неизвестный ключ сортировки: {key}. Допустимые: {', '.join(self._SALARY_KEYS)}.")
+        expression = self._SALARY_KEYS[key]
+        return self._query(
+            f"SELECT data FROM vacancies WHERE {expression} IS NOT NULL ORDER BY {expression} DESC, id LIMIT ?",
+            (top_n,),
+        )
 
 
 # Пример использования
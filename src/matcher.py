@@ -0,0 +1,121 @@
+from collections import deque
+from typing import Dict, Iterable, List, Set
+
+
+def _normalize(text: str) -> str:
+    """
+    Приводит текст к нижнему регистру; буква "ё" приравнивается к "е".
+    :param text: Исходный текст.
+    :return: Нормализованный текст.
+    """
+    return text.casefold().replace("ё", "е")
+
+
+class KeywordMatcher:
+    """
+    Поиск множества ключевых слов в тексте за один проход (алгоритм Ахо — Корасик).
+    Автомат строится один раз по списку слов; время поиска зависит от длины текста,
+    а не от произведения длины текста на количество слов. Поиск ведется по подстрокам
+    без учета регистра, как и проверка `word.lower() in text.lower()`.
+    """
+
+    def __init__(self, words: Iterable[str]):
+        """
+        Построение автомата по ключевым словам.
+        :param words: Ключевые слова (пустые строки игнорируются).
+        """
+        self._words: List[str] = []
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Set[int]] = [set()]
+
+        for word in words:
+            pattern = _normalize(word)
+            if pattern and word not in self._words:
+                self._add_pattern(pattern, len(self._words))
+                self._words.append(word)
+        self._build_fail_links()
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    def _add_pattern(self, pattern: str, word_id: int) -> None:
+        """
+        Приватный метод добавления слова в бор.
+        :param pattern: Нормализованное слово.
+        :param word_id: Номер исходного слова.
+        """
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(set())
+            state = next_state
+        self._output[state].add(word_id)
+
+    def _build_fail_links(self) -> None:
+        """
+        Приватный метод построения суффиксных ссылок обходом бора в ширину.
+        Выходы состояния дополняются выходами его суффиксной ссылки.
+        """
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                self._output[next_state] |= self._output[self._fail[next_state]]
+
+    def _scan(self, text: str) -> Iterable[Set[int]]:
+        """
+        Приватный генератор выходов автомата при проходе по тексту.
+        :param text: Текст для поиска.
+        :return: Множества номеров слов, оканчивающихся в очередной позиции.
+        """
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for char in _normalize(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                yield output[state]
+
+    def find(self, text: str) -> Set[str]:
+        """
+        Поиск всех ключевых слов, встречающихся в тексте.
+        :param text: Текст для поиска.
+        :return: Множество найденных слов (в исходном написании).
+        """
+        found: Set[int] = set()
+        for word_ids in self._scan(text):
+            found |= word_ids
+        return {self._words[word_id] for word_id in found}
+
+    def count(self, text: str) -> Dict[str, int]:
+        """
+        Подсчет вхождений каждого ключевого слова в тексте (для оценки релевантности).
+        :param text: Текст для поиска.
+        :return: Словарь слово -> количество вхождений (только найденные слова).
+        """
+        counts: Dict[str, int] = {}
+        for word_ids in self._scan(text):
+            for word_id in word_ids:
+                word = self._words[word_id]
+                counts[word] = counts.get(word, 0) + 1
+        return counts
+
+    def matches(self, text: str) -> bool:
+        """
+        Проверка, встречается ли в тексте хотя бы одно ключевое слово (поиск останавливается на первом).
+        :param text: Текст для поиска.
+        :return: True, если найдено хотя бы одно слово.
+        """
+        return next(iter(self._scan(text)), None) is not None
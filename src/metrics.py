@@ -0,0 +1,205 @@
+import cProfile
+import functools
+import json
+import pstats
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional
+
+# Префикс имен метрик в текстовом формате Prometheus
+PROMETHEUS_PREFIX = "vacancies"
+
+
+class Metrics:
+    """
+    Потокобезопасный реестр метрик: счетчики (запросы, повторы, попадания в кеш, байты, записи),
+    таймеры этапов (количество, суммарное и максимальное время) и мгновенные значения.
+    Каждое обновление — одна короткая операция под блокировкой, поэтому метрики собираются всегда,
+    а выгружаются по запросу: в JSON-файл или в текстовом формате Prometheus.
+    """
+
+    def __init__(self):
+        """
+        Инициализация пустого реестра.
+        """
+        self._lock = threading.Lock()
+        self._counters: Dict[str, float] = {}
+        self._timers: Dict[str, list] = {}
+        self._gauges: Dict[str, float] = {}
+
+    def inc(self, name: str, value: float = 1) -> None:
+        """
+        Увеличение счетчика.
+        :param name: Имя счетчика (например, "api_requests").
+        :param value: Величина увеличения.
+        """
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def set_gauge(self, name: str, value: float) -> None:
+        """
+        Установка мгновенного значения (например, пикового объема памяти).
+        :param name: Имя значения.
+        :param value: Значение.
+        """
+        with self._lock:
+            self._gauges[name] = value
+
+    def observe(self, name: str, seconds: float) -> None:
+        """
+        Учет длительности одного выполнения этапа.
+        :param name: Имя этапа (например, "api_request").
+        :param seconds: Длительность в секундах.
+        """
+        with self._lock:
+            timer = self._timers.get(name)
+            if timer is None:
+                self._timers[name] = [1, seconds, seconds]
+            else:
+                timer[0] += 1
+                timer[1] += seconds
+                timer[2] = max(timer[2], seconds)
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        """
+        Замер длительности блока кода как этапа с заданным именем (учитывается и при исключении).
+        :param name: Имя этапа.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+
+    def timed(self, name: str) -> Callable:
+        """
+        Декоратор замера длительности каждого вызова функции.
+        :param name: Имя этапа.
+        :return: Декоратор.
+        """
+        def decorator(func: Callable) -> Callable:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.timer(name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def get_counter(self, name: str) -> float:
+        """
+        Текущее значение счетчика.
+        :param name: Имя счетчика.
+        :return: Значение (0, если счетчик еще не увеличивался).
+        """
+        with self._lock:
+            return self._counters.get(name, 0)
+
+    def to_dict(self) -> Dict:
+        """
+        Снимок всех метрик.
+        :return: Словарь с разделами counters, timers (count, total_seconds, max_seconds) и gauges.
+        """
+        with self._lock:
+            return {
+                "counters": dict(self._counters),
+                "timers": {
+                    name: {"count": count, "total_seconds": total, "max_seconds": maximum}
+                    for name, (count, total, maximum) in self._timers.items()
+                },
+                "gauges": dict(self._gauges),
+            }
+
+    def reset(self) -> None:
+        """
+        Сброс всех метрик.
+        """
+        with self._lock:
+            self._counters.clear()
+            self._timers.clear()
+            self._gauges.clear()
+
+    def write_json(self, path: str) -> None:
+        """
+        Выгрузка снимка метрик в JSON-файл.
+        :param path: Путь к файлу.
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.to_dict(), file, ensure_ascii=False, indent=4)
+
+    def to_prometheus(self, prefix: str = PROMETHEUS_PREFIX) -> str:
+        """
+        Метрики в текстовом формате Prometheus: счетчики с суффиксом _total,
+        таймеры — как summary (_seconds_count и _seconds_sum) с отдельным максимумом.
+        :param prefix: Префикс имен метрик.
+        :return: Текст для ответа на запрос /metrics.
+        """
+        snapshot = self.to_dict()
+        lines = []
+        for name, value in sorted(snapshot["counters"].items()):
+            lines += [f"# TYPE {prefix}_{name}_total counter", f"{prefix}_{name}_total {value}"]
+        for name, timer in sorted(snapshot["timers"].items()):
+            metric = f"{prefix}_{name}_seconds"
+            lines += [
+                f"# TYPE {metric} summary",
+                f"{metric}_count {timer['count']}",
+                f"{metric}_sum {timer['total_seconds']}",
+                f"# TYPE {metric}_max gauge",
+                f"{metric}_max {timer['max_seconds']}",
+            ]
+        for name, value in sorted(snapshot["gauges"].items()):
+            lines += [f"# TYPE {prefix}_{name} gauge", f"{prefix}_{name} {value}"]
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+# Общий реестр, в который пишут клиент API, хранилища и функции обработки
+metrics = Metrics()
+
+
+@contextmanager
+def profile(cprofile_path: Optional[str] = None, trace_memory: bool = False,
+            registry: Optional[Metrics] = None) -> Iterator[None]:
+    """
+    Необязательное профилирование блока кода. Выключенное профилирование ничего не стоит:
+    cProfile и tracemalloc замедляют выполнение в разы, поэтому включаются только явно.
+    cProfile видит только поток, в котором включен, поэтому каждый поток, запущенный внутри блока
+    (пулы выгрузки, обработчики запросов и фоновое обновление сервиса), получает свой профилировщик,
+    а в файл записывается их общая статистика.
+    :param cprofile_path: Путь для статистики cProfile (смотреть через python -m pstats или snakeviz).
+    :param trace_memory: Отслеживать выделения памяти через tracemalloc; пиковый и итоговый объем
+    записываются в значения tracemalloc_peak_bytes и tracemalloc_current_bytes.
+    :param registry: Реестр метрик (по умолчанию общий).
+    """
+    registry = registry if registry is not None else metrics
+    profilers: List[cProfile.Profile] = []
+    profilers_lock = threading.Lock()
+
+    def start_profiler(*_) -> None:
+        # Для нового потока вызывается первым событием профилирования и заменяет себя профилировщиком потока
+        profiler = cProfile.Profile()
+        with profilers_lock:
+            profilers.append(profiler)
+        profiler.enable()
+
+    started_tracing = trace_memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    if cprofile_path:
+        start_profiler()
+        threading.setprofile(start_profiler)
+    try:
+        yield
+    finally:
+        if cprofile_path:
+            threading.setprofile(None)
+            with profilers_lock:
+                stats = pstats.Stats(*profilers)
+            stats.dump_stats(cprofile_path)
+        if trace_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            registry.set_gauge("tracemalloc_current_bytes", current)
+            registry.set_gauge("tracemalloc_peak_bytes", peak)
+        if started_tracing:
+            tracemalloc.stop()
@@ -0,0 +1,196 @@
+import json
+import math
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import nullcontext
+from itertools import chain
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+from src.api import HeadHunterAPI
+from src.file_handler import FileHandler
+from src.metrics import metrics
+from src.sync import IncrementalSync
+from src.vacancy import Vacancy
+
+# Целевой объем данных на одну задачу пула: меньшие пакеты тратят время на пересылку между процессами
+TARGET_CHUNK_BYTES = 1 << 20
+
+
+def _parse_page(page: Union[bytes, str, dict]) -> Tuple[Optional[int], List[Vacancy]]:
+    """
+    Разбор одной страницы ответа API hh.ru: в рабочем процессе — из тела ответа (JSON),
+    в текущем — из записи кеша, которая уже разобрана.
+    :param page: Тело ответа API или разобранная страница.
+    :return: Пара (число страниц по данным API или None, вакансии страницы).
+    """
+    data = page if isinstance(page, dict) else json.loads(page)
+    return data.get("pages"), Vacancy.from_hh_items(data.get("items", []))
+
+
+def choose_chunksize(raw_pages: Sequence[Union[bytes, str]], workers: int) -> int:
+    """
+    Подбор размера пакета страниц для одной задачи пула по среднему размеру страницы:
+    пакет около TARGET_CHUNK_BYTES, но так, чтобы работа досталась всем процессам.
+    :param raw_pages: Страницы для разбора.
+    :param workers: Количество процессов.
+    :return: Размер пакета (не меньше 1).
+    """
+    if not raw_pages:
+        return 1
+    average_size = max(1, sum(len(page) for page in raw_pages) // len(raw_pages))
+    by_size = max(1, TARGET_CHUNK_BYTES // average_size)
+    by_workers = max(1, math.ceil(len(raw_pages) / workers))
+    return min(by_size, by_workers)
+
+
+def _parse_batch(pages: List[Union[bytes, dict]], executor: Optional[Executor], workers: int) -> List[Vacancy]:
+    """
+    Разбор страниц с сохранением порядка: тела ответов разбираются в пуле процессов пакетами
+    по choose_chunksize, а записи кеша — в текущем потоке (они уже разобраны, и пересылка словаря
+    в процесс обошлась бы дороже создания вакансий).
+    :param pages: Тела ответов API и записи кеша.
+    :param executor: Пул процессов или None для разбора в текущем потоке.
+    :param workers: Количество процессов пула.
+    :return: Вакансии в порядке страниц.
+    """
+    parsed: Dict[int, List[Vacancy]] = {}
+    raw = [idx for idx, page in enumerate(pages) if not isinstance(page, dict)]
+    if executor is not None and raw:
+        raw_pages = [pages[idx] for idx in raw]
+        chunksize = choose_chunksize(raw_pages, workers)
+        for idx, (_, vacancies) in zip(raw, executor.map(_parse_page, raw_pages, chunksize=chunksize)):
+            parsed[idx] = vacancies
+
+    vacancies: List[Vacancy] = []
+    for idx, page in enumerate(pages):
+        vacancies.extend(parsed[idx] if idx in parsed else _parse_page(page)[1])
+    return vacancies
+
+
+def _resolve_workers(max_workers: Optional[int]) -> int:
+    """
+    Количество процессов: None — число ядер, иначе явно заданное положительное число.
+    :param max_workers: Запрошенное количество процессов.
+    :return: Количество процессов.
+    """
+    workers = max_workers if max_workers is not None else os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("Количество процессов должно быть положительным числом.")
+    return workers
+
+
+def _dedupe(vacancies: Iterable[Vacancy]) -> List[Vacancy]:
+    """
+    Объединение вакансий нескольких выгрузок: вакансия, найденная несколько раз, попадает в результат один раз.
+    :param vacancies: Вакансии всех выгрузок.
+    :return: Уникальные вакансии в порядке первого появления.
+    """
+    unique: Dict[str, Vacancy] = {}
+    found = 0
+    for vacancy in vacancies:
+        found += 1
+        unique.setdefault(vacancy.identity(), vacancy)
+    metrics.inc("records_deduped", found - len(unique))
+    return list(unique.values())
+
+
+def _fetch_keywords(keywords: Sequence[str], fetch: Callable[[str], List[Vacancy]],
+                    workers: int) -> Tuple[List[Vacancy], Dict[str, Exception]]:
+    """
+    Общий цикл выгрузки по ключевым словам: слова обрабатываются в пуле потоков,
+    ошибка по одному слову не прерывает выгрузку остальных, а вакансия,
+    найденная по нескольким словам, попадает в результат один раз.
+    :param keywords: Ключевые слова.
+    :param fetch: Функция выгрузки вакансий по одному слову.
+    :param workers: Количество одновременно обрабатываемых слов.
+    :return: Уникальные вакансии в порядке ключевых слов и ошибки по словам.
+    """
+    if workers < 1:
+        raise ValueError("Количество потоков должно быть положительным числом.")
+
+    def attempt(keyword: str):
+        try:
+            return fetch(keyword)
+        except (ValueError, ConnectionError) as e:
+            return e
+
+    results: List[List[Vacancy]] = []
+    errors: Dict[str, Exception] = {}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for keyword, result in zip(keywords, executor.map(attempt, keywords)):
+            if isinstance(result, Exception):
+                errors[keyword] = result
+            else:
+                results.append(result)
+    return _dedupe(chain.from_iterable(results)), errors
+
+
+def harvest(api: HeadHunterAPI, keywords: Sequence[str], pages: int = 1, fetch_workers: int = 4,
+            parse_workers: Optional[int] = None,
+            handler: Optional[FileHandler] = None) -> Tuple[List[Vacancy], Dict[str, Exception]]:
+    """
+    Массовая выгрузка вакансий по нескольким ключевым словам на нескольких ядрах: страницы запрашиваются
+    в потоках без разбора JSON (с кешем и остановкой на последней странице), а разбор тел ответов
+    и создание вакансий выполняются в пуле процессов. Первая страница слова разбирается сразу —
+    из нее известно число страниц, остальные передаются в пул пакетами по размеру страниц.
+    При необходимости вакансии сохраняются в хранилище одним пакетом.
+    Ошибка по одному слову не прерывает выгрузку остальных.
+    :param api: Клиент API hh.ru.
+    :param keywords: Ключевые слова для поиска.
+    :param pages: Максимальное количество страниц на каждое ключевое слово.
+    :param fetch_workers: Количество одновременно обрабатываемых слов.
+    :param parse_workers: Количество процессов для разбора (None — число ядер); 1 — разбор в текущем процессе.
+    :param handler: Хранилище для сохранения вакансий (необязательно).
+    :return: Уникальные вакансии в порядке ключевых слов и страниц и ошибки по словам.
+    """
+    workers = _resolve_workers(parse_workers)
+
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else nullcontext()
+    with metrics.timer("harvest"), pool as executor:
+        def fetch(keyword: str) -> List[Vacancy]:
+            if pages < 1:
+                return []
+            first = api.get_raw_page(keyword, 0)
+            if executor is not None and not isinstance(first, dict):
+                total, vacancies = executor.submit(_parse_page, first).result()
+            else:
+                total, vacancies = _parse_page(first)
+            rest = [api.get_raw_page(keyword, page) for page in range(1, min(pages, total or pages))]
+            return vacancies + _parse_batch(rest, executor, workers)
+
+        vacancies, errors = _fetch_keywords(keywords, fetch, fetch_workers)
+    if handler is not None:
+        handler.add_many(vacancy.to_dict() for vacancy in vacancies)
+    return vacancies, errors
+
+
+def harvest_keywords(api: HeadHunterAPI, keywords: Sequence[str], pages: int = 1,
+                     workers: int = 8) -> Tuple[List[Vacancy], Dict[str, Exception]]:
+    """
+    Параллельная выгрузка вакансий по ключевым словам с общей дедупликацией:
+    вакансия, найденная по нескольким словам, попадает в результат один раз.
+    Ошибка по одному слову не прерывает выгрузку остальных.
+    :param api: Клиент API hh.ru (один пул соединений, ограничитель и предохранитель на все слова).
+    :param keywords: Ключевые слова.
+    :param pages: Количество страниц на ключевое слово.
+    :param workers: Количество одновременно обрабатываемых слов.
+    :return: Уникальные вакансии в порядке ключевых слов и ошибки по словам.
+    """
+    with metrics.timer("harvest"):
+        return _fetch_keywords(keywords, lambda keyword: Vacancy.from_hh_items(api.iter_vacancies(keyword, pages)),
+                               workers)
+
+
+def sync_keywords(sync: IncrementalSync, keywords: Sequence[str], pages: int = 1,
+                  workers: int = 8) -> Tuple[List[Vacancy], Dict[str, Exception]]:
+    """
+    Параллельная инкрементальная выгрузка по ключевым словам: для каждого слова запрашиваются
+    только вакансии, опубликованные после его отметки синхронизации, и сразу записываются в хранилище.
+    Ошибка по одному слову не прерывает выгрузку остальных, а его отметка не сдвигается.
+    :param sync: Инкрементальная синхронизация (клиент API, хранилище и файл отметок).
+    :param keywords: Ключевые слова.
+    :param pages: Максимальное количество страниц на ключевое слово за один запуск.
+    :param workers: Количество одновременно обрабатываемых слов.
+    :return: Новые и измененные вакансии без повторов и ошибки по словам.
+    """
+    with metrics.timer("harvest"):
+        return _fetch_keywords(keywords, lambda keyword: sync.sync(keyword, pages), workers)
@@ -0,0 +1,134 @@
+import csv
+import io
+import json
+import sys
+from typing import Callable, Dict, List, Optional, Sequence, TextIO
+from src.metrics import metrics
+from src.vacancy import Vacancy
+
+SEPARATOR = "-" * 80
+TITLE_WIDTH = 40  # Ширина колонки названия в табличном режиме
+CSV_FIELDS = ("title", "url", "salary_from", "salary_to", "currency", "gross", "description")
+
+
+def _salary_range(vacancy: Vacancy) -> str:
+    """
+    Зарплата вакансии одной строкой для табличного режима.
+    :param vacancy: Вакансия.
+    :return: Строка вида "100000 - 150000 RUR" или "-", если зарплата не указана.
+    """
+    salary_from, salary_to = vacancy.get_salary_from(), vacancy.get_salary_to()
+    if salary_from is None and salary_to is None:
+        return "-"
+    return f"{salary_from or ''} - {salary_to or ''} {vacancy.get_currency()}".strip()
+
+
+def render_text(vacancies: Sequence[Vacancy], start: int = 1) -> str:
+    """
+    Подробный человекочитаемый вывод: название, ссылка, зарплата и описание каждой вакансии.
+    :param vacancies: Вакансии.
+    :param start: Номер первой вакансии (для постраничного вывода).
+    :return: Текст для вывода.
+    """
+    lines = []
+    for idx, vacancy in enumerate(vacancies, start):
+        lines.append(f"{idx}. {vacancy.get_title()}")
+        lines.append(f"   Ссылка: {vacancy.get_url()}")
+        lines.append(f"   Зарплата: {vacancy.get_salary_from()} - {vacancy.get_salary_to()}")
+        lines.append(f"   Описание: {vacancy.get_description()}")
+        lines.append(SEPARATOR)
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+def render_table(vacancies: Sequence[Vacancy], start: int = 1) -> str:
+    """
+    Компактная таблица: одна строка на вакансию.
+    :param vacancies: Вакансии.
+    :param start: Номер первой вакансии (для постраничного вывода).
+    :return: Текст таблицы.
+    """
+    number_width = len(str(start + len(vacancies) - 1)) if vacancies else 1
+    rows = [f"{'№':>{number_width}}  {'Название':<{TITLE_WIDTH}}  {'Зарплата':<24}  Ссылка"]
+    for idx, vacancy in enumerate(vacancies, start):
+        title = vacancy.get_title()
+        if len(title) > TITLE_WIDTH:
+            title = title[:TITLE_WIDTH - 1] + "…"
+        salary = _salary_range(vacancy)
+        rows.append(f"{idx:>{number_width}}  {title:<{TITLE_WIDTH}}  {salary:<24}  {vacancy.get_url()}")
+    return "\n".join(rows) + "\n"
+
+
+def render_jsonl(vacancies: Sequence[Vacancy], start: int = 1) -> str:
+    """
+    Машиночитаемый вывод JSON Lines в формате Vacancy.to_dict.
+    :param vacancies: Вакансии.
+    :param start: Не используется (для единообразия с остальными форматами).
+    :return: Текст: одна JSON-запись на строку.
+    """
+    return "".join(json.dumps(vacancy.to_dict(), ensure_ascii=False) + "\n" for vacancy in vacancies)
+
+
+def render_csv(vacancies: Sequence[Vacancy], start: int = 1) -> str:
+    """
+    Машиночитаемый вывод CSV с заголовком.
+    :param vacancies: Вакансии.
+    :param start: Номер первой вакансии: заголовок выводится только для первой страницы.
+    :return: Текст CSV.
+    """
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=CSV_FIELDS, extrasaction="ignore", lineterminator="\n")
+    if start == 1:
+        writer.writeheader()
+    writer.writerows(vacancy.to_dict() for vacancy in vacancies)
+    return buffer.getvalue()
+
+
+# Форматы вывода: название -> функция отрисовки
+FORMATS: Dict[str, Callable[[Sequence[Vacancy], int], str]] = {
+    "text": render_text,
+    "table": render_table,
+    "jsonl": render_jsonl,
+    "csv": render_csv,
+}
+
+
+def render(vacancies: Sequence[Vacancy], fmt: str = "text", start: int = 1) -> str:
+    """
+    Отрисовка вакансий в строку.
+    :param vacancies: Вакансии.
+    :param fmt: Формат: "text", "table", "jsonl" или "csv".
+    :param start: Номер первой вакансии.
+    :return: Текст для вывода.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Неизвестный формат вывода: {fmt}. Допустимые: {', '.join(FORMATS)}.")
+    with metrics.timer("render"):
+        return FORMATS[fmt](vacancies, start)
+
+
+def write_vacancies(vacancies: List[Vacancy], fmt: str = "text", page_size: Optional[int] = None,
+                    stream: Optional[TextIO] = None, prompt: Callable[[str], str] = input, header: str = "") -> None:
+    """
+    Вывод вакансий: текст собирается в буфере и записывается в поток одной операцией
+    (при постраничном выводе — одной операцией на страницу).
+    :param vacancies: Вакансии.
+    :param fmt: Формат: "text", "table", "jsonl" или "csv".
+    :param page_size: Количество вакансий на странице (None — выводить все сразу).
+    :param stream: Поток вывода (по умолчанию sys.stdout).
+    :param prompt: Функция запроса перехода к следующей странице.
+    :param header: Текст, выводимый перед первой страницей.
+    """
+    stream = stream if stream is not None else sys.stdout
+    if not page_size or page_size >= len(vacancies):
+        stream.write(header + render(vacancies, fmt))
+        stream.flush()
+        return
+
+    for offset in range(0, len(vacancies), page_size):
+        stream.write((header if offset == 0 else "") + render(vacancies[offset:offset + page_size], fmt, offset + 1))
+        stream.flush()
+        remaining = len(vacancies) - offset - page_size
+        if remaining > 0:
+            answer = prompt(f"Показано {offset + page_size} из {len(vacancies)}. Enter — дальше, q — выход: ")
+            if answer.strip().lower() in ("q", "й"):
+                return
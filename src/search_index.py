@@ -0,0 +1,132 @@
+import re
+from typing import Dict, Iterable, List, Optional, Set
+from src.vacancy import Vacancy
+
+# Слово начинается с буквы или цифры и может содержать "+" и "#" (C++, C#)
+_TOKEN_RE = re.compile(r"\w[\w+#]*")
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Разбивает текст на слова с приведением регистра для русского и английского языков.
+    Буква "ё" приравнивается к "е".
+    :param text: Исходный текст.
+    :return: Список слов в нижнем регистре.
+    """
+    return _TOKEN_RE.findall(text.casefold().replace("ё", "е"))
+
+
+class VacancyIndex:
+    """
+    Инвертированный индекс слов по названию и описанию вакансий.
+    Индекс строится один раз и пополняется по мере добавления вакансий,
+    а запросы выполняются пересечением множеств номеров вакансий без просмотра текстов.
+    """
+
+    def __init__(self, vacancies: Iterable[Vacancy] = ()):
+        """
+        Инициализация индекса.
+        :param vacancies: Начальный набор вакансий.
+        """
+        self._vacancies: List[Vacancy] = []
+        self._postings: Dict[str, Set[int]] = {}
+        self.add_many(vacancies)
+
+    def __len__(self) -> int:
+        return len(self._vacancies)
+
+    def add(self, vacancy: Vacancy) -> None:
+        """
+        Добавление вакансии в индекс.
+        :param vacancy: Вакансия.
+        """
+        doc_id = len(self._vacancies)
+        self._vacancies.append(vacancy)
+        for token in set(tokenize(f"{vacancy.get_title()} {vacancy.get_description()}")):
+            self._postings.setdefault(token, set()).add(doc_id)
+
+    def add_many(self, vacancies: Iterable[Vacancy]) -> None:
+        """
+        Пакетное добавление вакансий в индекс.
+        :param vacancies: Вакансии.
+        """
+        for vacancy in vacancies:
+            self.add(vacancy)
+
+    def _word_ids(self, word: str) -> Set[int]:
+        """
+        Приватный метод получения номеров вакансий, содержащих слово.
+        Если запрос распадается на несколько слов (например, "node.js"), требуются все.
+        :param word: Слово запроса.
+        :return: Множество номеров вакансий (изменять его нельзя).
+        """
+        tokens = tokenize(word)
+        if not tokens:
+            return set()
+        return self._intersect([self._postings.get(token, set()) for token in tokens])
+
+    @staticmethod
+    def _intersect(sets: List[Set[int]]) -> Set[int]:
+        """
+        Приватный метод пересечения множеств, начиная с самого короткого; одно множество не копируется.
+        :param sets: Непустой список множеств.
+        :return: Пересечение (изменять его нельзя).
+        """
+        if len(sets) == 1:
+            return sets[0]
+        sets = sorted(sets, key=len)
+        return sets[0].intersection(*sets[1:])
+
+    def search(self, all_words: Iterable[str] = (), any_words: Iterable[str] = (),
+               exclude_words: Iterable[str] = ()) -> List[Vacancy]:
+        """
+        Поиск вакансий по ключевым словам.
+        :param all_words: Слова, которые должны встречаться все (AND).
+        :param any_words: Слова, из которых должно встречаться хотя бы одно (OR).
+        :param exclude_words: Слова, которые не должны встречаться (NOT).
+        :return: Найденные вакансии в порядке добавления в индекс.
+        """
+        return [self._vacancies[doc_id] for doc_id in self.search_ids(all_words, any_words, exclude_words)]
+
+    def match_ids(self, all_words: Iterable[str] = (), any_words: Iterable[str] = ()) -> Optional[Set[int]]:
+        """
+        Номера вакансий, удовлетворяющих условиям AND и OR, без сортировки.
+        :param all_words: Слова, которые должны встречаться все (AND).
+        :param any_words: Слова, из которых должно встречаться хотя бы одно (OR).
+        :return: Множество номеров (изменять его нельзя) или None, если условий нет и подходят все вакансии.
+        """
+        all_words, any_words = list(all_words), list(any_words)
+        candidates = None
+
+        if all_words:
+            candidates = self._intersect([self._word_ids(word) for word in all_words])
+
+        if any_words:
+            union = set().union(*(self._word_ids(word) for word in any_words))
+            candidates = union if candidates is None else candidates & union
+
+        return candidates
+
+    def excluded_ids(self, exclude_words: Iterable[str] = ()) -> Set[int]:
+        """
+        Номера вакансий, содержащих хотя бы одно из исключаемых слов.
+        :param exclude_words: Слова, которые не должны встречаться (NOT).
+        :return: Множество номеров (изменять его нельзя).
+        """
+        postings = [self._word_ids(word) for word in exclude_words]
+        if len(postings) == 1:
+            return postings[0]
+        return set().union(*postings)
+
+    def search_ids(self, all_words: Iterable[str] = (), any_words: Iterable[str] = (),
+                   exclude_words: Iterable[str] = ()) -> List[int]:
+        """
+        Поиск номеров вакансий (в порядке добавления в индекс) по ключевым словам; параметры как у search.
+        Позволяет сопоставить результат с другими структурами, построенными в том же порядке.
+        :return: Список номеров вакансий по возрастанию.
+        """
+        candidates = self.match_ids(all_words, any_words)
+        excluded = self.excluded_ids(exclude_words)
+        if candidates is None:
+            return [doc_id for doc_id in range(len(self._vacancies)) if doc_id not in excluded]
+        return sorted(candidates - excluded)
@@ -0,0 +1,325 @@
+import heapq
+import json
+import os
+import sys
+import threading
+import time
+from bisect import bisect_right
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import islice
+from typing import Dict, List, Optional, Sequence, Tuple
+from urllib.parse import parse_qs, urlparse
+from src.analytics import salary_of
+from src.api import HeadHunterAPI
+from src.currency import DEFAULT_RATES_PATH, ExchangeRates
+from src.file_handler import FileHandler
+from src.metrics import metrics
+from src.pipeline import harvest_keywords
+from src.search_index import VacancyIndex
+from src.vacancy import Vacancy
+
+DEFAULT_TOP = 20
+MAX_TOP = 1000
+
+
+class VacancySnapshot:
+    """
+    Неизменяемый снимок данных сервиса: вакансии, индекс слов и зарплаты в базовой валюте,
+    посчитанные один раз при построении. Обновление данных создает новый снимок и подменяет
+    ссылку на него, поэтому запросы читают согласованные данные без блокировок.
+    """
+
+    def __init__(self, vacancies: Sequence[Vacancy], rates_path: str = DEFAULT_RATES_PATH):
+        """
+        Построение снимка.
+        :param vacancies: Вакансии.
+        :param rates_path: Путь к файлу курсов валют (если файла нет, зарплаты сравниваются как есть).
+        """
+        self.vacancies = list(vacancies)
+        self.index = VacancyIndex(self.vacancies)
+        self.salaries = self._salaries(self.vacancies, rates_path)
+        self._order, self._position, self._negated_salaries = self._rank(self.salaries)
+        self.updated_at = time.time()
+
+    @staticmethod
+    def _salaries(vacancies: List[Vacancy], rates_path: str) -> List[Optional[float]]:
+        """
+        Приватный метод расчета средних зарплат вакансий в базовой валюте.
+        Зарплаты в валютах без курса не пересчитываются и не участвуют в ранжировании и фильтрах:
+        их нельзя сравнить с остальными.
+        :param vacancies: Вакансии.
+        :param rates_path: Путь к файлу курсов валют.
+        :return: Список зарплат в порядке вакансий (None — зарплата не указана или для ее валюты нет курса).
+        :raises ValueError: Если файл курсов поврежден.
+        """
+        records = [vacancy.to_dict() for vacancy in vacancies]
+        if not os.path.exists(rates_path):
+            return [salary_of(record) for record in records]
+        rates = ExchangeRates.from_file(rates_path)
+        return [salary_of(record, rates=rates) if rates.has_rate(record["currency"]) else None for record in records]
+
+    @staticmethod
+    def _rank(salaries: List[Optional[float]]) -> Tuple[List[int], List[int], List[float]]:
+        """
+        Приватный метод построения порядка вакансий по убыванию зарплаты (один раз на снимок).
+        Вакансии без сравнимой зарплаты идут в конце в порядке добавления.
+        :param salaries: Зарплаты в порядке вакансий.
+        :return: Номера вакансий по убыванию зарплаты, позиция каждой вакансии в этом порядке
+                 и зарплаты со знаком минус по возрастанию (для поиска границы фильтра делением пополам).
+        """
+        rated = sorted((doc_id for doc_id, salary in enumerate(salaries) if salary is not None),
+                       key=salaries.__getitem__, reverse=True)
+        order = rated + [doc_id for doc_id, salary in enumerate(salaries) if salary is None]
+        position = [0] * len(order)
+        for rank, doc_id in enumerate(order):
+            position[doc_id] = rank
+        return order, position, [-salaries[doc_id] for doc_id in rated]
+
+    def search(self, words: Sequence[str] = (), exclude_words: Sequence[str] = (), top: int = DEFAULT_TOP,
+               min_salary: Optional[float] = None) -> Tuple[int, List[Vacancy]]:
+        """
+        Поиск по индексу с фильтром по зарплате и выбором топа по убыванию зарплаты.
+        Порядок по зарплате построен заранее: фильтр по зарплате — это граница в этом порядке,
+        без слов запроса топ берется из его начала с остановкой после top вакансий,
+        а найденные по словам вакансии упорядочиваются по своим позициям в нем.
+        :param words: Слова, которые должны встречаться все (пусто — все вакансии).
+        :param exclude_words: Слова, которые не должны встречаться.
+        :param top: Количество вакансий в ответе.
+        :param min_salary: Минимальная средняя зарплата в базовой валюте (None — без фильтра).
+        :return: Количество найденных вакансий и топ из них.
+        """
+        matched = self.index.match_ids(all_words=words)
+        excluded = self.index.excluded_ids(exclude_words)
+        order, position = self._order, self._position
+        # Вакансии, проходящие фильтр по зарплате, занимают первые limit позиций порядка
+        limit = len(order) if min_salary is None else bisect_right(self._negated_salaries, -min_salary)
+
+        if matched is None:
+            if limit == len(order):
+                total = limit - len(excluded)
+            else:
+                total = limit - sum(1 for doc_id in excluded if position[doc_id] < limit)
+            top_ids = list(islice((doc_id for doc_id in islice(order, limit) if doc_id not in excluded), top))
+            return total, [self.vacancies[doc_id] for doc_id in top_ids]
+
+        if excluded:
+            matched = matched - excluded
+        if limit == len(order):
+            total = len(matched)
+        elif limit < len(matched):
+            total = sum(1 for doc_id in islice(order, limit) if doc_id in matched)
+        else:
+            total = sum(1 for doc_id in matched if position[doc_id] < limit)
+        if top * len(order) <= len(matched) ** 2:
+            # Найдено много вакансий: первые top из них встретятся в начале порядка
+            top_ids = list(islice((doc_id for doc_id in islice(order, limit) if doc_id in matched), top))
+        else:
+            top_ids = heapq.nsmallest(top, (doc_id for doc_id in matched if position[doc_id] < limit),
+                                      key=position.__getitem__)
+        return total, [self.vacancies[doc_id] for doc_id in top_ids]
+
+
+class SearchService:
+    """
+    Сервис поиска вакансий с «теплыми» данными в памяти: клиент API с пулом соединений,
+    вакансии и индекс живут между запросами, а фоновый поток периодически обновляет данные.
+    """
+
+    def __init__(self, api: HeadHunterAPI, keywords: Sequence[str], pages: int = 1, workers: int = 8,
+                 refresh_interval: float = 3600.0, handler: Optional[FileHandler] = None,
+                 rates_path: str = DEFAULT_RATES_PATH):
+        """
+        Инициализация сервиса.
+        :param api: Клиент API hh.ru.
+        :param keywords: Ключевые слова, по которым выгружаются вакансии.
+        :param pages: Количество страниц на ключевое слово.
+        :param workers: Количество одновременно обрабатываемых слов при обновлении.
+        :param refresh_interval: Период фонового обновления в секундах.
+        :param handler: Хранилище: из него загружаются данные при старте, в него сохраняются обновления.
+        :param rates_path: Путь к файлу курсов валют.
+        """
+        self.api = api
+        self.keywords = list(keywords)
+        self.pages = pages
+        self.workers = workers
+        self.refresh_interval = refresh_interval
+        self.handler = handler
+        self.rates_path = rates_path
+        self.errors: Dict[str, Exception] = {}  # Ошибки последнего обновления по словам
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._refresh_lock = threading.Lock()
+
+        initial = Vacancy.from_dicts(handler.iter_data(), trusted=True) if handler is not None else []
+        self._snapshot = VacancySnapshot(initial, rates_path)
+
+    @property
+    def snapshot(self) -> VacancySnapshot:
+        """
+        Текущий снимок данных.
+        """
+        return self._snapshot
+
+    def refresh(self) -> None:
+        """
+        Выгрузка вакансий по всем ключевым словам и замена снимка данных.
+        С хранилищем снимок строится из всех сохраненных вакансий, а не только из последней выгрузки.
+        Без хранилища при ошибке части слов прежние вакансии сохраняются вместе с новыми,
+        а если не удалось обработать ни одного слова, текущие данные не меняются.
+        """
+        with self._refresh_lock:
+            vacancies, self.errors = harvest_keywords(self.api, self.keywords, self.pages, self.workers)
+            metrics.inc("refresh_keyword_errors", len(self.errors))
+            if self.keywords and len(self.errors) == len(self.keywords):
+                return
+            if self.handler is not None:
+                self.handler.add_many(vacancy.to_dict() for vacancy in vacancies)
+                vacancies = Vacancy.from_dicts(self.handler.iter_data(), trusted=True)
+            elif self.errors:
+                # Вакансии слов с ошибкой известны только по прежнему снимку: новые версии заменяют старые
+                merged = {vacancy.identity(): vacancy for vacancy in self._snapshot.vacancies}
+                merged.update((vacancy.identity(), vacancy) for vacancy in vacancies)
+                vacancies = list(merged.values())
+            self._snapshot = VacancySnapshot(vacancies, self.rates_path)
+
+    def _refresh_loop(self) -> None:
+        """
+        Приватный метод фонового обновления: ошибки не останавливают поток,
+        а учитываются в метриках (refresh_failures) и выводятся в stderr.
+        """
+        while not self._stop.wait(self.refresh_interval):
+            try:
+                self.refresh()
+            except Exception as e:  # Сервис продолжает отвечать по прежним данным
+                metrics.inc("refresh_failures")
+                print(f"Ошибка фонового обновления вакансий: {e}", file=sys.stderr)
+
+    def start(self) -> None:
+        """
+        Запуск фонового обновления данных.
+        """
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._refresh_loop, name="vacancy-refresh", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Остановка фонового обновления данных.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
+class SearchRequestHandler(BaseHTTPRequestHandler):
+    """
+    Обработчик HTTP-запросов: /search?q=python+django&exclude=php&top=10&min_salary=150000, /health
+    и /metrics (метрики в текстовом формате Prometheus).
+    """
+
+    server: "SearchHTTPServer"
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        if url.path == "/search":
+            try:
+                with metrics.timer("search"):
+                    body = self._search(query)
+            except ValueError as e:
+                self._send_json(400, {"error": str(e)})
+                return
+            metrics.inc("search_requests")
+            self._send_json(200, body)
+        elif url.path == "/health":
+            snapshot = self.server.service.snapshot
+            self._send_json(200, {"status": "ok", "vacancies": len(snapshot.vacancies),
+                                  "updated_at": snapshot.updated_at})
+        elif url.path == "/metrics":
+            self._send(200, metrics.to_prometheus().encode("utf-8"), "text/plain; version=0.0.4; charset=utf-8")
+        else:
+            self._send_json(404, {"error": f"Неизвестный путь: {url.path}"})
+
+    def _search(self, query: Dict[str, List[str]]) -> Dict:
+        """
+        Приватный метод выполнения поиска по параметрам запроса.
+        :param query: Параметры строки запроса.
+        :return: Тело ответа.
+        """
+        words = " ".join(query.get("q", [])).split()
+        exclude_words = " ".join(query.get("exclude", [])).split()
+        try:
+            top = int(query.get("top", [DEFAULT_TOP])[0])
+            min_salary = float(query["min_salary"][0]) if "min_salary" in query else None
+        except ValueError:
+            raise ValueError("Параметры top и min_salary должны быть числами.")
+        if not 0 < top <= MAX_TOP:
+            raise ValueError(f"Параметр top должен быть в диапазоне от 1 до {MAX_TOP}.")
+
+        total, vacancies = self.server.service.snapshot.search(words, exclude_words, top, min_salary)
+        return {"total": total, "items": [vacancy.to_dict() for vacancy in vacancies]}
+
+    def _send_json(self, status: int, body: Dict) -> None:
+        """
+        Приватный метод отправки ответа в формате JSON.
+        :param status: HTTP-статус.
+        :param body: Тело ответа.
+        """
+        self._send(status, json.dumps(body, ensure_ascii=False).encode("utf-8"), "application/json; charset=utf-8")
+
+    def _send(self, status: int, payload: bytes, content_type: str) -> None:
+        """
+        Приватный метод отправки ответа.
+        :param status: HTTP-статус.
+        :param payload: Тело ответа.
+        :param content_type: Тип содержимого.
+        """
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass  # Журнал каждого запроса замедляет ответы и засоряет вывод
+
+
+class SearchHTTPServer(ThreadingHTTPServer):
+    """
+    Многопоточный HTTP-сервер: каждый запрос обрабатывается в отдельном потоке над общим сервисом.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, service: SearchService, host: str = "127.0.0.1", port: int = 8000):
+        """
+        Инициализация сервера.
+        :param service: Сервис поиска.
+        :param host: Адрес для прослушивания.
+        :param port: Порт (0 — выбрать свободный).
+        """
+        super().__init__((host, port), SearchRequestHandler)
+        self.service = service
+
+
+def serve(service: SearchService, host: str = "127.0.0.1", port: int = 8000) -> None:
+    """
+    Запуск сервиса поиска: первичная загрузка данных, фоновое обновление и обработка запросов
+    до прерывания (Ctrl+C).
+    :param service: Сервис поиска.
+    :param host: Адрес для прослушивания.
+    :param port: Порт.
+    """
+    if not service.snapshot.vacancies:
+        service.refresh()
+    service.start()
+    with SearchHTTPServer(service, host, port) as server:
+        print(f"Сервис поиска вакансий запущен: http://{host}:{server.server_address[1]}/search?q=python")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            service.stop()
@@ -0,0 +1,181 @@
+import json
+import os
+from datetime import datetime
+from typing import Dict, List, Optional
+from src.api import HeadHunterAPI
+from src.file_handler import FileHandler, atomic_write, file_lock
+from src.vacancy import Vacancy
+
+# Формат даты публикации в ответах API hh.ru, например "2024-05-01T12:30:00+0300"
+HH_DATE_FORMAT = "%Y-%m-%dT%H:%M:%S%z"
+
+
+def _parse_date(value: Optional[str]) -> Optional[datetime]:
+    """
+    Разбор даты публикации вакансии.
+    :param value: Дата в формате API hh.ru.
+    :return: Дата с часовым поясом или None, если дата отсутствует или некорректна.
+    """
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, HH_DATE_FORMAT)
+    except ValueError:
+        return None
+
+
+class IncrementalSync:
+    """
+    Инкрементальная выгрузка вакансий: для каждого ключевого слова запоминается отметка синхронизации
+    (дата самой свежей публикации и идентификаторы последних вакансий). Следующий запуск запрашивает
+    вакансии по убыванию даты публикации начиная с отметки (order_by=publication_time, date_from)
+    и прекращает листать страницы, как только доходит до уже известной вакансии.
+    В хранилище записываются только новые и переопубликованные вакансии.
+    Если запуск упирается в ограничение страниц раньше, чем доходит до отметки, отметка не сдвигается:
+    запоминается курсор (дата самой старой полученной вакансии), и следующие запуски дозагружают
+    промежуток до отметки (date_to), пока он не будет выбран полностью.
+    """
+
+    def __init__(self, api: HeadHunterAPI, handler: FileHandler, state_filename: str = "sync_state.json",
+                 max_seen_ids: int = 1000):
+        """
+        Инициализация синхронизации.
+        :param api: Клиент API hh.ru.
+        :param handler: Хранилище вакансий (используется пакетный upsert add_many).
+        :param state_filename: Имя файла с отметками синхронизации в папке data.
+        :param max_seen_ids: Сколько последних идентификаторов запоминать для каждого ключевого слова.
+        """
+        self.api = api
+        self.handler = handler
+        self.max_seen_ids = max_seen_ids
+        self.state_path = os.path.join("data", state_filename)
+
+        # Создаем папку для файла состояния, если ее нет
+        os.makedirs(os.path.dirname(self.state_path) or ".", exist_ok=True)
+
+    @staticmethod
+    def _state_key(keyword: str) -> str:
+        """
+        Приватный метод нормализации ключевого слова: " Python " и "python" имеют общую отметку.
+        """
+        return " ".join(keyword.casefold().split())
+
+    def _read_state(self) -> Dict[str, Dict]:
+        """
+        Приватный метод чтения отметок синхронизации.
+        :return: Словарь: ключевое слово -> {"date_from": ..., "seen_ids": [...]}
+        и, пока промежуток не дозагружен, "resume_date_to" и "pending_date_from".
+        """
+        if not os.path.exists(self.state_path):
+            return {}
+        with open(self.state_path, "r", encoding="utf-8") as file:
+            try:
+                return json.load(file)
+            except json.JSONDecodeError:
+                # Поврежденное состояние означает лишь полную выгрузку при следующем запуске
+                return {}
+
+    def get_watermark(self, keyword: str) -> Optional[str]:
+        """
+        Отметка синхронизации ключевого слова.
+        :param keyword: Ключевое слово.
+        :return: Дата самой свежей сохраненной публикации или None, если синхронизации еще не было.
+        """
+        return self._read_state().get(self._state_key(keyword), {}).get("date_from")
+
+    def reset(self, keyword: Optional[str] = None) -> None:
+        """
+        Сброс отметок синхронизации: следующий запуск выполнит полную выгрузку.
+        :param keyword: Ключевое слово (None — сбросить все).
+        """
+        with file_lock(self.state_path):
+            state = {}
+            if keyword is not None:
+                state = self._read_state()
+                state.pop(self._state_key(keyword), None)
+            atomic_write(self.state_path, lambda file: json.dump(state, file, ensure_ascii=False, indent=4))
+
+    def sync(self, keyword: str, max_pages: int = 20) -> List[Vacancy]:
+        """
+        Инкрементальная выгрузка вакансий по ключевому слову.
+        :param keyword: Ключевое слово для поиска вакансий.
+        :param max_pages: Максимальное количество страниц за один запуск.
+        :return: Новые и измененные вакансии, записанные в хранилище.
+        """
+        state_key = self._state_key(keyword)
+        entry = self._read_state().get(state_key, {})
+        watermark = _parse_date(entry.get("date_from"))
+        resume_to = _parse_date(entry.get("resume_date_to"))
+        seen_ids = set(entry.get("seen_ids", []))
+
+        params = {"order_by": "publication_time"}
+        if watermark is not None:
+            # date_from включает границу: вакансии с датой отметки придут повторно и отсеются по id
+            params["date_from"] = entry["date_from"]
+        if resume_to is not None:
+            # Дозагрузка промежутка между отметкой и самой старой вакансией прошлого запуска
+            params["date_to"] = entry["resume_date_to"]
+
+        fresh_items = []
+        oldest = None
+        reached_known = False
+        pages_read = 0
+        for items in self.api.iter_pages(keyword, max_pages, params):
+            pages_read += 1
+            for item in items:
+                published_at = _parse_date(item.get("published_at"))
+                if published_at is not None and (oldest is None or published_at < oldest[0]):
+                    oldest = (published_at, item["published_at"])
+                known = item.get("id") in seen_ids
+                if known and resume_to is not None and published_at is not None and published_at >= resume_to:
+                    continue  # Граница date_to включительна: вакансия получена прошлым запуском
+                if known and (watermark is None or published_at is None or published_at <= watermark):
+                    # Вакансии упорядочены по дате публикации: дальше только уже сохраненные
+                    reached_known = True
+                    break
+                fresh_items.append(item)
+            if reached_known:
+                break
+
+        vacancies = Vacancy.from_hh_items(fresh_items)
+        if vacancies:
+            self.handler.add_many(vacancy.to_dict() for vacancy in vacancies)
+        # API отдал меньше страниц, чем разрешено, — выборка пройдена до конца
+        complete = reached_known or pages_read < max_pages
+        self._update_state(state_key, fresh_items, complete, oldest[1] if oldest else None)
+        return vacancies
+
+    def _update_state(self, state_key: str, items: List[dict], complete: bool = True,
+                      oldest: Optional[str] = None) -> None:
+        """
+        Приватный метод сдвига отметки синхронизации после успешной записи в хранилище.
+        Отметка сдвигается, только если промежуток до нее выбран полностью, иначе запоминается курсор
+        дозагрузки, а самая свежая дата сохраняется до закрытия промежутка.
+        :param state_key: Нормализованное ключевое слово.
+        :param items: Новые вакансии в формате API hh.ru.
+        :param complete: Дошел ли запуск до известной вакансии или до конца выдачи.
+        :param oldest: Дата самой старой полученной вакансии (курсор дозагрузки).
+        """
+        dates = [item["published_at"] for item in items if _parse_date(item.get("published_at")) is not None]
+        with file_lock(self.state_path):
+            state = self._read_state()
+            entry = state.get(state_key, {})
+            if not items and complete and "resume_date_to" not in entry:
+                return  # Новых вакансий нет и промежуток не дозагружается: состояние не меняется
+            watermark = _parse_date(entry.get("date_from"))
+            candidates = dates + ([entry["pending_date_from"]] if entry.get("pending_date_from") else [])
+            newest = max(candidates, key=_parse_date) if candidates else None
+            if complete:
+                if newest is not None and (watermark is None or _parse_date(newest) > watermark):
+                    entry["date_from"] = newest
+                entry.pop("pending_date_from", None)
+                entry.pop("resume_date_to", None)
+            elif oldest is not None:
+                entry["pending_date_from"] = newest
+                entry["resume_date_to"] = oldest
+            # Свежие идентификаторы в начале списка, самые старые вытесняются
+            new_ids = [item["id"] for item in items if item.get("id")]
+            seen_ids = list(dict.fromkeys(new_ids + entry.get("seen_ids", [])))
+            entry["seen_ids"] = seen_ids[:self.max_seen_ids]
+            state[state_key] = entry
+            atomic_write(self.state_path, lambda file: json.dump(state, file, ensure_ascii=False, indent=4))
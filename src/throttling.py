@@ -0,0 +1,210 @@
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Callable, Iterable, Optional
+
+
+class CircuitOpenError(ConnectionError):
+    """
+    Исключение, выбрасываемое, когда предохранитель разомкнут и запросы к API временно запрещены.
+    """
+    pass
+
+
+class TokenBucket:
+    """
+    Потокобезопасный ограничитель частоты запросов по алгоритму «ведро токенов».
+    Один экземпляр разделяется всеми запросами клиента, в том числе параллельными.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic, sleep: Callable[[float], None] = time.sleep):
+        """
+        Инициализация ограничителя.
+        :param rate: Скорость пополнения в токенах (запросах) в секунду.
+        :param capacity: Емкость ведра — допустимый всплеск запросов (по умолчанию равна rate, но не меньше 1).
+        :param clock: Источник монотонного времени.
+        :param sleep: Функция ожидания.
+        """
+        if rate <= 0:
+            raise ValueError("Скорость ограничителя должна быть положительным числом.")
+        self._rate = rate
+        self._capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._tokens = self._capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """
+        Резервирует токены и возвращает время, которое нужно подождать перед запросом.
+        Резервирование выполняется под блокировкой, а само ожидание — вне ее,
+        поэтому параллельные запросы выстраиваются в очередь без взаимной блокировки.
+        :param tokens: Количество токенов.
+        :return: Время ожидания в секундах.
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            self._tokens -= tokens
+            return max(0.0, -self._tokens / self._rate)
+
+    def acquire(self, tokens: float = 1.0) -> None:
+        """
+        Блокирует поток, пока не будет доступно нужное количество токенов.
+        :param tokens: Количество токенов.
+        """
+        delay = self.reserve(tokens)
+        if delay > 0:
+            self._sleep(delay)
+
+
+class RetryPolicy:
+    """
+    Политика повторных запросов с экспоненциальной задержкой, случайным разбросом и учетом Retry-After.
+    """
+
+    def __init__(self, max_retries: int = 3, backoff_factor: float = 0.5, max_backoff: float = 30.0,
+                 retry_statuses: Iterable[int] = (429, 500, 502, 503, 504),
+                 jitter: Callable[[], float] = random.random, sleep: Callable[[float], None] = time.sleep):
+        """
+        Инициализация политики.
+        :param max_retries: Максимальное число повторов после первой попытки.
+        :param backoff_factor: Базовая задержка в секундах; задержка попытки n не превышает backoff_factor * 2 ** n.
+        :param max_backoff: Верхняя граница задержки в секундах.
+        :param retry_statuses: HTTP статус-коды, после которых запрос повторяется.
+        :param jitter: Источник случайного числа в диапазоне [0, 1) для разброса задержки.
+        :param sleep: Функция ожидания.
+        """
+        if max_retries < 0:
+            raise ValueError("Количество повторов не может быть отрицательным.")
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.retry_statuses = frozenset(retry_statuses)
+        self._jitter = jitter
+        self._sleep = sleep
+
+    def should_retry(self, status_code: int) -> bool:
+        """
+        Проверяет, стоит ли повторять запрос с указанным статусом.
+        :param status_code: HTTP статус-код ответа.
+        :return: True, если статус считается временной ошибкой.
+        """
+        return status_code in self.retry_statuses
+
+    def get_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        Вычисляет задержку перед повтором.
+        :param attempt: Номер неудачной попытки (начиная с 0).
+        :param retry_after: Значение заголовка Retry-After (секунды или HTTP-дата), если сервер его прислал.
+        :return: Задержка в секундах.
+        """
+        server_delay = self._parse_retry_after(retry_after)
+        if server_delay is not None:
+            return server_delay
+        # «Полный разброс»: равномерно от 0 до экспоненциальной границы
+        return self._jitter() * min(self.max_backoff, self.backoff_factor * 2 ** attempt)
+
+    def wait(self, attempt: int, retry_after: Optional[str] = None) -> None:
+        """
+        Ожидает перед повтором запроса.
+        :param attempt: Номер неудачной попытки (начиная с 0).
+        :param retry_after: Значение заголовка Retry-After, если есть.
+        """
+        self._sleep(self.get_delay(attempt, retry_after))
+
+    @staticmethod
+    def _parse_retry_after(retry_after: Optional[str]) -> Optional[float]:
+        """
+        Приватный метод разбора заголовка Retry-After.
+        :param retry_after: Значение заголовка.
+        :return: Задержка в секундах или None, если заголовок отсутствует или некорректен.
+        """
+        if not retry_after or not isinstance(retry_after, str):
+            return None
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, retry_at.timestamp() - time.time())
+
+
+class CircuitBreaker:
+    """
+    Предохранитель: после серии неудачных запросов временно запрещает обращения к API,
+    чтобы не усугублять перегрузку сервера и не получить блокировку.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Инициализация предохранителя.
+        :param failure_threshold: Число подряд идущих неудач, после которого предохранитель размыкается.
+        :param recovery_timeout: Время в секундах, через которое разрешается пробный запрос.
+        :param clock: Источник монотонного времени.
+        """
+        if failure_threshold < 1:
+            raise ValueError("Порог срабатывания предохранителя должен быть положительным числом.")
+        self._failure_threshold = failure_threshold
+        self._recovery_timeout = recovery_timeout
+        self._clock = clock
+        self._failures = 0
+        self._opened_at = 0.0
+        self._state = self.CLOSED
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """
+        Текущее состояние предохранителя: closed, open или half_open.
+        """
+        with self._lock:
+            if self._state == self.OPEN and self._clock() - self._opened_at >= self._recovery_timeout:
+                return self.HALF_OPEN
+            return self._state
+
+    def before_request(self) -> None:
+        """
+        Проверяет, разрешен ли запрос. После таймаута восстановления пропускает один пробный запрос.
+        Если результат пробного запроса так и не был зарегистрирован, через тот же таймаут
+        пропускается следующий пробный запрос, чтобы предохранитель не остался полуразомкнутым навсегда.
+        """
+        with self._lock:
+            if self._state == self.CLOSED:
+                return
+            now = self._clock()
+            if now - self._opened_at >= self._recovery_timeout:
+                self._state = self.HALF_OPEN
+                self._opened_at = now  # Отсчет таймаута для пробного запроса
+                return
+            raise CircuitOpenError("Предохранитель разомкнут: запросы к API hh.ru временно приостановлены.")
+
+    def record_success(self) -> None:
+        """
+        Регистрирует успешный запрос и замыкает предохранитель.
+        """
+        with self._lock:
+            self._failures = 0
+            self._state = self.CLOSED
+
+    def record_failure(self) -> None:
+        """
+        Регистрирует неудачный запрос; при достижении порога (или неудаче пробного запроса) размыкает предохранитель.
+        """
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self._failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = self._clock()
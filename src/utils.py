@@ -1,25 +1,136 @@
-from typing import List
+import heapq
+import math
+import os
+import sys
+from operator import itemgetter
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple, Union
 from src.vacancy import Vacancy
 from src.file_handler import JSONFileHandler
 from src.api import HeadHunterAPI
+from src.cache import ResponseCache
+from src.currency import DEFAULT_RATES_PATH, ExchangeRates
+from src.matcher import KeywordMatcher
+from src.metrics import metrics
+from src.render import write_vacancies
+
+
+# Количество вакансий на странице при интерактивном выводе полного списка
+PAGE_SIZE = 20
+
+# Ключи ранжирования вакансий по зарплате
+RANKING_KEYS = {
+    "salary_from": Vacancy.get_salary_from,
+    "salary_to": Vacancy.get_salary_to,
+    "average": Vacancy.average_salary,
+}
+
+
+def top_n_vacancies(
+    vacancies: Iterable[Vacancy],
+    top_n: int,
+    key: Union[str, Callable[[Vacancy], Optional[float]]] = "average",
+    nulls_last: bool = True,
+) -> List[Vacancy]:
+    """
+    Выбор топ-N вакансий по убыванию зарплаты с помощью кучи за O(n log k) без полной сортировки.
+    Принимает любой итерируемый источник, в том числе генератор: в памяти хранится только N вакансий.
+    При равной зарплате сохраняется исходный порядок вакансий.
+    :param vacancies: Вакансии для ранжирования.
+    :param top_n: Количество вакансий в топе.
+    :param key: Ключ ранжирования: "salary_from", "salary_to", "average" или функция от вакансии.
+    :param nulls_last: Вакансии без зарплаты в конце (True) или в начале (False) топа.
+    :return: Список из не более чем N вакансий.
+    """
+    if top_n <= 0:
+        return []
+    if isinstance(key, str):
+        if key not in RANKING_KEYS:
+            raise ValueError(f"Неизвестный ключ ранжирования: {key}. Допустимые: {', '.join(RANKING_KEYS)}.")
+        key = RANKING_KEYS[key]
+    get_value = key
+    has_salary_rank = 1 if nulls_last else 0
+
+    def rank(vacancy: Vacancy) -> tuple:
+        value = get_value(vacancy)
+        if value is None:
+            return 1 - has_salary_rank, 0
+        return has_salary_rank, value
+
+    return heapq.nlargest(top_n, vacancies, key=rank)
+
+
+@metrics.timed("rank")
+def top_salary_vacancies(vacancies: Iterable[Vacancy], top_n: int, key: str = "salary_from",
+                         rates_path: str = DEFAULT_RATES_PATH) -> List[Vacancy]:
+    """
+    Выбор топ-N вакансий с учетом валюты: если есть таблица курсов, зарплаты приводятся
+    к базовой валюте и к сумме на руки. Множитель вычисляется один раз для каждой пары (валюта, gross),
+    а ключ ранжирования — один раз для каждой вакансии, после чего топ выбирается кучей за O(n log k).
+    Вакансии в валютах без курса в топ не попадают: их зарплаты нельзя сравнить с остальными.
+    Если файла курсов нет, зарплаты сравниваются как есть.
+    :param vacancies: Вакансии для ранжирования (итерируемый источник читается один раз).
+    :param top_n: Количество вакансий в топе.
+    :param key: Ключ ранжирования: "salary_from", "salary_to" или "average".
+    :param rates_path: Путь к файлу курсов валют.
+    :return: Исходные объекты вакансий в порядке убывания зарплаты.
+    :raises ValueError: Если файл курсов поврежден.
+    """
+    if not os.path.exists(rates_path):
+        return top_n_vacancies(vacancies, top_n, key=key)
+    if key not in RANKING_KEYS:
+        raise ValueError(f"Неизвестный ключ ранжирования: {key}. Допустимые: {', '.join(RANKING_KEYS)}.")
+    if top_n <= 0:
+        return []
+    rates = ExchangeRates.from_file(rates_path)
+    get_value = RANKING_KEYS[key]
+    rounded = key != "average"  # Границы зарплаты после пересчета округляются до целого, как в convert
+    factors: Dict[Tuple[str, Optional[bool]], Optional[float]] = {}
+
+    def ranked() -> Iterator[Tuple[float, Vacancy]]:
+        for vacancy in vacancies:
+            pair = (vacancy.get_currency(), vacancy.get_gross())
+            if pair not in factors:
+                factors[pair] = rates.factor(*pair) if rates.has_rate(pair[0]) else None
+            factor = factors[pair]
+            if factor is None:
+                continue
+            value = get_value(vacancy)
+            if value is None:
+                yield -math.inf, vacancy
+            else:
+                yield (round(value * factor) if rounded else value * factor), vacancy
+
+    return [vacancy for _, vacancy in heapq.nlargest(top_n, ranked(), key=itemgetter(0))]
+
+
+def parse_vacancies(vacancies_data: Iterable[dict]) -> Iterator[Vacancy]:
+    """
+    Ленивое преобразование вакансий в формате API hh.ru в объекты Vacancy.
+    Принимает любой итерируемый источник, поэтому может обрабатывать вакансии по мере их получения.
+    :param vacancies_data: Вакансии (словари) из API hh.ru.
+    :return: Итератор объектов Vacancy.
+    """
+    return map(Vacancy.from_hh_item, vacancies_data)
 
 
-def display_vacancies(vacancies: List[Vacancy]) -> None:
+def display_vacancies(vacancies: List[Vacancy], fmt: str = "text", page_size: Optional[int] = None,
+                      stream: Optional[TextIO] = None) -> None:
     """
-    Функция для вывода вакансий в человекочитаемом формате.
+    Функция для вывода вакансий в человекочитаемом или машиночитаемом формате.
+    Вывод собирается в буфере и записывается одной операцией (см. src/render.py).
     :param vacancies: Список вакансий для отображения.
+    :param fmt: Формат: "text" (подробный), "table" (компактный), "jsonl" или "csv".
+    :param page_size: Количество вакансий на странице (None — выводить все сразу).
+    :param stream: Поток вывода (по умолчанию sys.stdout).
     """
-    if not vacancies:
-        print("Нет вакансий для отображения.")
-        return
-
-    print(f"Найдено {len(vacancies)} вакансий:")
-    for idx, vacancy in enumerate(vacancies, 1):
-        print(f"{idx}. {vacancy.get_title()}")  # Используем геттер get_title()
-        print(f"   Ссылка: {vacancy.get_url()}")  # Используем геттер get_url()
-        print(f"   Зарплата: {vacancy.get_salary_from()} - {vacancy.get_salary_to()}")  # Используем геттеры
-        print(f"   Описание: {vacancy.get_description()}")  # Используем геттер get_description()
-        print("-" * 2000)
+    stream = stream if stream is not None else sys.stdout
+    header = ""
+    if fmt in ("text", "table"):
+        if not vacancies:
+            stream.write("Нет вакансий для отображения.\n")
+            return
+        header = f"Найдено {len(vacancies)} вакансий:\n"
+    write_vacancies(vacancies, fmt, page_size, stream, header=header)
 
 
 def user_interaction() -> None:
@@ -27,8 +138,8 @@ def user_interaction() -> None:
     Функция для взаимодействия с пользователем.
     Позволяет пользователю искать вакансии, фильтровать их, получать топ по зарплате и работать с данными.
     """
-    # Пример использования HeadHunter API для поиска вакансий
-    hh_api = HeadHunterAPI()
+    # Пример использования HeadHunter API для поиска вакансий (повторные запросы отдаются из кеша)
+    hh_api = HeadHunterAPI(cache=ResponseCache())
 
     # Получение поискового запроса от пользователя
     search_query = input("Введите поисковый запрос для вакансий (например, Python): ").strip()
@@ -38,22 +149,14 @@ def user_interaction() -> None:
 
     # Получение данных от API
     print(f"Ищу вакансии по запросу: {search_query}...")
-    vacancies_data = hh_api.get_vacancies(search_query)
-
-    # Преобразование полученных данных в список объектов Vacancy
-    vacancies = [
-        Vacancy(
-            vacancy['name'],
-            vacancy['url'],
-            vacancy['salary'].get('from') if vacancy.get('salary') else None,  # Получаем нижнюю границу зарплаты
-            vacancy['salary'].get('to') if vacancy.get('salary') else None,  # Получаем верхнюю границу зарплаты
-            vacancy.get('description') or vacancy.get('snippet', {}).get('requirement') or 'Нет описания'  # Если нет описания, задаем значение по умолчанию
-        )
-        for vacancy in vacancies_data
-    ]
-
-    # Показываем все найденные вакансии
-    display_vacancies(vacancies)
+    vacancies_data = hh_api.iter_vacancies(search_query)
+
+    # Преобразование полученных данных в список объектов Vacancy по мере получения страниц
+    with metrics.timer("fetch_parse"):
+        vacancies = list(parse_vacancies(vacancies_data))
+
+    # Показываем все найденные вакансии постранично
+    display_vacancies(vacancies, page_size=PAGE_SIZE)
 
     # Запрос пользователя для сортировки вакансий по зарплате
     try:
@@ -65,23 +168,23 @@ def user_interaction() -> None:
         print("Неверный формат числа!")
         return
 
-    # Сортировка вакансий по зарплате
-    vacancies.sort(key=lambda v: v.get_salary_from() if v.get_salary_from() is not None else 0, reverse=True)
-
-    # Получение топ N вакансий
-    top_vacancies = vacancies[:top_n]
-    print("\nТоп вакансий по зарплате:")
-    display_vacancies(top_vacancies)
+    # Получение топ N вакансий по нижней границе зарплаты (без полной сортировки)
+    try:
+        top_vacancies = top_salary_vacancies(vacancies, top_n)
+    except ValueError as e:
+        print(f"Не удалось составить топ по зарплате: {e}")
+    else:
+        print("\nТоп вакансий по зарплате:")
+        display_vacancies(top_vacancies)
 
     # Запрос ключевых слов для фильтрации вакансий по описанию
     filter_words = input("\nВведите ключевые слова для фильтрации вакансий по описанию: ").strip().split()
 
     if filter_words:
-        # Фильтрация вакансий по ключевым словам
-        filtered_vacancies = [
-            vacancy for vacancy in vacancies if
-            any(word.lower() in vacancy.get_description().lower() for word in filter_words)
-        ]
+        # Фильтрация вакансий по ключевым словам за один проход по каждому описанию
+        matcher = KeywordMatcher(filter_words)
+        with metrics.timer("filter"):
+            filtered_vacancies = [vacancy for vacancy in vacancies if matcher.matches(vacancy.get_description())]
         print("\nВакансии, соответствующие ключевым словам:")
         display_vacancies(filtered_vacancies)
     else:
@@ -89,11 +192,10 @@ def user_interaction() -> None:
 
     # Сохранение вакансий в файл
     save_to_file = input("\nХотите сохранить вакансии в файл? (Да/Нет): ").strip().lower()
-    if save_to_file == 'Да':
+    if save_to_file == 'да':
         filename = input("Введите имя файла для сохранения вакансий (например, vacancies.json): ").strip()
         file_handler = JSONFileHandler(filename)  # Передаем имя файла для сохранения
-        for vacancy in vacancies:
-            file_handler.add_data(vacancy.to_dict())
+        file_handler.add_many(vacancy.to_dict() for vacancy in vacancies)  # Один проход чтения и записи
         print(f"Вакансии успешно сохранены в файл {filename}.")
 
     print("Завершение программы.")
@@ -1,15 +1,28 @@
-from typing import Union
+import hashlib
+import json
+import re
+from typing import Iterable, List, Union
+from urllib.parse import urlsplit
+
+# Идентификатор вакансии hh.ru в пути ссылки: api.hh.ru/vacancies/123 или hh.ru/vacancy/123
+_HH_ID_PATTERN = re.compile(r"^/vacanc(?:y|ies)/(\d+)/?$")
+_HH_HOST = "hh.ru"
 
 
 class Vacancy:
     """
     Класс для работы с вакансиями.
     Используется для хранения информации о вакансиях и сравнения по зарплате.
+    Равенство и хеш определяются идентичностью вакансии (идентификатор hh.ru из ссылки),
+    а операторы порядка сравнивают среднюю зарплату, при равной зарплате — идентичность.
     """
 
-    __slots__ = ("_title", "_url", "_salary_from", "_salary_to", "_description")
+    __slots__ = ("_title", "_url", "_salary_from", "_salary_to", "_description", "_currency", "_gross")
+
+    DEFAULT_CURRENCY = "RUR"  # Код рубля в API hh.ru
 
-    def __init__(self, title: str, url: str, salary_from: Union[int, None], salary_to: Union[int, None], description: str):
+    def __init__(self, title: str, url: str, salary_from: Union[int, None], salary_to: Union[int, None], description: str,
+                 currency: str = DEFAULT_CURRENCY, gross: Union[bool, None] = None):
         """
         Инициализация экземпляра вакансии с валидацией данных.
         :param title: Название вакансии.
@@ -17,12 +30,108 @@ class Vacancy:
         :param salary_from: Нижняя граница зарплаты (None, если не указана).
         :param salary_to: Верхняя граница зарплаты (None, если не указана).
         :param description: Краткое описание вакансии.
+        :param currency: Код валюты зарплаты в формате hh.ru (по умолчанию "RUR").
+        :param gross: Зарплата указана до вычета налогов (None, если неизвестно).
         """
         self._title = self._validate_title(title)
         self._url = self._validate_url(url)
         self._salary_from = self._validate_salary(salary_from)
         self._salary_to = self._validate_salary(salary_to)
         self._description = self._validate_description(description)
+        self._currency = self._validate_currency(currency)
+        self._gross = self._validate_gross(gross)
+
+    @classmethod
+    def from_hh_item(cls, item: dict) -> "Vacancy":
+        """
+        Создает вакансию из элемента ответа API hh.ru (поля name, url, salary, description/snippet).
+        :param item: Вакансия в формате API hh.ru.
+        :return: Экземпляр вакансии.
+        """
+        salary = item.get("salary") or {}
+        description = item.get("description") or (item.get("snippet") or {}).get("requirement") or "Нет описания"
+        return cls(
+            item["name"],
+            item["url"],
+            salary.get("from"),
+            salary.get("to"),
+            description,
+            salary.get("currency") or cls.DEFAULT_CURRENCY,
+            salary.get("gross"),
+        )
+
+    @classmethod
+    def from_hh_items(cls, items: Iterable[dict]) -> List["Vacancy"]:
+        """
+        Пакетное создание вакансий из элементов ответа API hh.ru.
+        Типичные элементы проверяются одним выражением и заполняются напрямую, без вызова __init__
+        и отдельных методов валидации; элемент, не прошедший быстрой проверки, создается через
+        from_hh_item — с полной валидацией и прежним сообщением об ошибке.
+        :param items: Вакансии в формате API hh.ru.
+        :return: Список экземпляров вакансий.
+        """
+        new = cls.__new__
+        default_currency = cls.DEFAULT_CURRENCY
+        vacancies = []
+        for item in items:
+            salary = item.get("salary") or {}
+            title = item.get("name")
+            url = item.get("url")
+            salary_from = salary.get("from")
+            salary_to = salary.get("to")
+            description = item.get("description") or (item.get("snippet") or {}).get("requirement") or "Нет описания"
+            currency = salary.get("currency") or default_currency
+            gross = salary.get("gross")
+            if not (type(title) is str and title and type(url) is str and url.startswith("http")
+                    and (salary_from is None or type(salary_from) is int and salary_from >= 0)
+                    and (salary_to is None or type(salary_to) is int and salary_to >= 0)
+                    and type(description) is str and type(currency) is str and currency.isalpha()
+                    and (gross is None or type(gross) is bool)):
+                vacancies.append(cls.from_hh_item(item))
+                continue
+            vacancy = new(cls)
+            vacancy._title = title.strip()
+            vacancy._url = url.strip()
+            vacancy._salary_from = salary_from
+            vacancy._salary_to = salary_to
+            vacancy._description = description.strip()
+            vacancy._currency = currency.upper()
+            vacancy._gross = gross
+            vacancies.append(vacancy)
+        return vacancies
+
+    @classmethod
+    def from_dict(cls, data: dict, trusted: bool = False) -> "Vacancy":
+        """
+        Создает вакансию из словаря в формате to_dict.
+        :param data: Словарь с данными вакансии.
+        :param trusted: Данные получены из собственного хранилища и уже прошли валидацию —
+                        поля присваиваются напрямую, без повторной проверки.
+        :return: Экземпляр вакансии.
+        """
+        currency = data.get("currency") or cls.DEFAULT_CURRENCY  # В старых файлах валюта не сохранялась
+        if not trusted:
+            return cls(data["title"], data["url"], data.get("salary_from"), data.get("salary_to"), data["description"],
+                       currency, data.get("gross"))
+        vacancy = cls.__new__(cls)
+        vacancy._title = data["title"]
+        vacancy._url = data["url"]
+        vacancy._salary_from = data.get("salary_from")
+        vacancy._salary_to = data.get("salary_to")
+        vacancy._description = data["description"]
+        vacancy._currency = currency
+        vacancy._gross = data.get("gross")
+        return vacancy
+
+    @classmethod
+    def from_dicts(cls, records: Iterable[dict], trusted: bool = False) -> List["Vacancy"]:
+        """
+        Пакетное создание вакансий из словарей в формате to_dict (например, при загрузке сохраненного файла).
+        :param records: Словари с данными вакансий.
+        :param trusted: Пропустить повторную валидацию для данных из собственного хранилища.
+        :return: Список экземпляров вакансий.
+        """
+        return [cls.from_dict(record, trusted) for record in records]
 
     def __repr__(self):
         """
@@ -35,74 +144,123 @@ class Vacancy:
 
     def __eq__(self, other: "Vacancy"):
         """
-        Проверка равенства вакансий по зарплате.
+        Проверка, что объекты описывают одну и ту же вакансию (по идентификатору, а не по зарплате).
         """
         if not isinstance(other, Vacancy):
             return NotImplemented
-        return self.average_salary() == other.average_salary()
+        return self.identity() == other.identity()
+
+    def __hash__(self):
+        """
+        Хеш по идентичности вакансии: объекты можно хранить в множествах и ключах словарей.
+        """
+        return hash(self.identity())
+
+    def _order_key(self) -> tuple:
+        """
+        Приватный метод получения ключа порядка: сначала средняя зарплата (вакансии без зарплаты меньше
+        любых других), при равной зарплате — идентичность вакансии. Поэтому порядок согласован
+        с равенством: a <= b и a >= b выполняются одновременно, только если a == b.
+        :return: Ключ порядка.
+        """
+        salary = self.average_salary()
+        return (0, 0.0, self.identity()) if salary is None else (1, salary, self.identity())
 
     def __lt__(self, other: "Vacancy"):
         if not isinstance(other, Vacancy):
             return NotImplemented
-        self_salary = self.average_salary()
-        other_salary = other.average_salary()
-
-        # Обработка случаев, когда одна или обе зарплаты равны None
-        if self_salary is None:
-            return other_salary is not None
-        if other_salary is None:
-            return False
-        return self_salary < other_salary
+        return self._order_key() < other._order_key()
 
     def __le__(self, other: "Vacancy"):
         if not isinstance(other, Vacancy):
             return NotImplemented
-        self_salary = self.average_salary()
-        other_salary = other.average_salary()
-
-        if self_salary is None:
-            return True
-        if other_salary is None:
-            return False
-        return self_salary <= other_salary
+        return self._order_key() <= other._order_key()
 
     def __gt__(self, other: "Vacancy"):
         if not isinstance(other, Vacancy):
             return NotImplemented
-        self_salary = self.average_salary()
-        other_salary = other.average_salary()
-
-        if other_salary is None:
-            return self_salary is not None
-        if self_salary is None:
-            return False
-        return self_salary > other_salary
+        return self._order_key() > other._order_key()
 
     def __ge__(self, other: "Vacancy"):
         if not isinstance(other, Vacancy):
             return NotImplemented
-        self_salary = self.average_salary()
-        other_salary = other.average_salary()
-
-        if other_salary is None:
-            return True
-        if self_salary is None:
-            return False
-        return self_salary >= other_salary
+        return self._order_key() >= other._order_key()
 
     def average_salary(self) -> Union[float, None]:
         """
         Рассчитывает среднюю зарплату вакансии, если указаны границы зарплаты.
         :return: Средняя зарплата или None, если данные отсутствуют.
         """
-        if self._salary_from is not None and self._salary_to is not None:
-            return (self._salary_from + self._salary_to) / 2
-        if self._salary_from is not None:
-            return float(self._salary_from)
-        if self._salary_to is not None:
-            return float(self._salary_to)
+        return self.average_of(self._salary_from, self._salary_to)
+
+    @staticmethod
+    def average_of(salary_from: Union[int, None], salary_to: Union[int, None]) -> Union[float, None]:
+        """
+        Рассчитывает среднюю зарплату по границам без создания объекта вакансии.
+        :param salary_from: Нижняя граница зарплаты (None, если не указана).
+        :param salary_to: Верхняя граница зарплаты (None, если не указана).
+        :return: Средняя зарплата или None, если обе границы отсутствуют.
+        """
+        if salary_from is not None and salary_to is not None:
+            return (salary_from + salary_to) / 2
+        if salary_from is not None:
+            return float(salary_from)
+        if salary_to is not None:
+            return float(salary_to)
         return None
 
+    @staticmethod
+    def id_from_url(url: str) -> Union[str, None]:
+        """
+        Извлекает идентификатор вакансии hh.ru из ссылки.
+        Учитываются только ссылки на hh.ru и его поддомены (api.hh.ru, spb.hh.ru и т. д.),
+        чтобы вакансии других сайтов с похожим путем не совпадали с вакансиями hh.ru.
+        :param url: Ссылка на вакансию (API или сайт hh.ru).
+        :return: Идентификатор или None, если ссылка не содержит его.
+        """
+        try:
+            parts = urlsplit(url.strip())
+        except ValueError:
+            return None
+        host = (parts.hostname or "").lower()
+        if host != _HH_HOST and not host.endswith("." + _HH_HOST):
+            return None
+        match = _HH_ID_PATTERN.match(parts.path)
+        return match.group(1) if match else None
+
+    @classmethod
+    def identity_of(cls, url: str) -> str:
+        """
+        Устойчивый ключ вакансии: идентификатор hh.ru, а для прочих ссылок — сама ссылка.
+        Ссылки API и сайта на одну вакансию дают один ключ.
+        :param url: Ссылка на вакансию.
+        :return: Ключ вакансии.
+        """
+        vacancy_id = cls.id_from_url(url)
+        return f"hh:{vacancy_id}" if vacancy_id else url.strip()
+
+    @staticmethod
+    def fingerprint_of(data: dict) -> str:
+        """
+        Отпечаток содержимого записи: совпадает у записей с одинаковыми данными независимо от порядка ключей.
+        :param data: Словарь с данными вакансии.
+        :return: Хеш SHA-1 в шестнадцатеричном виде.
+        """
+        canonical = json.dumps(data, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+        return hashlib.sha1(canonical.encode("utf-8")).hexdigest()
+
+    def identity(self) -> str:
+        """
+        Устойчивый ключ вакансии (см. identity_of).
+        """
+        return self.identity_of(self._url)
+
+    def fingerprint(self) -> str:
+        """
+        Отпечаток содержимого вакансии: меняется при любом изменении названия, зарплаты или описания.
+        """
+        return self.fingerprint_of(self.to_dict())
+
     # Геттеры для доступа к защищённым атрибутам
 
     def get_title(self) -> str:
@@ -117,6 +275,12 @@ class Vacancy:
         """
         return self._url
 
+    def get_id(self) -> Union[str, None]:
+        """
+        Геттер для идентификатора вакансии hh.ru (None, если ссылка не с hh.ru).
+        """
+        return self.id_from_url(self._url)
+
     def get_salary_from(self) -> Union[int, None]:
         """
         Геттер для нижней границы зарплаты.
@@ -135,6 +299,18 @@ class Vacancy:
         """
         return self._description
 
+    def get_currency(self) -> str:
+        """
+        Геттер для кода валюты зарплаты.
+        """
+        return self._currency
+
+    def get_gross(self) -> Union[bool, None]:
+        """
+        Геттер для признака зарплаты до вычета налогов.
+        """
+        return self._gross
+
     @staticmethod
     def _validate_title(title: str) -> str:
         """
@@ -181,6 +357,28 @@ class Vacancy:
             raise ValueError("Описание вакансии должно быть непустой строкой.")
         return description.strip()
 
+    @staticmethod
+    def _validate_currency(currency: str) -> str:
+        """
+        Приватный метод валидации кода валюты.
+        :param currency: Код валюты (например, "RUR", "USD").
+        :return: Валидный код валюты в верхнем регистре.
+        """
+        if not currency or not isinstance(currency, str) or not currency.strip().isalpha():
+            raise ValueError("Код валюты должен быть непустой строкой из букв.")
+        return currency.strip().upper()
+
+    @staticmethod
+    def _validate_gross(gross: Union[bool, None]) -> Union[bool, None]:
+        """
+        Приватный метод валидации признака зарплаты до вычета налогов.
+        :param gross: Признак (может быть None).
+        :return: Валидный признак.
+        """
+        if gross is not None and not isinstance(gross, bool):
+            raise ValueError("Признак gross должен быть логическим значением или None.")
+        return gross
+
     def to_dict(self) -> dict:
         """
         Преобразует объект вакансии в словарь.
@@ -191,5 +389,7 @@ class Vacancy:
             'url': self.get_url(),
             'salary_from': self.get_salary_from(),
             'salary_to': self.get_salary_to(),
-            'description': self.get_description()
+            'description': self.get_description(),
+            'currency': self.get_currency(),
+            'gross': self.get_gross()
         }
@@ -0,0 +1,26 @@
+from typing import Optional
+
+
+def make_item(vacancy_id, name: Optional[str] = None, salary_from: Optional[int] = 100000,
+              requirement: str = "Знание Python", currency: str = "RUR",
+              published_at: Optional[str] = None) -> dict:
+    """
+    Формирует вакансию в формате API hh.ru для тестов.
+    :param vacancy_id: Идентификатор вакансии.
+    :param name: Название (по умолчанию "Python Developer <id>").
+    :param salary_from: Нижняя граница зарплаты (None — зарплата не указана).
+    :param requirement: Требования из сниппета.
+    :param currency: Валюта зарплаты.
+    :param published_at: Дата публикации в формате API (None — без даты).
+    :return: Вакансия в формате API hh.ru.
+    """
+    item = {
+        "id": str(vacancy_id),
+        "name": name or f"Python Developer {vacancy_id}",
+        "url": f"https://api.hh.ru/vacancies/{vacancy_id}",
+        "salary": {"from": salary_from, "to": None, "currency": currency} if salary_from else None,
+        "snippet": {"requirement": requirement},
+    }
+    if published_at is not None:
+        item["published_at"] = published_at
+    return item
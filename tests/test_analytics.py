@@ -0,0 +1,137 @@
+import os
+import random
+import shutil
+import statistics
+import tempfile
+import unittest
+from src.analytics import QuantileSketch, SalaryStats, aggregate, aggregate_handler, by_keywords, \
+    by_title_cluster, cluster_title, salary_of
+from src.currency import ExchangeRates
+from src.file_handler import SQLiteFileHandler
+
+
+def make_record(title: str, salary_from=None, salary_to=None, description: str = "Описание", currency: str = "RUR"):
+    """Формирует вакансию в формате Vacancy.to_dict для тестов."""
+    return {"title": title, "url": f"http://example.com/{title}", "salary_from": salary_from,
+            "salary_to": salary_to, "description": description, "currency": currency, "gross": None}
+
+
+class TestQuantileSketch(unittest.TestCase):
+    """Тесты приближенных квантилей."""
+
+    def test_relative_accuracy(self):
+        """Тест: квантили отличаются от точных не больше заданной погрешности."""
+        rng = random.Random(42)
+        values = [rng.lognormvariate(11.5, 0.5) for _ in range(20000)]
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        for value in values:
+            sketch.add(value)
+
+        ordered = sorted(values)
+        for q in (0.1, 0.5, 0.9, 0.99):
+            exact = ordered[int(q * (len(ordered) - 1))]
+            self.assertAlmostEqual(sketch.quantile(q) / exact, 1, delta=0.011)
+        self.assertLess(len(sketch._buckets), 500)  # Память не растет с количеством значений
+
+    def test_merge_and_edge_cases(self):
+        """Тест: объединение набросков, нулевые значения и пустой набросок."""
+        left, right = QuantileSketch(), QuantileSketch()
+        left.add(0)
+        right.add(100000)
+        left.merge(right)
+
+        self.assertEqual(left.count, 2)
+        self.assertEqual(left.quantile(0), 0.0)
+        self.assertAlmostEqual(left.quantile(1), 100000, delta=1000)
+        self.assertIsNone(QuantileSketch().quantile(0.5))
+        with self.assertRaises(ValueError):
+            left.merge(QuantileSketch(relative_accuracy=0.05))
+
+
+class TestSalaryStats(unittest.TestCase):
+    """Тесты потоковой статистики зарплат."""
+
+    def test_stats_and_histogram(self):
+        """Тест: минимум, максимум, среднее, отклонение и гистограмма за один проход."""
+        values = [50000, 95000, 100000, 150000, None]
+        stats = SalaryStats(bin_width=50000)
+        for value in values:
+            stats.add(value)
+
+        present = [value for value in values if value is not None]
+        self.assertEqual((stats.count, stats.missing), (4, 1))
+        self.assertEqual((stats.min, stats.max), (50000, 150000))
+        self.assertAlmostEqual(stats.mean, statistics.fmean(present))
+        self.assertAlmostEqual(stats.std, statistics.pstdev(present))
+        self.assertEqual(stats.histogram(), [(50000, 100000, 2), (100000, 150000, 1), (150000, 200000, 1)])
+        self.assertEqual(stats.to_dict()["count"], 4)
+
+    def test_merge_matches_single_pass(self):
+        """Тест: объединение статистик частей равно статистике всего набора."""
+        values = list(range(1000, 100000, 997))
+        whole, left, right = SalaryStats(), SalaryStats(), SalaryStats()
+        for idx, value in enumerate(values):
+            whole.add(value)
+            (left if idx % 2 else right).add(value)
+        left.merge(right)
+
+        self.assertEqual(left.count, whole.count)
+        self.assertAlmostEqual(left.mean, whole.mean)
+        self.assertAlmostEqual(left.std, whole.std)
+        self.assertEqual(left.histogram(), whole.histogram())
+        self.assertEqual(left.quantile(0.5), whole.quantile(0.5))
+
+
+class TestAggregate(unittest.TestCase):
+    """Тесты агрегации сохраненных вакансий."""
+
+    def setUp(self):
+        self.records = [
+            make_record("Senior Python Developer", 200000, 300000, "Python, Django"),
+            make_record("Junior Python Developer", 80000, None, "Python"),
+            make_record("Java Developer", None, 150000, "Java, Spring"),
+            make_record("Python Developer (USD)", 2000, 3000, "Python", currency="USD"),
+            make_record("Стажер", None, None, "Обучение"),
+        ]
+
+    def test_salary_of(self):
+        """Тест: средняя зарплата считается как в Vacancy.average_salary, с пересчетом валюты."""
+        rates = ExchangeRates({"USD": 0.01})
+        self.assertEqual(salary_of(self.records[0]), 250000)
+        self.assertEqual(salary_of(self.records[1]), 80000)
+        self.assertEqual(salary_of(self.records[3], rates=rates), 250000)
+        self.assertIsNone(salary_of(self.records[4]))
+        with self.assertRaises(ValueError):
+            salary_of(self.records[0], key="title")
+
+    def test_group_by_title_cluster(self):
+        """Тест: уровень позиции не разделяет кластеры названий."""
+        self.assertEqual(cluster_title("Senior Python Developer"), "python developer")
+        self.assertEqual(cluster_title("Стажер"), "стажер")
+
+        stats = aggregate(self.records[:3], group_by=by_title_cluster)
+        self.assertEqual(sorted(stats), ["java developer", "python developer"])
+        self.assertEqual(stats["python developer"].count, 2)
+        self.assertEqual(stats["python developer"].max, 250000)
+
+    def test_group_by_keywords(self):
+        """Тест: вакансия попадает в группу каждого найденного ключевого слова."""
+        stats = aggregate(self.records, group_by=by_keywords(["Python", "Django", "Rust"]),
+                          rates=ExchangeRates({"USD": 0.01}))
+        self.assertEqual(sorted(stats), ["Django", "Python"])
+        self.assertEqual(stats["Python"].count, 3)
+        self.assertEqual(stats["Django"].count, 1)
+        self.assertEqual(aggregate(self.records)["all"].missing, 1)
+
+    def test_aggregate_handler_streams_from_storage(self):
+        """Тест: статистика считается по сохраненным записям через потоковое чтение."""
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        with SQLiteFileHandler(os.path.join(directory, "vacancies.db")) as handler:
+            handler.add_many(make_record(f"Developer {i}", 1000 * i) for i in range(1, 2501))
+            self.assertEqual(sum(1 for _ in handler.iter_data(batch_size=100)), 2500)
+
+            stats = aggregate_handler(handler, key="salary_from")["all"]
+        self.assertEqual(stats.count, 2500)
+        self.assertEqual((stats.min, stats.max), (1000, 2500000))
+        self.assertAlmostEqual(stats.quantile(0.5) / 1250500, 1, delta=0.011)
@@ -1,45 +1,138 @@
+import json
+import shutil
+import tempfile
+import time
 import unittest
-from unittest.mock import patch, Mock
-from src.api import HeadHunterAPI
+from http.server import BaseHTTPRequestHandler
+from unittest.mock import Mock
+from urllib.parse import parse_qs, urlparse
+import requests
+from requests.adapters import HTTPAdapter
+from benchmarks.stub_server import StubHHServer
+from src.api import AsyncHeadHunterAPI, HeadHunterAPI, aiohttp
+from src.cache import ResponseCache
+from src.metrics import metrics
+from src.throttling import CircuitBreaker, CircuitOpenError, RetryPolicy
+
+
+class StubHHHandler(BaseHTTPRequestHandler):
+    """Заглушка API hh.ru: отвечает с задержкой одной вакансией на страницу."""
+
+    delay = 0.2
+
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query)
+        page = int(query["page"][0])
+        time.sleep(self.delay)
+        body = json.dumps({"items": [{"id": str(page), "name": f"Vacancy {page}"}]}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class NotFoundHHHandler(BaseHTTPRequestHandler):
+    """Заглушка API hh.ru, всегда отвечающая 404."""
+
+    def do_GET(self):
+        self.send_response(404, "Not Found")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class ETagHHHandler(BaseHTTPRequestHandler):
+    """Заглушка API hh.ru с поддержкой ETag: на совпадающий If-None-Match отвечает 304."""
+
+    etag = '"v1"'
+    requests_seen = []
+
+    def do_GET(self):
+        self.requests_seen.append(self.headers.get("If-None-Match"))
+        if self.headers.get("If-None-Match") == self.etag:
+            self.send_response(304)
+            self.send_header("ETag", self.etag)
+            self.end_headers()
+            return
+        body = json.dumps({"items": [{"id": "1", "name": "Python Developer"}], "pages": 1}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("ETag", self.etag)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class CannedTransport(HTTPAdapter):
+    """Транспорт, отвечающий заранее заданным телом без обращения к сети."""
+
+    def __init__(self, payload: dict):
+        super().__init__()
+        self.payload = payload
+        self.requests = []
+
+    def send(self, request, **kwargs):
+        self.requests.append((request, kwargs))
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response._content = json.dumps(self.payload).encode("utf-8")
+        response.request = request
+        response.url = request.url
+        return response
 
 
 class TestHeadHunterAPI(unittest.TestCase):
     """Тесты для класса HeadHunterAPI."""
 
-    @patch("src.api.requests.get")
-    def test_connect_to_api_success(self, mock_get):
+    def test_connect_to_api_success(self):
         """Тест успешного подключения к API hh.ru."""
+        mock_session = Mock()
+        mock_get = mock_session.get
         mock_response = Mock()
         mock_response.status_code = 200
+        mock_response.content = b"{}"
         mock_response.json.return_value = {"items": []}
         mock_get.return_value = mock_response
 
-        api = HeadHunterAPI()
+        api = HeadHunterAPI(session=mock_session)
         response = api._connect_to_api(text="Python")
 
         self.assertEqual(response.status_code, 200)
-        mock_get.assert_called_once_with(api.BASE_URL, params={"text": "Python"})
+        mock_get.assert_called_once_with(api.BASE_URL, params={"text": "Python"}, timeout=api.timeout)
 
-    @patch("src.api.requests.get")
-    def test_connect_to_api_failure(self, mock_get):
+    def test_connect_to_api_failure(self):
         """Тест ошибки подключения к API hh.ru."""
+        mock_session = Mock()
+        mock_get = mock_session.get
         mock_response = Mock()
         mock_response.status_code = 404
         mock_response.reason = "Not Found"
         mock_get.return_value = mock_response
 
-        api = HeadHunterAPI()
+        api = HeadHunterAPI(session=mock_session)
 
         with self.assertRaises(ValueError) as context:
             api._connect_to_api(text="Python")
         self.assertIn("Ошибка подключения к API", str(context.exception))
-        mock_get.assert_called_once_with(api.BASE_URL, params={"text": "Python"})
+        mock_get.assert_called_once_with(api.BASE_URL, params={"text": "Python"}, timeout=api.timeout)
 
-    @patch("src.api.requests.get")
-    def test_get_vacancies(self, mock_get):
+    def test_get_vacancies(self):
         """Тест получения списка вакансий с hh.ru."""
+        mock_session = Mock()
+        mock_get = mock_session.get
         mock_response = Mock()
         mock_response.status_code = 200
+        mock_response.content = b"{}"
         mock_response.json.return_value = {
             "items": [
                 {"id": "1", "name": "Python Developer"},
@@ -48,7 +141,7 @@ class TestHeadHunterAPI(unittest.TestCase):
         }
         mock_get.return_value = mock_response
 
-        api = HeadHunterAPI()
+        api = HeadHunterAPI(session=mock_session)
         vacancies = api.get_vacancies(keyword="Python", pages=1)
 
         self.assertEqual(len(vacancies), 2)
@@ -57,31 +150,275 @@ class TestHeadHunterAPI(unittest.TestCase):
         mock_get.assert_called_once_with(
             api.BASE_URL,
             params={"text": "Python", "per_page": 50, "page": 0},
+            timeout=api.timeout,
         )
 
-    @patch("src.api.requests.get")
-    def test_get_vacancies_multiple_pages(self, mock_get):
+    def test_get_vacancies_multiple_pages(self):
         """Тест получения вакансий с нескольких страниц."""
+        mock_session = Mock()
+        mock_get = mock_session.get
         mock_response_page1 = Mock()
         mock_response_page1.status_code = 200
+        mock_response_page1.content = b"{}"
         mock_response_page1.json.return_value = {
             "items": [{"id": "1", "name": "Python Developer"}]
         }
 
         mock_response_page2 = Mock()
         mock_response_page2.status_code = 200
+        mock_response_page2.content = b"{}"
         mock_response_page2.json.return_value = {
             "items": [{"id": "2", "name": "Data Scientist"}]
         }
 
         mock_get.side_effect = [mock_response_page1, mock_response_page2]
 
-        api = HeadHunterAPI()
+        api = HeadHunterAPI(session=mock_session)
         vacancies = api.get_vacancies(keyword="Python", pages=2)
 
         self.assertEqual(len(vacancies), 2)
         self.assertEqual(vacancies[0]["name"], "Python Developer")
         self.assertEqual(vacancies[1]["name"], "Data Scientist")
         self.assertEqual(mock_get.call_count, 2)
-        mock_get.assert_any_call(api.BASE_URL, params={"text": "Python", "per_page": 50, "page": 0})
-        mock_get.assert_any_call(api.BASE_URL, params={"text": "Python", "per_page": 50, "page": 1})
+        mock_get.assert_any_call(api.BASE_URL, params={"text": "Python", "per_page": 50, "page": 0},
+                                 timeout=api.timeout)
+        mock_get.assert_any_call(api.BASE_URL, params={"text": "Python", "per_page": 50, "page": 1},
+                                 timeout=api.timeout)
+
+    def test_iter_vacancies_stops_at_last_page(self):
+        """Тест: генератор не запрашивает страницы после последней, о которой сообщил API."""
+        mock_session = Mock()
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = b"{}"
+        mock_response.json.return_value = {"items": [{"id": "1", "name": "Python Developer"}], "pages": 1}
+        mock_session.get.return_value = mock_response
+
+        api = HeadHunterAPI(session=mock_session)
+        vacancies = api.iter_vacancies(keyword="Python", pages=5)
+
+        mock_session.get.assert_not_called()  # Ничего не запрошено до начала итерации
+        self.assertEqual([v["id"] for v in vacancies], ["1"])
+        self.assertEqual(mock_session.get.call_count, 1)
+
+    def test_iter_pages_extra_params(self):
+        """Тест: дополнительные параметры (сортировка, дата) передаются в запрос каждой страницы."""
+        mock_session = Mock()
+        mock_session.get.return_value = Mock(status_code=200, content=b"{}",
+                                             json=Mock(return_value={"items": [], "pages": 1}))
+
+        api = HeadHunterAPI(session=mock_session)
+        params = {"order_by": "publication_time", "date_from": "2024-05-01T10:00:00+0300"}
+        self.assertEqual(list(api.iter_pages("Python", 3, params)), [[]])
+
+        mock_session.get.assert_called_once_with(
+            api.BASE_URL, params={"text": "Python", "per_page": 50, "page": 0, **params}, timeout=api.timeout
+        )
+
+    def test_connect_to_api_retries_temporary_errors(self):
+        """Тест: 503 повторяется с учетом Retry-After, страница не теряется."""
+        mock_session = Mock()
+        throttled = Mock(status_code=503, reason="Service Unavailable", headers={"Retry-After": "2"})
+        success = Mock(status_code=200)
+        mock_session.get.side_effect = [throttled, success]
+        sleep = Mock()
+
+        requests_before, retries_before = metrics.get_counter("api_requests"), metrics.get_counter("api_retries")
+        api = HeadHunterAPI(session=mock_session, retry_policy=RetryPolicy(sleep=sleep))
+        response = api._connect_to_api(text="Python")
+
+        self.assertIs(response, success)
+        self.assertEqual(mock_session.get.call_count, 2)
+        sleep.assert_called_once_with(2.0)
+        self.assertEqual(metrics.get_counter("api_requests") - requests_before, 2)
+        self.assertEqual(metrics.get_counter("api_retries") - retries_before, 1)
+
+    def test_connect_to_api_retries_exhausted(self):
+        """Тест: после исчерпания повторов выбрасывается ValueError."""
+        mock_session = Mock()
+        mock_session.get.return_value = Mock(status_code=429, reason="Too Many Requests", headers={})
+
+        api = HeadHunterAPI(session=mock_session, retry_policy=RetryPolicy(max_retries=2, sleep=Mock()))
+        with self.assertRaises(ValueError):
+            api._connect_to_api(text="Python")
+        self.assertEqual(mock_session.get.call_count, 3)
+
+    def test_connect_to_api_circuit_breaker(self):
+        """Тест: после серии сбоев предохранитель перестает пропускать запросы."""
+        mock_session = Mock()
+        mock_session.get.side_effect = requests.ConnectionError("refused")
+
+        api = HeadHunterAPI(
+            session=mock_session,
+            retry_policy=RetryPolicy(max_retries=0),
+            circuit_breaker=CircuitBreaker(failure_threshold=2, recovery_timeout=60),
+        )
+        for _ in range(2):
+            with self.assertRaises(ConnectionError):
+                api._connect_to_api(text="Python")
+        with self.assertRaises(CircuitOpenError):
+            api._connect_to_api(text="Python")
+        self.assertEqual(mock_session.get.call_count, 2)
+
+    def test_connect_to_api_client_error_closes_circuit(self):
+        """Тест: ответ 4xx на пробный запрос замыкает предохранитель — сервер доступен."""
+        mock_session = Mock()
+        mock_session.get.side_effect = [
+            Mock(status_code=503, reason="Service Unavailable", headers={}),
+            Mock(status_code=400, reason="Bad Request", headers={}),
+            Mock(status_code=200),
+        ]
+        clock = Mock(return_value=0.0)
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=60, clock=clock)
+        api = HeadHunterAPI(session=mock_session, retry_policy=RetryPolicy(max_retries=0), circuit_breaker=breaker)
+
+        with self.assertRaises(ValueError):
+            api._connect_to_api(text="Python")
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        clock.return_value = 60.0
+        with self.assertRaises(ValueError):
+            api._connect_to_api(text="Python")
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+        clock.return_value = 1000.0
+        self.assertEqual(api._connect_to_api(text="Python").status_code, 200)
+
+    def test_get_vacancies_cached(self):
+        """Тест: свежий ответ берется из кеша, устаревший перепроверяется по ETag."""
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        clock = Mock(return_value=0.0)
+        cache = ResponseCache(directory, ttl=60, clock=clock)
+        ETagHHHandler.requests_seen = []
+        before = {name: metrics.get_counter(name) for name in ("api_cache_hits", "api_cache_misses",
+                                                               "api_cache_revalidated", "api_bytes_read")}
+
+        with StubHHServer(handler=ETagHHHandler) as server:
+            api = HeadHunterAPI(cache=cache)
+            api.BASE_URL = server.url
+
+            first = api.get_vacancies(keyword="Python")
+            second = api.get_vacancies(keyword=" python")  # Тот же нормализованный запрос
+            clock.return_value = 120.0
+            third = api.get_vacancies(keyword="Python")
+
+        self.assertEqual(first, second)
+        self.assertEqual(first, third)
+        self.assertEqual(ETagHHHandler.requests_seen, [None, '"v1"'])
+        delta = {name: metrics.get_counter(name) - value for name, value in before.items()}
+        self.assertEqual([delta["api_cache_hits"], delta["api_cache_misses"], delta["api_cache_revalidated"]],
+                         [1, 1, 1])
+        self.assertGreater(delta["api_bytes_read"], 0)
+
+    def test_get_vacancies_concurrent(self):
+        """Тест параллельного получения страниц: порядок сохраняется, время сокращается."""
+        pages = 8
+        with StubHHServer(handler=StubHHHandler) as server:
+            api = HeadHunterAPI()
+            api.BASE_URL = server.url
+
+            start = time.perf_counter()
+            vacancies = api.get_vacancies(keyword="Python", pages=pages, max_workers=pages)
+            elapsed = time.perf_counter() - start
+
+        self.assertEqual([v["id"] for v in vacancies], [str(page) for page in range(pages)])
+        self.assertLess(elapsed, pages * StubHHHandler.delay / 2)
+
+    def test_get_vacancies_invalid_workers(self):
+        """Тест: количество потоков должно быть положительным."""
+        with self.assertRaises(ValueError):
+            HeadHunterAPI().get_vacancies(keyword="Python", max_workers=0)
+
+    def test_custom_transport(self):
+        """Тест: пользовательский транспорт получает запросы с заголовками и таймаутом."""
+        transport = CannedTransport({"items": [{"id": "1", "name": "Python Developer"}]})
+        api = HeadHunterAPI(transport=transport, timeout=3)
+
+        vacancies = api.get_vacancies(keyword="Python")
+
+        self.assertEqual(vacancies, [{"id": "1", "name": "Python Developer"}])
+        request, kwargs = transport.requests[0]
+        self.assertIn("gzip", request.headers["Accept-Encoding"])
+        self.assertEqual(request.headers["User-Agent"], api.USER_AGENT)
+        self.assertEqual(kwargs["timeout"], 3)
+
+    def test_get_raw_page(self):
+        """Тест: тело ответа возвращается без разбора и сохраняется в кеш, повторный запрос берется из кеша."""
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        transport = CannedTransport({"items": [{"id": "1"}], "pages": 1})
+        api = HeadHunterAPI(transport=transport, cache=ResponseCache(directory))
+
+        raw_page = api.get_raw_page(keyword="Python", page=2)
+        cached_page = api.get_raw_page(keyword="Python", page=2)
+
+        self.assertEqual(raw_page, b'{"items": [{"id": "1"}], "pages": 1}')
+        self.assertEqual(cached_page, {"items": [{"id": "1"}], "pages": 1})
+        self.assertEqual(len(transport.requests), 1)
+        self.assertTrue(transport.requests[0][0].url.endswith("page=2"))
+
+    def test_connect_to_api_timeout(self):
+        """Тест: зависший ответ прерывается по таймауту и превращается в ConnectionError."""
+        with StubHHServer(handler=StubHHHandler) as server:
+            with HeadHunterAPI(timeout=0.05, retry_policy=RetryPolicy(max_retries=0)) as api:
+                api.BASE_URL = server.url
+                with self.assertRaises(ConnectionError):
+                    api.get_vacancies(keyword="Python")
+
+
+@unittest.skipIf(aiohttp is None, "aiohttp не установлен")
+class TestAsyncHeadHunterAPI(unittest.IsolatedAsyncioTestCase):
+    """Тесты для класса AsyncHeadHunterAPI."""
+
+    async def test_get_vacancies(self):
+        """Тест: страницы запрашиваются одновременно, результат в порядке страниц."""
+        pages = 8
+        with StubHHServer(handler=StubHHHandler) as server:
+            async with AsyncHeadHunterAPI(max_concurrency=pages) as api:
+                api.BASE_URL = server.url
+
+                start = time.perf_counter()
+                vacancies = await api.get_vacancies(keyword="Python", pages=pages)
+                elapsed = time.perf_counter() - start
+
+        self.assertEqual([v["id"] for v in vacancies], [str(page) for page in range(pages)])
+        self.assertLess(elapsed, pages * StubHHHandler.delay / 2)
+
+    async def test_iter_pages(self):
+        """Тест: асинхронный генератор отдает все страницы."""
+        with StubHHServer(handler=StubHHHandler) as server:
+            async with AsyncHeadHunterAPI() as api:
+                api.BASE_URL = server.url
+                pages = {page: items async for page, items in api.iter_pages(keyword="Python", pages=3)}
+
+        self.assertEqual(sorted(pages), [0, 1, 2])
+        self.assertEqual(pages[2], [{"id": "2", "name": "Vacancy 2"}])
+
+    async def test_status_error(self):
+        """Тест: неуспешный статус превращается в ValueError, как в синхронном клиенте."""
+        with StubHHServer(handler=NotFoundHHHandler) as server:
+            async with AsyncHeadHunterAPI() as api:
+                api.BASE_URL = server.url
+                with self.assertRaises(ValueError) as context:
+                    await api.get_vacancies(keyword="Python")
+        self.assertIn("Ошибка подключения к API", str(context.exception))
+
+    async def test_status_error_closes_circuit(self):
+        """Тест: ответ 404 на пробный запрос замыкает предохранитель."""
+        clock = Mock(return_value=0.0)
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=60, clock=clock)
+        breaker.record_failure()
+        clock.return_value = 60.0
+        with StubHHServer(handler=NotFoundHHHandler) as server:
+            async with AsyncHeadHunterAPI(circuit_breaker=breaker) as api:
+                api.BASE_URL = server.url
+                with self.assertRaises(ValueError):
+                    await api.get_vacancies(keyword="Python")
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+    async def test_timeout(self):
+        """Тест: таймаут превращается в ConnectionError."""
+        with StubHHServer(handler=StubHHHandler) as server:
+            async with AsyncHeadHunterAPI(timeout=0.05, retry_policy=RetryPolicy(max_retries=0)) as api:
+                api.BASE_URL = server.url
+                with self.assertRaises(ConnectionError):
+                    await api.get_vacancies(keyword="Python")
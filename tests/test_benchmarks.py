@@ -0,0 +1,44 @@
+import unittest
+from benchmarks.generators import make_hh_items, make_records
+from benchmarks.run import compare, run_benchmarks
+from src.vacancy import Vacancy
+
+
+class TestBenchmarks(unittest.TestCase):
+    """Тесты набора замеров производительности."""
+
+    def test_generators_are_reproducible(self):
+        """Тест: синтетические данные детерминированы и проходят валидацию Vacancy."""
+        items = list(make_hh_items(200, seed=1))
+        self.assertEqual(items, list(make_hh_items(200, seed=1)))
+        self.assertEqual(len({item["id"] for item in items}), 200)
+        self.assertEqual(len(Vacancy.from_hh_items(items)), 200)
+        self.assertEqual(len(Vacancy.from_dicts(make_records(200))), 200)
+
+    def test_run_produces_report(self):
+        """Тест: запуск на малом масштабе дает отчет со временем и памятью каждого замера."""
+        report = run_benchmarks(scales=[50], repeat=1, latency=0, fetch_pages=2, log=lambda line: None,
+                                only=["vacancy_from_hh_items", "json_add_many", "sqlite_add_many", "fetch_concurrent"])
+
+        self.assertEqual([(result["name"], result["scale"]) for result in report["results"]], [
+            ("vacancy_from_hh_items", 50), ("json_add_many", 50), ("sqlite_add_many", 50), ("fetch_concurrent", 2),
+        ])
+        for result in report["results"]:
+            self.assertGreater(result["seconds"], 0)
+            self.assertGreaterEqual(result["peak_bytes"], 0)
+        self.assertIn("python", report["meta"])
+
+    def test_compare_flags_regressions(self):
+        """Тест: сравнение с базовым отчетом находит замедления и рост памяти сверх порога."""
+        baseline = {"results": [
+            {"name": "json_add_many", "scale": 1000, "seconds": 0.010, "peak_bytes": 1000},
+            {"name": "rank_top_salary", "scale": 1000, "seconds": 0.005, "peak_bytes": 1000},
+        ]}
+        report = {"results": [
+            {"name": "json_add_many", "scale": 1000, "seconds": 0.100, "peak_bytes": 1000},
+            {"name": "rank_top_salary", "scale": 1000, "seconds": 0.005, "peak_bytes": 1100},
+            {"name": "filter_keywords", "scale": 1000, "seconds": 0.005, "peak_bytes": 1000},
+        ]}
+
+        regressions = compare(report, baseline, threshold=1.25)
+        self.assertEqual([(item["name"], item["time_ratio"]) for item in regressions], [("json_add_many", 10.0)])
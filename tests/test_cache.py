@@ -0,0 +1,120 @@
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest.mock import Mock, patch
+from src.cache import ResponseCache
+
+
+class TestResponseCache(unittest.TestCase):
+    """Тесты для класса ResponseCache."""
+
+    def setUp(self):
+        """Создаем временную папку кеша и управляемые часы."""
+        self.directory = tempfile.mkdtemp()
+        self.clock = Mock(return_value=1000.0)
+        self.cache = ResponseCache(self.directory, ttl=60, max_entries=2, clock=self.clock)
+
+    def tearDown(self):
+        """Удаляем временную папку кеша."""
+        shutil.rmtree(self.directory)
+
+    def test_make_key_normalizes_params(self):
+        """Тест: ключ не зависит от регистра и пробелов в поисковой строке и от порядка параметров."""
+        key = ResponseCache.make_key({"text": "Python  Developer", "page": 0, "per_page": 50})
+        self.assertEqual(key, ResponseCache.make_key({"per_page": 50, "page": "0", "text": " python developer"}))
+        self.assertNotEqual(key, ResponseCache.make_key({"text": "Python Developer", "page": 1, "per_page": 50}))
+
+    def test_put_and_get(self):
+        """Тест: сохраненный ответ читается вместе с валидаторами."""
+        self.cache.put("key", {"items": [1]}, etag='"abc"', last_modified="Mon, 01 Jan 2024 00:00:00 GMT")
+        entry = self.cache.get("key")
+
+        self.assertEqual(entry["payload"], {"items": [1]})
+        self.assertEqual(
+            ResponseCache.conditional_headers(entry),
+            {"If-None-Match": '"abc"', "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"},
+        )
+        self.assertIsNone(self.cache.get("missing"))
+
+    def test_put_raw(self):
+        """Тест: тело ответа, сохраненное без разбора, читается так же, как разобранное."""
+        self.cache.put_raw("key", '{"items": [{"name": "Разработчик"}], "pages": 1}'.encode("utf-8"), etag='"abc"')
+        entry = self.cache.get("key")
+
+        self.assertEqual(entry["payload"], {"items": [{"name": "Разработчик"}], "pages": 1})
+        self.assertEqual(entry["etag"], '"abc"')
+        self.assertTrue(self.cache.is_fresh(entry))
+
+    def test_ttl_and_refresh(self):
+        """Тест: запись устаревает по TTL и снова становится свежей после refresh."""
+        self.cache.put("key", {"items": []})
+        self.assertTrue(self.cache.is_fresh(self.cache.get("key")))
+
+        self.clock.return_value = 1060.0
+        entry = self.cache.get("key")
+        self.assertFalse(self.cache.is_fresh(entry))
+
+        self.cache.refresh("key", entry)
+        self.assertTrue(self.cache.is_fresh(self.cache.get("key")))
+
+    def test_lru_eviction(self):
+        """Тест: при превышении лимита вытесняется давно не использованная запись."""
+        self.cache.put("a", {"items": []})
+        self.clock.return_value = 1001.0
+        self.cache.put("b", {"items": []})
+        self.clock.return_value = 1002.0
+        self.cache.get("a")  # Обращение делает "a" недавно использованной
+        self.clock.return_value = 1003.0
+        self.cache.put("c", {"items": []})
+
+        self.assertIsNotNone(self.cache.get("a"))
+        self.assertIsNone(self.cache.get("b"))
+        self.assertIsNotNone(self.cache.get("c"))
+
+    def test_eviction_scans_directory_once(self):
+        """Тест: папка кеша просматривается один раз, а не при каждой записи; записи прошлых запусков учитываются."""
+        self.cache.put("old", {"items": []})
+        self.clock.return_value = 1001.0
+        cache = ResponseCache(self.directory, ttl=60, max_entries=2, clock=self.clock)
+
+        with patch("src.cache.os.listdir", wraps=os.listdir) as listdir:
+            for idx in range(5):
+                self.clock.return_value = 1002.0 + idx
+                cache.put(f"key{idx}", {"items": []})
+
+        self.assertEqual(listdir.call_count, 1)
+        self.assertEqual(len(os.listdir(self.directory)), 2)
+        self.assertIsNone(cache.get("old"))
+        self.assertIsNotNone(cache.get("key4"))
+
+    def test_concurrent_put_and_get(self):
+        """Тест: записи и чтения из нескольких потоков не ломают порядок вытеснения и соблюдают лимит."""
+        cache = ResponseCache(self.directory, ttl=60, max_entries=5)
+        errors = []
+
+        def work(worker):
+            try:
+                for idx in range(100):
+                    cache.put(f"{worker}-{idx}", {"items": [idx]})
+                    cache.get(f"{worker}-{idx // 2}")
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=work, args=(worker,)) for worker in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        cache.put("last", {"items": []})
+        self.assertEqual(len([name for name in os.listdir(self.directory) if name.endswith(".json")]), 5)
+        self.assertIsNotNone(cache.get("last"))
+
+    def test_clear(self):
+        """Тест: очистка удаляет все записи."""
+        self.cache.put("a", {"items": []})
+        self.cache.clear()
+        self.assertEqual(os.listdir(self.directory), [])
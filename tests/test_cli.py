@@ -0,0 +1,182 @@
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from unittest.mock import MagicMock, patch
+from src.cli import load_keywords, main, make_handler
+from src.file_handler import JSONLinesFileHandler, SQLiteFileHandler
+from src.pipeline import harvest_keywords
+from tests.helpers import make_item
+
+
+# Ответы API по ключевым словам: вакансия 2 находится по обоим словам
+RESULTS = {
+    "python": [make_item(1, "Python Developer", 150000, "Python, Django"),
+               make_item(2, "Fullstack Developer", 200000, "Python, JavaScript")],
+    "javascript": [make_item(2, "Fullstack Developer", 200000, "Python, JavaScript"),
+                   make_item(3, "Frontend Developer", 120000, "JavaScript, React")],
+}
+
+
+def fake_iter_vacancies(keyword, pages=1):
+    if keyword == "broken":
+        raise ConnectionError("Ошибка сети")
+    return iter(RESULTS[keyword.casefold()])
+
+
+class TestCLI(unittest.TestCase):
+    """Тесты пакетного режима."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.api = MagicMock()
+        self.api.iter_vacancies.side_effect = fake_iter_vacancies
+        self.api.__enter__.return_value = self.api
+
+    def run_main(self, *argv):
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with patch("src.cli.HeadHunterAPI", return_value=self.api), redirect_stdout(stdout), redirect_stderr(stderr):
+            code = main(list(argv))
+        return code, stdout.getvalue(), stderr.getvalue()
+
+    def test_load_keywords(self):
+        """Тест: слова из аргументов и файла объединяются без повторов и комментариев."""
+        path = os.path.join(self.directory, "keywords.txt")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write("# Языки\nPython\n\n  data   scientist \njava\n")
+
+        self.assertEqual(load_keywords(["Java", "python"], path), ["Java", "python", "data scientist"])
+
+    def test_harvest_keywords_shares_dedup(self):
+        """Тест: вакансия, найденная по нескольким словам, учитывается один раз; ошибки собираются по словам."""
+        vacancies, errors = harvest_keywords(self.api, ["Python", "broken", "JavaScript"], pages=2, workers=3)
+
+        self.assertEqual([v.get_id() for v in vacancies], ["1", "2", "3"])
+        self.assertEqual(list(errors), ["broken"])
+        self.api.iter_vacancies.assert_any_call("Python", 2)
+
+    def test_main_saves_to_backend(self):
+        """Тест: пакетный запуск сохраняет отфильтрованные вакансии и выводит топ."""
+        output = os.path.join(self.directory, "vacancies.jsonl")
+        code, stdout, _ = self.run_main("Python", "JavaScript", "--backend", "jsonl", "--output", output,
+                                        "--filter", "react", "django", "--top", "1", "--no-cache")
+
+        self.assertEqual(code, 0)
+        titles = [entry["title"] for entry in JSONLinesFileHandler(output).get_data()]
+        self.assertEqual(titles, ["Python Developer", "Frontend Developer"])
+        self.assertIn("сохранено вакансий: 2", stdout)
+        self.assertIn("1. Python Developer", stdout)
+
+    def test_main_with_processes(self):
+        """Тест: с --processes тела ответов разбираются в пуле процессов, результат тот же."""
+        self.api.get_raw_page.side_effect = lambda keyword, page: json.dumps(
+            {"items": list(fake_iter_vacancies(keyword)), "pages": 1}).encode("utf-8")
+        output = os.path.join(self.directory, "vacancies.json")
+        code, stdout, _ = self.run_main("python", "javascript", "broken", "--output", output, "--processes", "2",
+                                        "--no-cache")
+
+        self.assertEqual(code, 1)
+        self.assertIn("сохранено вакансий: 3", stdout)
+        with self.assertRaises(SystemExit) as context:
+            self.run_main("python", "--processes", "0")
+        self.assertEqual(context.exception.code, 2)
+
+    def test_main_incremental(self):
+        """Тест: с --incremental повторный запуск запрашивает только новые вакансии и не сохраняет известные."""
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(self.directory)
+        published = dict(RESULTS, python=[dict(item, published_at=f"2024-05-0{idx}T12:00:00+0300")
+                                          for idx, item in enumerate(reversed(RESULTS["python"]), start=1)])
+        self.api.iter_pages.side_effect = lambda keyword, pages, params: iter([published[keyword]])
+        output = os.path.join(self.directory, "vacancies.json")
+
+        code, stdout, _ = self.run_main("python", "--output", output, "--pages", "2", "--incremental", "--no-cache")
+        self.assertEqual(code, 0)
+        self.assertIn("сохранено вакансий: 2", stdout)
+
+        code, stdout, _ = self.run_main("python", "--output", output, "--pages", "2", "--incremental", "--no-cache")
+        self.assertEqual(code, 0)
+        self.assertIn("сохранено вакансий: 0", stdout)
+        self.assertEqual(self.api.iter_pages.call_args.args[2]["date_from"], "2024-05-02T12:00:00+0300")
+        with open(output, "r", encoding="utf-8") as file:
+            self.assertEqual(len(json.load(file)), 2)
+        with self.assertRaises(SystemExit) as context:
+            self.run_main("python", "--incremental", "--filter", "django")
+        self.assertEqual(context.exception.code, 2)
+
+    def test_main_machine_readable_top(self):
+        """Тест: топ в формате JSON Lines выводится в stdout без сводки."""
+        output = os.path.join(self.directory, "vacancies.json")
+        code, stdout, stderr = self.run_main("python", "javascript", "--output", output, "--top", "2",
+                                             "--format", "jsonl", "--no-cache")
+
+        self.assertEqual(code, 0)
+        self.assertEqual([json.loads(line)["salary_from"] for line in stdout.splitlines()], [200000, 150000])
+        self.assertIn("сохранено вакансий: 3", stderr)
+
+    def test_main_writes_metrics(self):
+        """Тест: метрики и профиль выгрузки сохраняются в файлы по флагам."""
+        output = os.path.join(self.directory, "vacancies.db")
+        metrics_path = os.path.join(self.directory, "metrics.json")
+        profile_path = os.path.join(self.directory, "run.prof")
+        code, _, _ = self.run_main("python", "javascript", "--backend", "sqlite", "--output", output, "--no-cache",
+                                   "--metrics", metrics_path, "--profile", profile_path, "--trace-memory")
+
+        self.assertEqual(code, 0)
+        with open(metrics_path, "r", encoding="utf-8") as file:
+            report = json.load(file)
+        self.assertGreaterEqual(report["counters"]["records_deduped"], 1)
+        self.assertGreaterEqual(report["counters"]["storage_records_written"], 3)
+        self.assertIn("harvest", report["timers"])
+        self.assertIn("tracemalloc_peak_bytes", report["gauges"])
+        self.assertTrue(os.path.exists(profile_path))
+
+    def test_serve_closes_sqlite_handler(self):
+        """Тест: после остановки сервиса соединение с базой SQLite закрывается."""
+        output = os.path.join(self.directory, "vacancies.db")
+        with patch("src.cli.serve") as serve, patch.object(SQLiteFileHandler, "close") as close:
+            code, _, _ = self.run_main("python", "--serve", "--backend", "sqlite", "--output", output, "--no-cache")
+
+        self.assertEqual(code, 0)
+        serve.assert_called_once()
+        close.assert_called_once()
+
+    def test_serve_writes_metrics(self):
+        """Тест: флаги метрик и профилирования действуют и в режиме сервиса."""
+        metrics_path = os.path.join(self.directory, "metrics.json")
+        profile_path = os.path.join(self.directory, "serve.prof")
+        with patch("src.cli.serve"):
+            code, _, _ = self.run_main("python", "--serve", "--output", os.path.join(self.directory, "v.json"),
+                                       "--no-cache", "--metrics", metrics_path, "--profile", profile_path)
+
+        self.assertEqual(code, 0)
+        self.assertTrue(os.path.exists(metrics_path))
+        self.assertTrue(os.path.exists(profile_path))
+
+    def test_main_reports_failed_keywords(self):
+        """Тест: ошибка по одному слову не прерывает выгрузку и отражается в коде завершения."""
+        output = os.path.join(self.directory, "vacancies.json")
+        code, stdout, stderr = self.run_main("python", "broken", "--output", output, "--no-cache")
+
+        self.assertEqual(code, 1)
+        self.assertIn("broken", stderr)
+        with open(output, "r", encoding="utf-8") as file:
+            self.assertEqual(len(json.load(file)), 2)
+
+    def test_main_requires_keywords(self):
+        """Тест: запуск без ключевых слов завершается ошибкой аргументов."""
+        with self.assertRaises(SystemExit) as context:
+            self.run_main("--pages", "2")
+        self.assertEqual(context.exception.code, 2)
+
+    def test_make_handler(self):
+        """Тест: хранилище выбирается по названию."""
+        handler = make_handler("sqlite", os.path.join(self.directory, "vacancies.db"))
+        self.assertIsInstance(handler, SQLiteFileHandler)
+        handler.close()
+        with self.assertRaises(ValueError):
+            make_handler("csv")
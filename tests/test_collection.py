@@ -0,0 +1,99 @@
+import unittest
+from src.collection import VacancyCollection
+from src.currency import ExchangeRates
+from src.vacancy import Vacancy
+
+
+class TestVacancyCollection(unittest.TestCase):
+    """Тесты для класса VacancyCollection."""
+
+    def setUp(self):
+        """Создание коллекции из тестовых вакансий."""
+        self.vacancies = [
+            Vacancy("Python Developer", "http://example.com/1", 100000, 150000, "Разработка на Python"),
+            Vacancy("Java Developer", "http://example.com/2", 120000, None, "Разработка на Java"),
+            Vacancy("Intern", "http://example.com/3", None, None, "Стажировка"),
+            Vacancy("Go Developer", "http://example.com/4", None, 200000, "Разработка на Go"),
+        ]
+        self.collection = VacancyCollection(self.vacancies)
+
+    def titles(self, vacancies):
+        return [vacancy.get_title() for vacancy in vacancies]
+
+    def test_materialization(self):
+        """Тест: строки коллекции превращаются в эквивалентные объекты Vacancy."""
+        self.assertEqual(len(self.collection), 4)
+        self.assertEqual([v.to_dict() for v in self.collection], [v.to_dict() for v in self.vacancies])
+        self.assertEqual(self.collection[-1].get_title(), "Go Developer")
+        with self.assertRaises(IndexError):
+            self.collection[4]
+
+    def test_many_currencies(self):
+        """Тест: номер валюты не переполняется, когда валют больше 256."""
+        codes = [chr(65 + idx // 26 % 26) + chr(65 + idx % 26) + "X" for idx in range(300)]
+        collection = VacancyCollection(Vacancy("Developer", f"http://example.com/{idx}", 1000, None, "Описание", code)
+                                       for idx, code in enumerate(codes))
+
+        self.assertEqual([vacancy.get_currency() for vacancy in collection], codes)
+
+    def test_from_dicts(self):
+        """Тест: коллекция строится напрямую из сохраненных словарей."""
+        collection = VacancyCollection.from_dicts(v.to_dict() for v in self.vacancies)
+        self.assertEqual([v.to_dict() for v in collection], [v.to_dict() for v in self.vacancies])
+
+    def test_argsort(self):
+        """Тест: сортировка по разным ключам с пропусками в конце или в начале."""
+        self.assertEqual(self.collection.argsort("average"), [3, 0, 1, 2])
+        self.assertEqual(self.collection.argsort("salary_from"), [1, 0, 2, 3])
+        self.assertEqual(self.collection.argsort("salary_to", nulls_last=False), [1, 2, 3, 0])
+        self.assertEqual(self.collection.argsort("average", descending=False), [1, 0, 3, 2])
+        with self.assertRaises(ValueError):
+            self.collection.argsort("title")
+
+    def test_argsort_matches_vacancy_ordering(self):
+        """Тест: порядок по средней зарплате совпадает с сортировкой объектов Vacancy."""
+        expected = sorted(self.vacancies, reverse=True)
+        self.assertEqual(self.titles(self.collection.take(self.collection.argsort())), self.titles(expected))
+
+    def test_filter_by_salary(self):
+        """Тест: фильтрация по диапазону зарплаты без вакансий без зарплаты."""
+        self.assertEqual(self.collection.filter_by_salary(min_salary=120000), [0, 1, 3])
+        self.assertEqual(self.collection.filter_by_salary(max_salary=150000, key="salary_to"), [0])
+        self.assertEqual(self.collection.filter_by_salary(), [0, 1, 3])
+
+    def test_top_n(self):
+        """Тест: топ-N по зарплате."""
+        top = self.collection.top_n(2, key="salary_from")
+        self.assertEqual(self.titles(top), ["Java Developer", "Python Developer"])
+        self.assertEqual(self.collection.top_n(0), [])
+
+    def test_nbytes(self):
+        """Тест: оценка занимаемой памяти растет с количеством строк."""
+        size = self.collection.nbytes()
+        self.collection.append(self.vacancies[0])
+        self.assertGreater(self.collection.nbytes(), size)
+
+    def test_normalized(self):
+        """Тест: приведение зарплат к базовой валюте и сумме на руки меняет ранжирование."""
+        collection = VacancyCollection([
+            Vacancy("Rub Developer", "http://example.com/1", 150000, None, "Описание", "RUR", False),
+            Vacancy("Usd Developer", "http://example.com/2", 2000, 3000, "Описание", "USD", True),
+            Vacancy("Kzt Developer", "http://example.com/3", 500000, None, "Описание", "KZT"),
+        ])
+        rates = ExchangeRates({"USD": 0.01, "KZT": 5.0})
+
+        self.assertEqual(self.titles(collection.top_n(3, key="salary_from")),
+                         ["Kzt Developer", "Rub Developer", "Usd Developer"])
+
+        normalized = collection.normalized(rates)
+        self.assertEqual(normalized.top_n_indices(3, key="salary_from"), [1, 0, 2])
+        usd = normalized[1]
+        self.assertEqual((usd.get_salary_from(), usd.get_salary_to()), (174000, 261000))
+        self.assertEqual((usd.get_currency(), usd.get_gross()), ("RUR", False))
+        self.assertIsNone(normalized[2].get_gross())
+        self.assertEqual(normalized[2].get_salary_from(), 100000)
+
+        # Исходная коллекция не изменилась и остается независимой
+        collection.append(self.vacancies[0])
+        self.assertEqual(len(normalized), 3)
+        self.assertEqual(collection[1].get_currency(), "USD")
@@ -0,0 +1,52 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from src.currency import ExchangeRates
+
+
+class TestExchangeRates(unittest.TestCase):
+    """Тесты для класса ExchangeRates."""
+
+    def setUp(self):
+        """Создание таблицы курсов."""
+        self.rates = ExchangeRates({"USD": 0.01, "KZT": 5.0}, base="RUR", income_tax=0.13)
+
+    def test_convert(self):
+        """Тест: перевод в базовую валюту и приведение gross к сумме на руки."""
+        self.assertEqual(self.rates.convert(1000, "USD"), 100000)
+        self.assertEqual(self.rates.convert(500000, "kzt"), 100000)
+        self.assertEqual(self.rates.convert(100000, "RUR", gross=True), 87000)
+        self.assertEqual(self.rates.convert(100000, "RUR", gross=True, net=False), 100000)
+        self.assertEqual(self.rates.convert(100000, "RUR", gross=False), 100000)
+        self.assertIsNone(self.rates.convert(None, "USD"))
+
+    def test_unknown_currency(self):
+        """Тест: отсутствие курса валюты приводит к ошибке, а не к неверному ранжированию."""
+        with self.assertRaises(ValueError):
+            self.rates.factor("EUR")
+
+    def test_invalid_table(self):
+        """Тест: валидация ставки налога и курсов."""
+        with self.assertRaises(ValueError):
+            ExchangeRates({"USD": 0.01}, income_tax=1.5)
+        with self.assertRaises(ValueError):
+            ExchangeRates({"USD": 0})
+
+    def test_from_file_is_cached(self):
+        """Тест: файл курсов читается один раз и перечитывается после изменения."""
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, "rates.json")
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({"base": "RUR", "rates": {"USD": 0.01}}, file)
+
+        rates = ExchangeRates.from_file(path)
+        self.assertIs(ExchangeRates.from_file(path), rates)
+        self.assertEqual(rates.convert(1, "USD"), 100)
+
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({"base": "RUR", "rates": {"USD": 0.02}}, file)
+        os.utime(path, (0, os.path.getmtime(path) + 10))
+        self.assertEqual(ExchangeRates.from_file(path).convert(1, "USD"), 50)
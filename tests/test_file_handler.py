@@ -1,6 +1,12 @@
 import unittest
 import os
-from src.file_handler import JSONFileHandler
+import shutil
+import stat
+import tempfile
+from unittest.mock import patch
+import json
+import multiprocessing
+from src.file_handler import JSONFileHandler, JSONLinesFileHandler, SQLiteFileHandler
 
 
 class TestJSONFileHandler(unittest.TestCase):
@@ -47,3 +53,327 @@ class TestJSONFileHandler(unittest.TestCase):
         data = self.handler.get_data()
         self.assertEqual(len(data), 1)
         self.assertEqual(data[0]["title"], "Python Developer")
+
+
+def _add_batch(path: str, start: int) -> None:
+    """Добавляет пакет вакансий из отдельного процесса."""
+    handler = JSONFileHandler(path)
+    for i in range(start, start + 20):
+        handler.add_data({"title": f"Vacancy {i}", "url": f"http://example.com/{i}"})
+
+
+class TestJSONFileHandlerAddMany(unittest.TestCase):
+    """Тесты пакетного добавления в JSONFileHandler."""
+
+    def setUp(self):
+        """Создаем обработчик, работающий с файлом во временной папке."""
+        self.directory = tempfile.mkdtemp()
+        self.handler = JSONFileHandler(os.path.join(self.directory, "vacancies.json"))
+
+    def tearDown(self):
+        """Удаляем временную папку."""
+        shutil.rmtree(self.directory)
+
+    def test_add_many_dedupes_and_upserts(self):
+        """Тест: дубликаты по ссылке не добавляются, измененная запись заменяет старую."""
+        self.handler.add_data({"title": "Python Developer", "url": "http://example.com/1", "salary_from": 100})
+        self.handler.add_many([
+            {"title": "Java Developer", "url": "http://example.com/2", "salary_from": 200},
+            {"title": "Java Developer", "url": "http://example.com/2", "salary_from": 200},
+            {"title": "Python Developer", "url": "http://example.com/1", "salary_from": 150},
+        ])
+
+        data = self.handler.get_data()
+        self.assertEqual([entry["url"] for entry in data], ["http://example.com/1", "http://example.com/2"])
+        self.assertEqual(data[0]["salary_from"], 150)
+
+    def test_add_many_dedupes_by_vacancy_id(self):
+        """Тест: ссылки API и сайта на одну вакансию hh.ru считаются одной записью."""
+        self.handler.add_data({"title": "Python Developer", "url": "https://api.hh.ru/vacancies/42?host=hh.ru"})
+        self.handler.add_data({"title": "Python Developer", "url": "https://hh.ru/vacancy/42", "salary_from": 100})
+
+        self.assertEqual(self.handler.get_data(), [
+            {"title": "Python Developer", "url": "https://hh.ru/vacancy/42", "salary_from": 100},
+        ])
+
+    def test_add_many_single_read_and_write(self):
+        """Тест: пакет любого размера читает и записывает файл один раз."""
+        records = ({"title": f"Vacancy {i}", "url": f"http://example.com/{i}"} for i in range(1000))
+        with patch.object(self.handler, "_read_file", wraps=self.handler._read_file) as read_file, \
+                patch.object(self.handler, "_write_file", wraps=self.handler._write_file) as write_file:
+            self.handler.add_many(records)
+
+        self.assertEqual(read_file.call_count, 1)
+        self.assertEqual(write_file.call_count, 1)
+        self.assertEqual(len(self.handler.get_data()), 1000)
+
+    def test_add_many_without_changes_does_not_write(self):
+        """Тест: повторное добавление тех же записей не перезаписывает файл."""
+        records = [{"title": "Python Developer", "salary": 100000}]
+        self.handler.add_many(records)
+        with patch.object(self.handler, "_write_file") as write_file:
+            self.handler.add_many(records)
+        write_file.assert_not_called()
+
+
+class TestJSONFileHandlerSafety(unittest.TestCase):
+    """Тесты атомарной записи и блокировок JSONFileHandler."""
+
+    def setUp(self):
+        """Создаем обработчик, работающий с файлом во временной папке."""
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "vacancies.json")
+        self.handler = JSONFileHandler(self.path)
+
+    def tearDown(self):
+        """Удаляем временную папку."""
+        shutil.rmtree(self.directory)
+
+    def test_failed_write_keeps_original(self):
+        """Тест: сбой посреди записи не портит файл и не оставляет временных файлов."""
+        self.handler.add_data({"title": "Python Developer", "salary": 100000})
+
+        with patch("src.file_handler.json.dump", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                self.handler.add_data({"title": "Java Developer", "salary": 120000})
+
+        self.assertEqual(self.handler.get_data(), [{"title": "Python Developer", "salary": 100000}])
+        self.assertEqual(sorted(os.listdir(self.directory)), ["vacancies.json", "vacancies.json.lock"])
+
+    @unittest.skipIf(os.name == "nt", "права доступа POSIX")
+    def test_write_keeps_file_mode(self):
+        """Тест: атомарная запись сохраняет права существующего файла, новый файл получает права по umask."""
+        umask = os.umask(0o022)
+        self.addCleanup(os.umask, umask)
+        self.handler.add_data({"title": "Python Developer", "salary": 100000})
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o644)
+
+        os.chmod(self.path, 0o640)
+        self.handler.add_data({"title": "Java Developer", "salary": 120000})
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o640)
+
+    def test_corrupted_file_is_not_overwritten(self):
+        """Тест: поврежденный файл вызывает ошибку, а не перезаписывается пустыми данными."""
+        with open(self.path, "w", encoding="utf-8") as file:
+            file.write('[{"title": "Python')
+
+        with self.assertRaises(ValueError):
+            self.handler.add_data({"title": "Java Developer", "salary": 120000})
+        with open(self.path, "r", encoding="utf-8") as file:
+            self.assertEqual(file.read(), '[{"title": "Python')
+
+    def test_concurrent_processes(self):
+        """Тест: параллельные процессы не теряют записи друг друга."""
+        processes = [multiprocessing.Process(target=_add_batch, args=(self.path, start)) for start in (0, 20, 40, 60)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+        self.assertEqual(len(self.handler.get_data()), 80)
+
+
+class TestJSONLinesFileHandler(unittest.TestCase):
+    """Тесты для класса JSONLinesFileHandler."""
+
+    def setUp(self):
+        """Создаем обработчик, работающий с файлом во временной папке."""
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "vacancies.jsonl")
+        self.handler = JSONLinesFileHandler(self.path)
+
+    def tearDown(self):
+        """Удаляем временную папку."""
+        shutil.rmtree(self.directory)
+
+    def _lines(self):
+        with open(self.path, "r", encoding="utf-8") as file:
+            return file.read().splitlines()
+
+    def test_add_appends_without_duplicates(self):
+        """Тест: добавление дописывает строки и пропускает дубликаты."""
+        vacancy = {"title": "Python Developer", "url": "http://example.com/1"}
+        self.handler.add_data(vacancy)
+        self.handler.add_data(vacancy)
+        self.handler.add_data({"title": "Java Developer", "url": "http://example.com/2"})
+
+        self.assertEqual(len(self._lines()), 2)
+        self.assertEqual([entry["title"] for entry in self.handler.get_data()], ["Python Developer", "Java Developer"])
+
+    def test_update_replaces_record(self):
+        """Тест: измененная запись с той же ссылкой заменяет старую версию."""
+        self.handler.add_data({"title": "Python Developer", "url": "http://example.com/1", "salary_from": 100})
+        self.handler.add_data({"title": "Python Developer", "url": "http://example.com/1", "salary_from": 150})
+
+        self.assertEqual(self.handler.get_data(), [
+            {"title": "Python Developer", "url": "http://example.com/1", "salary_from": 150},
+        ])
+
+    def test_update_by_vacancy_id_with_new_url(self):
+        """Тест: новая версия вакансии с другой ссылкой заменяет старую, а не дублирует ее."""
+        self.handler.add_data({"title": "Python Developer", "url": "https://api.hh.ru/vacancies/42"})
+        self.handler.add_data({"title": "Python Developer", "url": "https://hh.ru/vacancy/42"})
+        self.handler.add_data({"title": "Python Developer", "url": "https://hh.ru/vacancy/42"})
+
+        self.assertEqual(self.handler.get_data(), [{"title": "Python Developer", "url": "https://hh.ru/vacancy/42"}])
+        self.assertEqual(len(self._lines()), 2)  # Запись и новая версия, без надгробия
+
+    def test_reads_legacy_update_tombstones(self):
+        """Тест: файлы, где обновление записано через надгробие по ссылке, читаются как прежде."""
+        with open(self.handler._filename, "w", encoding="utf-8") as file:
+            file.write('{"title": "Old", "url": "https://api.hh.ru/vacancies/42"}\n'
+                       '{"__deleted__": {"url": "https://api.hh.ru/vacancies/42"}}\n'
+                       '{"title": "New", "url": "https://hh.ru/vacancy/42"}\n'
+                       '{"__deleted__": {"url": "https://api.hh.ru/vacancies/42"}}\n')
+
+        self.assertEqual(self.handler.get_data(), [{"title": "New", "url": "https://hh.ru/vacancy/42"}])
+
+    def test_delete_with_tombstone_and_compact(self):
+        """Тест: удаление записывает надгробие, compact физически убирает удаленные строки."""
+        self.handler.add_many([
+            {"title": "Python Developer", "salary": 100000},
+            {"title": "Java Developer", "salary": 120000},
+        ])
+        self.handler.delete_data({"title": "Python Developer"})
+        self.handler.add_data({"title": "Python Developer", "salary": 130000})  # Добавлена после удаления
+
+        self.assertEqual(len(self._lines()), 4)
+        expected = [{"title": "Java Developer", "salary": 120000}, {"title": "Python Developer", "salary": 130000}]
+        self.assertEqual(self.handler.get_data(), expected)
+
+        self.handler.compact()
+        self.assertEqual(len(self._lines()), 2)
+        self.assertEqual(self.handler.get_data(), expected)
+
+    def test_iter_data_is_lazy(self):
+        """Тест: iter_data возвращает генератор записей."""
+        self.handler.add_data({"title": "Python Developer", "salary": 100000})
+        records = self.handler.iter_data()
+        self.assertEqual(next(records)["title"], "Python Developer")
+
+    def test_iter_data_streams_snapshot(self):
+        """Тест: записи отдаются по мере чтения в порядке последнего изменения, дописанные во время чтения — нет."""
+        self.handler.add_many({"title": f"Developer {idx}", "url": f"https://hh.ru/vacancy/{idx}"} for idx in range(3))
+        self.handler.add_data({"title": "Senior Developer 0", "url": "https://hh.ru/vacancy/0"})
+
+        records = self.handler.iter_data()
+        titles = [next(records)["title"]]
+        self.handler.add_data({"title": "Developer 3", "url": "https://hh.ru/vacancy/3"})
+        titles.extend(record["title"] for record in records)
+
+        self.assertEqual(titles, ["Developer 1", "Developer 2", "Senior Developer 0"])
+
+    def test_torn_last_line_is_ignored(self):
+        """Тест: недописанная после сбоя строка пропускается и не портит следующие добавления."""
+        self.handler.add_data({"title": "Python Developer", "salary": 100000})
+        with open(self.path, "a", encoding="utf-8") as file:
+            file.write('{"title": "Jav')
+        self.handler.add_data({"title": "Go Developer", "salary": 90000})
+
+        self.assertEqual([entry["title"] for entry in self.handler.get_data()], ["Python Developer", "Go Developer"])
+
+    def test_migration_from_json(self):
+        """Тест: миграция из JSON-массива переносит все записи."""
+        source = os.path.join(self.directory, "vacancies.json")
+        records = [{"title": "Python Developer", "url": "http://example.com/1"}, {"title": "Data Scientist"}]
+        with open(source, "w", encoding="utf-8") as file:
+            json.dump(records, file)
+
+        handler = JSONLinesFileHandler.from_json_file(source, os.path.join(self.directory, "migrated.jsonl"))
+        self.assertEqual(handler.get_data(), records)
+
+
+class TestSQLiteFileHandler(unittest.TestCase):
+    """Тесты для класса SQLiteFileHandler."""
+
+    def setUp(self):
+        """Создаем базу во временной папке и наполняем ее вакансиями."""
+        self.directory = tempfile.mkdtemp()
+        self.handler = SQLiteFileHandler(os.path.join(self.directory, "vacancies.db"))
+        self.handler.add_many([
+            {"title": "Python Developer", "url": "http://example.com/1", "salary_from": 100000, "salary_to": 150000},
+            {"title": "Java Developer", "url": "http://example.com/2", "salary_from": 120000, "salary_to": None},
+            {"title": "Go Developer", "url": "http://example.com/3", "salary_from": None, "salary_to": 200000},
+            {"title": "Intern", "url": "http://example.com/4", "salary_from": None, "salary_to": None},
+        ])
+
+    def tearDown(self):
+        """Закрываем соединение и удаляем временную папку."""
+        self.handler.close()
+        shutil.rmtree(self.directory)
+
+    def test_add_dedupes_and_upserts(self):
+        """Тест: повторная запись не дублируется, измененная обновляется."""
+        self.handler.add_data({"title": "Python Developer", "url": "http://example.com/1", "salary_from": 110000,
+                               "salary_to": 150000})
+        self.handler.add_data({"title": "Python Developer", "url": "http://example.com/1", "salary_from": 110000,
+                               "salary_to": 150000})
+
+        data = self.handler.get_data()
+        self.assertEqual(len(data), 4)
+        self.assertEqual(self.handler.get_by_url("http://example.com/1")["salary_from"], 110000)
+        self.assertIsNone(self.handler.get_by_url("http://example.com/404"))
+
+    def test_migrates_url_keys_to_vacancy_ids(self):
+        """Тест: записи старой базы с ключом-ссылкой переводятся на идентификаторы вакансий."""
+        with self.handler._connection:
+            self.handler._connection.execute(
+                "INSERT INTO vacancies (key, url, title, data) VALUES (?, ?, ?, ?)",
+                ("https://hh.ru/vacancy/42", "https://hh.ru/vacancy/42", "Old", '{"title": "Old"}'),
+            )
+            self.handler._connection.execute("PRAGMA user_version = 0")  # База до перехода на идентификаторы
+        self.handler.close()
+        self.handler = SQLiteFileHandler(os.path.join(self.directory, "vacancies.db"))
+
+        self.handler.add_data({"title": "New", "url": "https://api.hh.ru/vacancies/42"})
+        self.assertEqual(len(self.handler.get_data()), 5)
+        self.assertEqual(self.handler.get_by_url("https://api.hh.ru/vacancies/42")["title"], "New")
+        self.assertEqual(self.handler._connection.execute("PRAGMA user_version").fetchone()[0], 1)
+
+        # Миграция выполняется один раз: при следующем открытии таблица не просматривается
+        self.handler.close()
+        with patch.object(SQLiteFileHandler, "_migrate_keys") as migrate:
+            self.handler = SQLiteFileHandler(os.path.join(self.directory, "vacancies.db"))
+        migrate.assert_not_called()
+
+    def test_records_without_url(self):
+        """Тест: записи без ссылки дедуплицируются по содержимому."""
+        vacancy = {"title": "Data Scientist", "salary": 200000}
+        self.handler.add_data(vacancy)
+        self.handler.add_data(vacancy)
+        self.assertEqual(self.handler.get_data().count(vacancy), 1)
+
+    def test_delete_by_indexed_and_other_fields(self):
+        """Тест: удаление как по колонкам таблицы, так и по произвольным полям записи."""
+        self.handler.add_data({"title": "Data Scientist", "salary": 200000})
+        self.handler.delete_data({"title": "Python Developer"})
+        self.handler.delete_data({"salary": 200000})
+        self.handler.delete_data({"title": "Java Developer", "salary_to": None})
+
+        self.assertEqual([entry["title"] for entry in self.handler.get_data()], ["Go Developer", "Intern"])
+
+    def test_get_by_salary(self):
+        """Тест: фильтрация по диапазону зарплаты."""
+        self.assertEqual(
+            [entry["title"] for entry in self.handler.get_by_salary(min_salary=110000)], ["Java Developer"]
+        )
+        self.assertEqual(
+            [entry["title"] for entry in self.handler.get_by_salary(max_salary=180000)], ["Python Developer"]
+        )
+
+    def test_get_top_by_salary(self):
+        """Тест: выбор топа по разным ключам без вакансий без зарплаты."""
+        self.assertEqual(
+            [entry["title"] for entry in self.handler.get_top_by_salary(2)], ["Java Developer", "Python Developer"]
+        )
+        self.assertEqual(
+            [entry["title"] for entry in self.handler.get_top_by_salary(3, key="average")],
+            ["Go Developer", "Python Developer", "Java Developer"],
+        )
+        with self.assertRaises(ValueError):
+            self.handler.get_top_by_salary(1, key="title")
+
+    def test_data_persists(self):
+        """Тест: данные сохраняются между подключениями."""
+        with SQLiteFileHandler(os.path.join(self.directory, "vacancies.db")) as handler:
+            self.assertEqual(len(handler.get_data()), 4)
@@ -0,0 +1,40 @@
+import random
+import unittest
+from src.matcher import KeywordMatcher
+
+
+class TestKeywordMatcher(unittest.TestCase):
+    """Тесты для класса KeywordMatcher."""
+
+    def test_find(self):
+        """Тест: найдены все слова, включая перекрывающиеся и вложенные."""
+        matcher = KeywordMatcher(["he", "she", "his", "hers"])
+        self.assertEqual(matcher.find("ushers"), {"he", "she", "hers"})
+        self.assertEqual(matcher.find("nothing"), set())
+
+    def test_case_insensitive_substrings(self):
+        """Тест: поиск подстрок без учета регистра, исходное написание слов сохраняется."""
+        matcher = KeywordMatcher(["Python", "C++", "ёлка"])
+        self.assertEqual(matcher.find("Разработка на PYTHON3 и c++, ЕЛКА"), {"Python", "C++", "ёлка"})
+
+    def test_count(self):
+        """Тест: подсчет вхождений для оценки релевантности."""
+        matcher = KeywordMatcher(["aa", "a"])
+        self.assertEqual(matcher.count("aaa"), {"a": 3, "aa": 2})
+
+    def test_matches(self):
+        """Тест: проверка наличия хотя бы одного слова; пустые и повторяющиеся слова игнорируются."""
+        matcher = KeywordMatcher(["Django", "", "Django"])
+        self.assertEqual(len(matcher), 1)
+        self.assertTrue(matcher.matches("Python, django"))
+        self.assertFalse(matcher.matches("Python"))
+        self.assertFalse(KeywordMatcher([]).matches("Python"))
+
+    def test_agrees_with_naive_search(self):
+        """Тест: результат совпадает с наивной проверкой подстрок на случайных данных."""
+        rng = random.Random(42)
+        for _ in range(200):
+            words = ["".join(rng.choice("abc") for _ in range(rng.randint(1, 4))) for _ in range(5)]
+            text = "".join(rng.choice("abc") for _ in range(30))
+            expected = {word for word in words if word in text}
+            self.assertEqual(KeywordMatcher(words).find(text), expected)
@@ -0,0 +1,115 @@
+import json
+import os
+import pstats
+import shutil
+import tempfile
+import threading
+import unittest
+from src.metrics import Metrics, profile
+
+
+class TestMetrics(unittest.TestCase):
+    """Тесты реестра метрик и профилирования."""
+
+    def setUp(self):
+        self.metrics = Metrics()
+
+    def test_counters_from_threads(self):
+        """Тест: увеличения счетчика из нескольких потоков не теряются."""
+        def work():
+            for _ in range(1000):
+                self.metrics.inc("api_requests")
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.metrics.inc("api_bytes_read", 512)
+
+        self.assertEqual(self.metrics.get_counter("api_requests"), 8000)
+        self.assertEqual(self.metrics.get_counter("api_bytes_read"), 512)
+        self.assertEqual(self.metrics.get_counter("api_retries"), 0)
+
+    def test_timers(self):
+        """Тест: таймер учитывает количество, сумму и максимум, в том числе при исключении."""
+        self.metrics.observe("storage_write", 0.5)
+        self.metrics.observe("storage_write", 1.5)
+        with self.assertRaises(ValueError):
+            with self.metrics.timer("parse"):
+                raise ValueError("Ошибка разбора")
+
+        @self.metrics.timed("rank")
+        def rank(values):
+            return sorted(values)
+
+        self.assertEqual(rank([2, 1]), [1, 2])
+        timers = self.metrics.to_dict()["timers"]
+        self.assertEqual(timers["storage_write"], {"count": 2, "total_seconds": 2.0, "max_seconds": 1.5})
+        self.assertEqual(timers["parse"]["count"], 1)
+        self.assertEqual(timers["rank"]["count"], 1)
+
+        self.metrics.reset()
+        self.assertEqual(self.metrics.to_dict(), {"counters": {}, "timers": {}, "gauges": {}})
+
+    def test_export(self):
+        """Тест: выгрузка в JSON-файл и в текстовый формат Prometheus."""
+        self.metrics.inc("api_cache_hits", 3)
+        self.metrics.observe("api_request", 0.25)
+        self.metrics.set_gauge("tracemalloc_peak_bytes", 1024)
+
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, "metrics.json")
+        self.metrics.write_json(path)
+        with open(path, "r", encoding="utf-8") as file:
+            self.assertEqual(json.load(file), self.metrics.to_dict())
+
+        self.assertEqual(self.metrics.to_prometheus().splitlines(), [
+            "# TYPE vacancies_api_cache_hits_total counter",
+            "vacancies_api_cache_hits_total 3",
+            "# TYPE vacancies_api_request_seconds summary",
+            "vacancies_api_request_seconds_count 1",
+            "vacancies_api_request_seconds_sum 0.25",
+            "# TYPE vacancies_api_request_seconds_max gauge",
+            "vacancies_api_request_seconds_max 0.25",
+            "# TYPE vacancies_tracemalloc_peak_bytes gauge",
+            "vacancies_tracemalloc_peak_bytes 1024",
+        ])
+        self.assertEqual(Metrics().to_prometheus(), "")
+
+    def test_profile(self):
+        """Тест: профиль cProfile сохраняется в файл, пик памяти — в метрики."""
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, "run.prof")
+
+        with profile(path, trace_memory=True, registry=self.metrics):
+            data = [str(number) for number in range(10000)]
+        del data
+
+        self.assertGreater(pstats.Stats(path).total_calls, 0)
+        self.assertGreater(self.metrics.to_dict()["gauges"]["tracemalloc_peak_bytes"], 0)
+
+    def test_profile_covers_threads(self):
+        """Тест: в профиль попадают и потоки, запущенные внутри блока (например, обработчики запросов сервиса)."""
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, "serve.prof")
+
+        def handle_request():
+            return sum(range(1000))
+
+        with profile(path, registry=self.metrics):
+            thread = threading.Thread(target=handle_request)
+            thread.start()
+            thread.join()
+
+        functions = {name for _, _, name in pstats.Stats(path).stats}
+        self.assertIn("handle_request", functions)
+
+    def test_profile_disabled(self):
+        """Тест: без параметров профилирование ничего не записывает."""
+        with profile(registry=self.metrics):
+            pass
+        self.assertEqual(self.metrics.to_dict()["gauges"], {})
@@ -0,0 +1,104 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import Mock
+from src.file_handler import JSONFileHandler
+from src.pipeline import choose_chunksize, harvest
+
+
+def make_page(keyword: str, page: int, size: int = 3, pages: int = 10) -> bytes:
+    """Формирует тело ответа API hh.ru для тестов."""
+    items = [
+        {
+            "name": f"{keyword} {page}-{i}",
+            "url": f"http://example.com/{keyword}/{page}/{i}",
+            "salary": {"from": 1000 * i, "to": None} if i else None,
+            "snippet": {"requirement": f"Знание {keyword}"},
+        }
+        for i in range(size)
+    ]
+    return json.dumps({"items": items, "pages": pages}, ensure_ascii=False).encode("utf-8")
+
+
+class TestPipeline(unittest.TestCase):
+    """Тесты параллельного разбора страниц."""
+
+    def test_choose_chunksize(self):
+        """Тест: размер пакета зависит от размера страниц и числа процессов."""
+        self.assertEqual(choose_chunksize([b"x" * 100] * 100, workers=4), 25)
+        self.assertEqual(choose_chunksize([b"x" * (1 << 20)] * 100, workers=4), 1)
+        self.assertEqual(choose_chunksize([], workers=4), 1)
+
+    def test_harvest(self):
+        """Тест: тела ответов разбираются в пуле процессов, порядок сохраняется, результат пишется в хранилище."""
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        handler = JSONFileHandler(os.path.join(directory, "vacancies.json"))
+        api = Mock()
+        api.get_raw_page.side_effect = make_page
+
+        vacancies, errors = harvest(api, ["Python", "Java"], pages=3, fetch_workers=3, parse_workers=2,
+                                    handler=handler)
+
+        self.assertEqual(errors, {})
+        self.assertEqual(api.get_raw_page.call_count, 6)
+        self.assertEqual([v.get_title() for v in vacancies][::3],
+                         ["Python 0-0", "Python 1-0", "Python 2-0", "Java 0-0", "Java 1-0", "Java 2-0"])
+        self.assertEqual(len(handler.get_data()), 18)
+
+    def test_harvest_matches_sequential(self):
+        """Тест: разбор в пуле процессов дает тот же результат, что и в текущем процессе."""
+        api = Mock()
+        api.get_raw_page.side_effect = make_page
+
+        parallel, _ = harvest(api, ["Python"], pages=8, parse_workers=2)
+        sequential, _ = harvest(api, ["Python"], pages=8, parse_workers=1)
+
+        self.assertEqual(len(parallel), 24)
+        self.assertEqual([v.to_dict() for v in parallel], [v.to_dict() for v in sequential])
+
+    def test_harvest_stops_at_last_page(self):
+        """Тест: страницы после последней, о которой сообщил API, не запрашиваются."""
+        api = Mock()
+        api.get_raw_page.side_effect = lambda keyword, page: make_page(keyword, page, pages=2)
+
+        vacancies, _ = harvest(api, ["Python"], pages=5, parse_workers=2)
+
+        self.assertEqual(api.get_raw_page.call_count, 2)
+        self.assertEqual(len(vacancies), 6)
+
+    def test_harvest_cached_pages(self):
+        """Тест: уже разобранные записи кеша обрабатываются вместе с телами ответов."""
+        def get_raw_page(keyword, page):
+            raw_page = make_page(keyword, page)
+            return json.loads(raw_page) if page % 2 else raw_page
+
+        api = Mock()
+        api.get_raw_page.side_effect = get_raw_page
+        vacancies, _ = harvest(api, ["Python"], pages=4, parse_workers=2)
+
+        self.assertEqual([v.get_title() for v in vacancies][::3],
+                         ["Python 0-0", "Python 1-0", "Python 2-0", "Python 3-0"])
+
+    def test_harvest_isolates_keyword_errors(self):
+        """Тест: ошибка по одному слову не прерывает выгрузку остальных."""
+        def get_raw_page(keyword, page):
+            if keyword == "broken":
+                raise ConnectionError("Ошибка сети")
+            return make_page(keyword, page)
+
+        api = Mock()
+        api.get_raw_page.side_effect = get_raw_page
+        vacancies, errors = harvest(api, ["Python", "broken"], pages=1, parse_workers=1)
+
+        self.assertEqual(len(vacancies), 3)
+        self.assertEqual(list(errors), ["broken"])
+
+    def test_invalid_workers(self):
+        """Тест: нулевое количество процессов или потоков отклоняется, а не заменяется числом ядер."""
+        with self.assertRaises(ValueError):
+            harvest(Mock(), ["Python"], parse_workers=0)
+        with self.assertRaises(ValueError):
+            harvest(Mock(), ["Python"], fetch_workers=0, parse_workers=1)
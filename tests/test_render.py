@@ -0,0 +1,70 @@
+import csv
+import io
+import json
+import unittest
+from unittest.mock import Mock
+from src.render import SEPARATOR, render, write_vacancies
+from src.vacancy import Vacancy
+
+
+class TestRender(unittest.TestCase):
+    """Тесты форматов вывода вакансий."""
+
+    def setUp(self):
+        self.vacancies = [
+            Vacancy("Python Developer", "http://example.com/1", 100000, 150000, "Разработка на Python"),
+            Vacancy("Очень длинное название вакансии ведущего разработчика", "http://example.com/2", None, 2000,
+                    "Разработка на Java", "USD"),
+            Vacancy("Стажер", "http://example.com/3", None, None, "Обучение"),
+        ]
+
+    def test_text(self):
+        """Тест: подробный формат содержит все поля и короткий разделитель."""
+        text = render(self.vacancies)
+        self.assertTrue(text.startswith("1. Python Developer\n   Ссылка: http://example.com/1\n"))
+        self.assertIn("   Зарплата: None - 2000\n", text)
+        self.assertEqual(text.count(SEPARATOR), 3)
+        self.assertLessEqual(len(SEPARATOR), 80)
+        self.assertEqual(render([]), "")
+
+    def test_table(self):
+        """Тест: таблица выводит одну строку на вакансию и обрезает длинные названия."""
+        lines = render(self.vacancies, "table", start=9).splitlines()
+        self.assertEqual(len(lines), 4)
+        self.assertTrue(lines[1].startswith(" 9  Python Developer"))
+        self.assertIn("100000 - 150000 RUR", lines[1])
+        self.assertIn("…", lines[2])
+        self.assertIn(" - 2000 USD", lines[2])
+        self.assertIn("  -  ", lines[3])
+
+    def test_machine_readable(self):
+        """Тест: JSON Lines и CSV читаются стандартными средствами."""
+        records = [json.loads(line) for line in render(self.vacancies, "jsonl").splitlines()]
+        self.assertEqual(records, [vacancy.to_dict() for vacancy in self.vacancies])
+
+        rows = list(csv.DictReader(io.StringIO(render(self.vacancies, "csv"))))
+        self.assertEqual([row["title"] for row in rows], [vacancy.get_title() for vacancy in self.vacancies])
+        self.assertEqual(rows[0]["salary_from"], "100000")
+        self.assertNotIn("title", render(self.vacancies, "csv", start=2))  # Заголовок только на первой странице
+
+        with self.assertRaises(ValueError):
+            render(self.vacancies, "xml")
+
+    def test_single_write(self):
+        """Тест: без постраничного режима весь вывод записывается одной операцией."""
+        stream = Mock(wraps=io.StringIO())
+        write_vacancies(self.vacancies * 100, "table", stream=stream, header="Найдено 300 вакансий:\n")
+
+        stream.write.assert_called_once()
+        self.assertTrue(stream.getvalue().startswith("Найдено 300 вакансий:\n"))
+
+    def test_pagination(self):
+        """Тест: постраничный вывод спрашивает о продолжении и останавливается по команде выхода."""
+        stream = io.StringIO()
+        prompt = Mock(side_effect=["", "q"])
+        write_vacancies(self.vacancies * 3, page_size=2, stream=stream, prompt=prompt)
+
+        self.assertEqual(prompt.call_count, 2)
+        output = stream.getvalue()
+        self.assertIn("4. Python Developer", output)
+        self.assertNotIn("5. ", output)
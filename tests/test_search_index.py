@@ -0,0 +1,48 @@
+import unittest
+from src.search_index import VacancyIndex, tokenize
+from src.vacancy import Vacancy
+
+
+class TestVacancyIndex(unittest.TestCase):
+    """Тесты для класса VacancyIndex."""
+
+    def setUp(self):
+        """Создание индекса по набору тестовых вакансий."""
+        self.vacancies = [
+            Vacancy("Python Developer", "http://example.com/1", 100000, 150000, "Django, PostgreSQL, Docker"),
+            Vacancy("Java Developer", "http://example.com/2", 120000, 170000, "Spring и Docker"),
+            Vacancy("Разработчик C++", "http://example.com/3", 90000, 130000, "Ёмкие задачи на C++ и Python"),
+        ]
+        self.index = VacancyIndex(self.vacancies)
+
+    def titles(self, vacancies):
+        return [vacancy.get_title() for vacancy in vacancies]
+
+    def test_tokenize(self):
+        """Тест: приведение регистра, "ё" и слова с "+" и "#"."""
+        self.assertEqual(
+            tokenize("Ёмкие задачи на C++ и C#, Python."),
+            ["емкие", "задачи", "на", "c++", "и", "c#", "python"],
+        )
+
+    def test_and_or_not(self):
+        """Тест: запросы AND, OR и NOT."""
+        self.assertEqual(self.titles(self.index.search(all_words=["python", "docker"])), ["Python Developer"])
+        self.assertEqual(
+            self.titles(self.index.search(any_words=["Spring", "c++"])), ["Java Developer", "Разработчик C++"]
+        )
+        self.assertEqual(self.titles(self.index.search(any_words=["docker"], exclude_words=["JAVA"])),
+                         ["Python Developer"])
+        self.assertEqual(self.titles(self.index.search(exclude_words=["docker"])), ["Разработчик C++"])
+        self.assertEqual(self.index.search(all_words=["python", "rust"]), [])
+
+    def test_case_folding(self):
+        """Тест: поиск не зависит от регистра и различия "е"/"ё"."""
+        self.assertEqual(self.titles(self.index.search(all_words=["ЕМКИЕ", "разработчик"])), ["Разработчик C++"])
+
+    def test_incremental_add(self):
+        """Тест: добавленная вакансия сразу участвует в поиске."""
+        self.index.add(Vacancy("Go Developer", "http://example.com/4", None, None, "Go и Docker"))
+        self.assertEqual(len(self.index), 4)
+        self.assertEqual(self.titles(self.index.search(all_words=["docker"], exclude_words=["python"])),
+                         ["Java Developer", "Go Developer"])
@@ -0,0 +1,197 @@
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from contextlib import redirect_stderr
+from io import StringIO
+from unittest.mock import MagicMock
+from urllib.error import HTTPError
+from urllib.request import urlopen
+from src.file_handler import JSONLinesFileHandler
+from src.metrics import metrics
+from src.service import SearchHTTPServer, SearchService, VacancySnapshot
+from src.vacancy import Vacancy
+from tests.helpers import make_item
+
+
+ITEMS = [
+    make_item(1, "Python Developer", 150000, "Python, Django"),
+    make_item(2, "Senior Python Developer", 3000, "Python, FastAPI", currency="USD"),
+    make_item(3, "Java Developer", 200000, "Java, Spring"),
+    make_item(4, "Python Intern", None, "Python"),
+    make_item(5, "PHP Developer", 100000, "PHP, Python"),
+]
+
+
+class TestSearchService(unittest.TestCase):
+    """Тесты HTTP-сервиса поиска."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.rates_path = os.path.join(self.directory, "rates.json")
+        with open(self.rates_path, "w", encoding="utf-8") as file:
+            json.dump({"base": "RUR", "rates": {"USD": 0.01}}, file)
+
+        self.api = MagicMock()
+        self.api.iter_vacancies.side_effect = lambda keyword, pages=1: iter(ITEMS)
+        self.service = SearchService(self.api, ["python"], rates_path=self.rates_path)
+        self.service.refresh()
+
+        self.server = SearchHTTPServer(self.service, port=0)
+        self.thread = threading.Thread(target=self.server.serve_forever, args=(0.05,), daemon=True)
+        self.thread.start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+    def get_text(self, path: str) -> str:
+        with urlopen(f"http://127.0.0.1:{self.server.server_address[1]}{path}", timeout=5) as response:
+            return response.read().decode("utf-8")
+
+    def get(self, path: str):
+        with urlopen(f"http://127.0.0.1:{self.server.server_address[1]}{path}", timeout=5) as response:
+            return response.status, json.loads(response.read().decode("utf-8"))
+
+    def test_search_ranks_by_normalized_salary(self):
+        """Тест: поиск по словам возвращает топ по зарплате в базовой валюте."""
+        status, body = self.get("/search?q=python&top=3")
+
+        self.assertEqual(status, 200)
+        self.assertEqual(body["total"], 4)
+        self.assertEqual([item["title"] for item in body["items"]],
+                         ["Senior Python Developer", "Python Developer", "PHP Developer"])
+
+    def test_search_filters(self):
+        """Тест: фильтр по минимальной зарплате и исключение слов."""
+        _, body = self.get("/search?q=python&min_salary=120000&exclude=fastapi")
+        self.assertEqual([item["title"] for item in body["items"]], ["Python Developer"])
+
+        _, body = self.get("/search")
+        self.assertEqual(body["total"], 5)
+
+    def test_unrated_currency_is_not_ranked(self):
+        """Тест: вакансия в валюте без курса не мешает пересчету остальных и не проходит фильтр по зарплате."""
+        items = ITEMS + [make_item(6, "Python Lead", 900000, "Python", currency="KZT")]
+        snapshot = VacancySnapshot(Vacancy.from_hh_items(items), self.rates_path)
+
+        self.assertEqual(snapshot.salaries[1], 300000)
+        self.assertIsNone(snapshot.salaries[5])
+        total, vacancies = snapshot.search(["python"], top=2)
+        self.assertEqual(total, 5)
+        self.assertEqual([vacancy.get_title() for vacancy in vacancies],
+                         ["Senior Python Developer", "Python Developer"])
+        total, _ = snapshot.search(["python"], min_salary=100000)
+        self.assertEqual(total, 3)
+
+    def test_search_without_words_uses_salary_order(self):
+        """Тест: без слов запроса топ и количество берутся из порядка по зарплате с учетом исключений и фильтра."""
+        snapshot = self.service.snapshot
+
+        total, vacancies = snapshot.search(exclude_words=["php"], top=2, min_salary=150000)
+        self.assertEqual(total, 3)
+        self.assertEqual([vacancy.get_title() for vacancy in vacancies], ["Senior Python Developer", "Java Developer"])
+        total, vacancies = snapshot.search(top=10)
+        self.assertEqual(total, 5)
+        self.assertEqual(vacancies[-1].get_title(), "Python Intern")
+
+    def test_errors(self):
+        """Тест: некорректные параметры и неизвестный путь."""
+        for path, status in (("/search?top=abc", 400), ("/search?top=0", 400), ("/unknown", 404)):
+            with self.assertRaises(HTTPError) as context:
+                self.get(path)
+            self.assertEqual(context.exception.code, status)
+            context.exception.close()
+
+    def test_health_and_refresh(self):
+        """Тест: обновление подменяет данные, пока сервис отвечает на запросы."""
+        _, health = self.get("/health")
+        self.assertEqual(health["vacancies"], 5)
+
+        self.api.iter_vacancies.side_effect = lambda keyword, pages=1: iter(ITEMS[:2])
+        self.service.refresh_interval = 0.01
+        self.service.start()
+        deadline = time.monotonic() + 5
+        while len(self.service.snapshot.vacancies) != 2:
+            self.assertLess(time.monotonic(), deadline)
+            time.sleep(0.01)
+        self.service.stop()
+
+        _, health = self.get("/health")
+        self.assertEqual(health["vacancies"], 2)
+
+    def test_metrics_endpoint(self):
+        """Тест: /metrics отдает счетчики и таймеры в текстовом формате Prometheus."""
+        self.get("/search?q=python")
+        text = self.get_text("/metrics")
+
+        self.assertIn("# TYPE vacancies_search_requests_total counter", text)
+        self.assertIn("vacancies_search_seconds_count", text)
+        self.assertIn("vacancies_harvest_seconds_sum", text)
+
+    def test_failed_refresh_keeps_data(self):
+        """Тест: если выгрузка не удалась, сервис продолжает отвечать по прежним данным."""
+        self.api.iter_vacancies.side_effect = ConnectionError("Ошибка сети")
+        self.service.refresh()
+
+        self.assertIn("python", self.service.errors)
+        self.assertEqual(len(self.service.snapshot.vacancies), 5)
+
+    def test_partial_failure_keeps_vacancies_of_failed_keyword(self):
+        """Тест: при ошибке одного слова вакансии, найденные по нему раньше, остаются в поиске."""
+        results = {"python": ITEMS[:2], "java": ITEMS[2:3]}
+        self.api.iter_vacancies.side_effect = lambda keyword, pages=1: iter(results[keyword])
+        service = SearchService(self.api, ["python", "java"], rates_path=self.rates_path)
+        service.refresh()
+
+        def java_fails(keyword, pages=1):
+            if keyword == "java":
+                raise ConnectionError("Ошибка сети")
+            return iter(ITEMS[:1])
+
+        self.api.iter_vacancies.side_effect = java_fails
+        service.refresh()
+
+        self.assertIn("java", service.errors)
+        self.assertEqual(sorted(vacancy.get_title() for vacancy in service.snapshot.vacancies),
+                         ["Java Developer", "Python Developer", "Senior Python Developer"])
+
+    def test_refresh_keeps_stored_history(self):
+        """Тест: с хранилищем снимок после обновления содержит и ранее сохраненные вакансии."""
+        handler = JSONLinesFileHandler(os.path.join(self.directory, "vacancies.jsonl"))
+        handler.add_many([{"title": "Archived Developer", "url": "https://api.hh.ru/vacancies/99",
+                           "salary_from": 50000, "salary_to": None, "description": "Python"}])
+        service = SearchService(self.api, ["python"], handler=handler, rates_path=self.rates_path)
+        service.refresh()
+
+        self.assertEqual(len(service.snapshot.vacancies), 6)
+        self.assertIn("Archived Developer", [vacancy.get_title() for vacancy in service.snapshot.vacancies])
+
+    def test_background_refresh_errors_go_to_stderr(self):
+        """Тест: ошибка фонового обновления учитывается в метриках и выводится в stderr."""
+        failures = metrics.get_counter("refresh_failures")
+        self.service.refresh = MagicMock(side_effect=RuntimeError("Сбой"))
+        self.service.refresh_interval = 0.01
+        stderr = StringIO()
+        with redirect_stderr(stderr):
+            self.service.start()
+            deadline = time.monotonic() + 5
+            while metrics.get_counter("refresh_failures") == failures:
+                self.assertLess(time.monotonic(), deadline)
+                time.sleep(0.01)
+            self.service.stop()
+
+        self.assertIn("Сбой", stderr.getvalue())
+
+    def test_warm_start_from_storage(self):
+        """Тест: сервис загружает сохраненные вакансии при старте без обращения к API."""
+        handler = JSONLinesFileHandler(os.path.join(self.directory, "vacancies.jsonl"))
+        service = SearchService(self.api, ["python"], handler=handler, rates_path=self.rates_path)
+        service.refresh()
+        self.api.reset_mock()
+
+        restarted = SearchService(self.api, ["python"], handler=handler, rates_path=self.rates_path)
+        self.assertEqual(len(restarted.snapshot.vacancies), 5)
+        self.api.iter_vacancies.assert_not_called()
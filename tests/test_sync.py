@@ -0,0 +1,143 @@
+import os
+import shutil
+import tempfile
+import unittest
+from src.file_handler import JSONFileHandler
+from src.sync import IncrementalSync, _parse_date
+from tests.helpers import make_item
+
+
+class FakeAPI:
+    """Клиент API, отдающий заранее заданные страницы и запоминающий запросы."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.calls = []
+        self.fetched = 0
+
+    def iter_pages(self, keyword, pages=1, params=None):
+        self.calls.append((keyword, pages, params))
+        for items in self.pages[:pages]:
+            self.fetched += 1
+            yield items
+
+
+class FilteringAPI:
+    """Клиент API, который, как hh.ru, фильтрует вакансии по date_from/date_to и делит выдачу на страницы."""
+
+    def __init__(self, items, per_page=2):
+        self.items = sorted(items, key=lambda item: _parse_date(item["published_at"]), reverse=True)
+        self.per_page = per_page
+        self.calls = []
+
+    def iter_pages(self, keyword, pages=1, params=None):
+        params = params or {}
+        self.calls.append(params)
+        date_from, date_to = _parse_date(params.get("date_from")), _parse_date(params.get("date_to"))
+        selected = [item for item in self.items
+                    if (date_from is None or _parse_date(item["published_at"]) >= date_from)
+                    and (date_to is None or _parse_date(item["published_at"]) <= date_to)]
+        for start in range(0, min(len(selected), pages * self.per_page), self.per_page):
+            yield selected[start:start + self.per_page]
+
+
+class TestIncrementalSync(unittest.TestCase):
+    """Тесты инкрементальной синхронизации."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.handler = JSONFileHandler(os.path.join(self.directory, "vacancies.json"))
+        self.state_filename = os.path.join(self.directory, "sync_state.json")
+
+    def make_sync(self, pages):
+        api = FakeAPI(pages)
+        return api, IncrementalSync(api, self.handler, self.state_filename)
+
+    def test_first_sync_fetches_everything(self):
+        """Тест: первая синхронизация выгружает все страницы и запоминает отметку."""
+        api, sync = self.make_sync([
+            [make_item("3", published_at="2024-05-01T12:00:00+0300"),
+             make_item("2", published_at="2024-05-01T11:00:00+0300")],
+            [make_item("1", published_at="2024-05-01T10:00:00+0300")],
+        ])
+
+        vacancies = sync.sync("Python", max_pages=5)
+
+        self.assertEqual(len(vacancies), 3)
+        self.assertEqual(api.calls, [("Python", 5, {"order_by": "publication_time"})])
+        self.assertEqual(len(self.handler.get_data()), 3)
+        self.assertEqual(sync.get_watermark(" python "), "2024-05-01T12:00:00+0300")
+
+    def test_next_sync_stops_at_known_vacancy(self):
+        """Тест: повторная синхронизация начинается с отметки и останавливается на известной вакансии."""
+        _, sync = self.make_sync([[make_item("2", published_at="2024-05-01T11:00:00+0300"),
+                                   make_item("1", published_at="2024-05-01T10:00:00+0300")]])
+        sync.sync("Python")
+
+        api, sync = self.make_sync([
+            [make_item("4", published_at="2024-05-01T13:00:00+0300"),
+             make_item("3", published_at="2024-05-01T12:00:00+0300")],
+            [make_item("2", published_at="2024-05-01T11:00:00+0300"),
+             make_item("1", published_at="2024-05-01T10:00:00+0300")],
+            [make_item("0", published_at="2024-05-01T09:00:00+0300")],
+        ])
+        vacancies = sync.sync("Python", max_pages=3)
+
+        self.assertEqual([v.get_url() for v in vacancies],
+                         ["https://api.hh.ru/vacancies/4", "https://api.hh.ru/vacancies/3"])
+        self.assertEqual(api.calls[0][2]["date_from"], "2024-05-01T11:00:00+0300")
+        self.assertEqual(api.fetched, 2)
+        self.assertEqual(len(self.handler.get_data()), 4)
+        self.assertEqual(sync.get_watermark("Python"), "2024-05-01T13:00:00+0300")
+
+    def test_republished_vacancy_is_updated(self):
+        """Тест: известная вакансия с более поздней датой публикации перезаписывается."""
+        _, sync = self.make_sync([[make_item("1", published_at="2024-05-01T10:00:00+0300")]])
+        sync.sync("Python")
+
+        _, sync = self.make_sync([[make_item("1", published_at="2024-05-02T10:00:00+0300", salary_from=150000),
+                                   make_item("1", published_at="2024-05-01T10:00:00+0300")]])
+        vacancies = sync.sync("Python")
+
+        self.assertEqual(len(vacancies), 1)
+        data = self.handler.get_data()
+        self.assertEqual(len(data), 1)
+        self.assertEqual(data[0]["salary_from"], 150000)
+
+    def test_reset(self):
+        """Тест: сброс отметки возвращает полную выгрузку."""
+        _, sync = self.make_sync([[make_item("1", published_at="2024-05-01T10:00:00+0300")]])
+        sync.sync("Python")
+        sync.sync("Java")
+
+        sync.reset("python")
+        self.assertIsNone(sync.get_watermark("Python"))
+        self.assertIsNotNone(sync.get_watermark("Java"))
+        sync.reset()
+        self.assertIsNone(sync.get_watermark("Java"))
+
+    def test_capped_sync_does_not_skip_gap(self):
+        """Тест: запуск, упершийся в max_pages, не сдвигает отметку, а следующие запуски дозагружают промежуток."""
+        old = [make_item("1", published_at="2024-05-01T10:00:00+0300"),
+               make_item("2", published_at="2024-05-01T11:00:00+0300")]
+        IncrementalSync(FilteringAPI(old), self.handler, self.state_filename).sync("Python")
+
+        new = [make_item(idx, published_at=f"2024-05-02T{idx:02d}:00:00+0300") for idx in range(3, 8)]
+        api = FilteringAPI(old + new)
+        sync = IncrementalSync(api, self.handler, self.state_filename)
+
+        sync.sync("Python", max_pages=1)
+        self.assertEqual(sync.get_watermark("Python"), "2024-05-01T11:00:00+0300")
+        for _ in range(10):
+            if sync.get_watermark("Python") != "2024-05-01T11:00:00+0300":
+                break
+            sync.sync("Python", max_pages=1)
+
+        self.assertEqual(sorted(int(entry["url"].rsplit("/", 1)[1]) for entry in self.handler.get_data()),
+                         list(range(1, 8)))
+        self.assertEqual(sync.get_watermark("Python"), "2024-05-02T07:00:00+0300")
+        self.assertEqual(api.calls[1]["date_to"], "2024-05-02T06:00:00+0300")
+
+        sync.sync("Python", max_pages=1)
+        self.assertNotIn("date_to", api.calls[-1])
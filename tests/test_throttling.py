@@ -0,0 +1,134 @@
+import unittest
+from email.utils import formatdate
+from unittest.mock import Mock
+from src.throttling import CircuitBreaker, CircuitOpenError, RetryPolicy, TokenBucket
+
+
+class FakeClock:
+    """Управляемые часы для детерминированных тестов."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Тесты для класса TokenBucket."""
+
+    def test_burst_then_throttle(self):
+        """Тест: всплеск в пределах емкости проходит сразу, затем запросы идут со скоростью rate."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2, capacity=2, clock=clock, sleep=clock.sleep)
+
+        bucket.acquire()
+        bucket.acquire()
+        self.assertEqual(clock.now, 0.0)
+
+        bucket.acquire()
+        self.assertAlmostEqual(clock.now, 0.5)
+
+    def test_reserve_queues_concurrent_callers(self):
+        """Тест: резервирования без ожидания выстраиваются в очередь."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=1, capacity=1, clock=clock)
+
+        self.assertEqual(bucket.reserve(), 0.0)
+        self.assertAlmostEqual(bucket.reserve(), 1.0)
+        self.assertAlmostEqual(bucket.reserve(), 2.0)
+
+    def test_invalid_rate(self):
+        """Тест: скорость должна быть положительной."""
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=0)
+
+
+class TestRetryPolicy(unittest.TestCase):
+    """Тесты для класса RetryPolicy."""
+
+    def test_exponential_backoff_with_jitter(self):
+        """Тест: задержка растет экспоненциально, ограничена сверху и масштабируется разбросом."""
+        policy = RetryPolicy(backoff_factor=1, max_backoff=5, jitter=lambda: 0.5)
+        self.assertEqual(policy.get_delay(0), 0.5)
+        self.assertEqual(policy.get_delay(2), 2.0)
+        self.assertEqual(policy.get_delay(10), 2.5)
+
+    def test_retry_after_seconds(self):
+        """Тест: Retry-After в секундах имеет приоритет над расчетной задержкой."""
+        policy = RetryPolicy(jitter=lambda: 0.5)
+        self.assertEqual(policy.get_delay(0, "7"), 7.0)
+        self.assertEqual(policy.get_delay(0, "invalid"), 0.25)
+
+    def test_retry_after_http_date(self):
+        """Тест: Retry-After в виде HTTP-даты в прошлом означает повтор без ожидания."""
+        policy = RetryPolicy()
+        self.assertEqual(policy.get_delay(0, formatdate(0, usegmt=True)), 0.0)
+
+    def test_should_retry(self):
+        """Тест: повторяются только временные ошибки."""
+        policy = RetryPolicy()
+        self.assertTrue(policy.should_retry(429))
+        self.assertTrue(policy.should_retry(503))
+        self.assertFalse(policy.should_retry(404))
+
+    def test_wait(self):
+        """Тест: wait использует переданную функцию ожидания."""
+        sleep = Mock()
+        RetryPolicy(sleep=sleep).wait(0, "3")
+        sleep.assert_called_once_with(3.0)
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    """Тесты для класса CircuitBreaker."""
+
+    def test_open_half_open_close(self):
+        """Тест: размыкание после порога, пробный запрос после таймаута, замыкание после успеха."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=10, clock=clock)
+
+        breaker.record_failure()
+        breaker.before_request()
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_request()
+
+        clock.now = 10
+        self.assertEqual(breaker.state, CircuitBreaker.HALF_OPEN)
+        breaker.before_request()
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_request()  # Пока идет пробный запрос, остальные не пропускаются
+
+        breaker.record_success()
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+        breaker.before_request()
+
+    def test_failed_probe_reopens(self):
+        """Тест: неудачный пробный запрос снова размыкает предохранитель."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=5, clock=clock)
+        breaker.record_failure()
+        clock.now = 5
+        breaker.before_request()
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+
+    def test_unreported_probe_expires(self):
+        """Тест: незарегистрированный пробный запрос не блокирует предохранитель дольше таймаута."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=5, clock=clock)
+        breaker.record_failure()
+        clock.now = 5
+        breaker.before_request()
+        clock.now = 9
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_request()
+
+        clock.now = 10
+        breaker.before_request()
+        breaker.record_success()
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
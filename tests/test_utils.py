@@ -1,7 +1,12 @@
+import io
+import json
+import os
+import shutil
+import tempfile
 import unittest
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 from src.vacancy import Vacancy
-from src.utils import display_vacancies
+from src.utils import display_vacancies, parse_vacancies, top_n_vacancies, top_salary_vacancies, user_interaction
 
 
 class TestVacancyApp(unittest.TestCase):
@@ -16,18 +21,20 @@ class TestVacancyApp(unittest.TestCase):
 
     def test_display_vacancies_empty(self):
         """Тест: вывод для пустого списка вакансий."""
-        with patch('builtins.print') as mock_print:
+        with patch('sys.stdout', new_callable=io.StringIO) as stdout:
             display_vacancies(self.empty_vacancies)
-            mock_print.assert_called_with("Нет вакансий для отображения.")
+        self.assertEqual(stdout.getvalue(), "Нет вакансий для отображения.\n")
 
     def test_display_vacancies(self):
-        """Тест: корректный вывод списка вакансий."""
-        with patch('builtins.print') as mock_print:
-            display_vacancies(self.vacancies)
-            self.assertTrue(mock_print.called)
-            mock_print.assert_any_call("1. Python Developer")
-            mock_print.assert_any_call("2. Java Developer")
-            mock_print.assert_any_call("3. C++ Developer")
+        """Тест: корректный вывод списка вакансий одной операцией записи."""
+        stream = Mock(wraps=io.StringIO())
+        display_vacancies(self.vacancies, stream=stream)
+        output = stream.getvalue()
+        stream.write.assert_called_once()
+        self.assertIn("Найдено 3 вакансий:", output)
+        self.assertIn("1. Python Developer\n", output)
+        self.assertIn("2. Java Developer\n", output)
+        self.assertIn("3. C++ Developer\n", output)
 
     def test_vacancies_from_api(self):
         """Тест: преобразование данных API в объекты Vacancy."""
@@ -60,6 +67,27 @@ class TestVacancyApp(unittest.TestCase):
         self.assertEqual(vacancies[1].get_salary_to(), 170000)
         self.assertEqual(vacancies[1].get_description(), "Нет описания")
 
+    def test_parse_vacancies(self):
+        """Тест: генератор parse_vacancies лениво преобразует данные API в объекты Vacancy."""
+        api_data = iter([
+            {
+                "name": "Python Developer",
+                "url": "http://example.com/1",
+                "salary": None,
+                "snippet": {"requirement": "Знание Python"},
+            },
+            {"name": "Java Developer", "url": "http://example.com/2", "salary": {"from": 120000, "to": None}},
+        ])
+        vacancies = parse_vacancies(api_data)
+
+        first = next(vacancies)
+        self.assertEqual(first.get_description(), "Знание Python")
+        self.assertIsNone(first.get_salary_from())
+        second = next(vacancies)
+        self.assertEqual(second.get_salary_from(), 120000)
+        self.assertEqual(second.get_description(), "Нет описания")
+        self.assertEqual(list(vacancies), [])
+
     def test_filter_vacancies_by_keywords(self):
         """Тест: фильтрация вакансий по ключевым словам."""
         keywords = ["Python", "C++"]
@@ -77,3 +105,91 @@ class TestVacancyApp(unittest.TestCase):
         self.assertEqual(sorted_vacancies[0].get_title(), "Java Developer")
         self.assertEqual(sorted_vacancies[1].get_title(), "Python Developer")
         self.assertEqual(sorted_vacancies[2].get_title(), "C++ Developer")
+
+    def test_top_n_vacancies(self):
+        """Тест: топ по разным ключам, включая функцию пользователя."""
+        self.vacancies.append(Vacancy("Go Developer", "http://example.com/4", None, 200000, "Разработка на Go"))
+
+        top = top_n_vacancies(self.vacancies, 2, key="salary_from")
+        self.assertEqual([v.get_title() for v in top], ["Java Developer", "Python Developer"])
+
+        top = top_n_vacancies(self.vacancies, 2, key="salary_to")
+        self.assertEqual([v.get_title() for v in top], ["Go Developer", "Java Developer"])
+
+        top = top_n_vacancies(self.vacancies, 1, key=lambda v: len(v.get_title()))
+        self.assertEqual([v.get_title() for v in top], ["Python Developer"])
+
+    def test_top_n_vacancies_none_placement(self):
+        """Тест: вакансии без зарплаты располагаются в конце или в начале топа."""
+        no_salary = Vacancy("Intern", "http://example.com/5", None, None, "Стажировка")
+        vacancies = [no_salary] + self.vacancies
+
+        top = top_n_vacancies(vacancies, 4)
+        self.assertIs(top[-1], no_salary)
+        self.assertEqual(top[0].get_title(), "Java Developer")
+
+        top = top_n_vacancies(vacancies, 2, nulls_last=False)
+        self.assertIs(top[0], no_salary)
+        self.assertEqual(top[1].get_title(), "Java Developer")
+
+    def test_top_n_vacancies_streaming(self):
+        """Тест: топ выбирается из генератора; некорректные параметры обрабатываются."""
+        top = top_n_vacancies((v for v in self.vacancies), 10)
+        self.assertEqual([v.get_title() for v in top], ["Java Developer", "Python Developer", "C++ Developer"])
+        self.assertEqual(top_n_vacancies(self.vacancies, 0), [])
+        with self.assertRaises(ValueError):
+            top_n_vacancies(self.vacancies, 1, key="title")
+
+    def test_top_salary_vacancies_with_rates(self):
+        """Тест: топ по зарплате учитывает валюту, если есть таблица курсов."""
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        rates_path = os.path.join(directory, "rates.json")
+        with open(rates_path, "w", encoding="utf-8") as file:
+            json.dump({"base": "RUR", "rates": {"USD": 0.01}}, file)
+        usd = Vacancy("Usd Developer", "http://example.com/4", 2000, None, "Описание", "USD")
+        vacancies = self.vacancies + [usd]
+
+        self.assertIs(top_salary_vacancies(vacancies, 1, rates_path=rates_path)[0], usd)
+        missing = os.path.join(directory, "missing.json")
+        self.assertEqual(top_salary_vacancies(vacancies, 1, rates_path=missing)[0].get_title(), "Java Developer")
+
+    def test_top_salary_vacancies_without_rate(self):
+        """Тест: вакансии в валюте без курса исключаются из топа, остальные сравниваются в базовой валюте."""
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        rates_path = os.path.join(directory, "rates.json")
+        with open(rates_path, "w", encoding="utf-8") as file:
+            json.dump({"base": "RUR", "rates": {"USD": 0.01}}, file)
+        usd = Vacancy("Usd Developer", "http://example.com/4", 2000, None, "Описание", "USD")
+        kzt = Vacancy("Kzt Developer", "http://example.com/5", 10 ** 7, None, "Описание", "KZT")
+
+        top = top_salary_vacancies(iter(self.vacancies + [usd, kzt]), 10, rates_path=rates_path)
+        self.assertIs(top[0], usd)
+        self.assertNotIn(kzt, top)
+        self.assertEqual(len(top), len(self.vacancies) + 1)
+
+        with open(rates_path, "w", encoding="utf-8") as file:
+            file.write("{")
+        with self.assertRaises(ValueError):
+            top_salary_vacancies(self.vacancies, 1, rates_path=rates_path)
+
+    def test_user_interaction_saves_on_capitalized_answer(self):
+        """Тест: ответ «Да» в любом регистре сохраняет вакансии в файл."""
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, "vacancies.json")
+        api = Mock()
+        api.iter_vacancies.return_value = iter([
+            {"name": "Python Developer", "url": "http://example.com/1",
+             "salary": {"from": 100000, "to": 150000, "currency": "RUR"}, "snippet": {"requirement": "Python"}},
+        ])
+        answers = iter(["Python", "1", "", "Да", path])
+
+        with patch("src.utils.HeadHunterAPI", return_value=api), patch("src.utils.ResponseCache"), \
+                patch("builtins.input", side_effect=lambda prompt="": next(answers)), \
+                patch("sys.stdout", new_callable=io.StringIO):
+            user_interaction()
+
+        with open(path, "r", encoding="utf-8") as file:
+            self.assertEqual([entry["title"] for entry in json.load(file)], ["Python Developer"])
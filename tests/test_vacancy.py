@@ -46,12 +46,57 @@ class TestVacancy(unittest.TestCase):
         self.assertTrue(self.vacancy2 > self.vacancy1)  # 150000 > 125000
         self.assertTrue(self.vacancy1 < self.vacancy2)  # 125000 < 150000
         self.assertTrue(self.vacancy1 <= self.vacancy2)  # 125000 <= 150000
-        self.assertFalse(self.vacancy1 == self.vacancy2)  # Средние зарплаты не равны
+        self.assertFalse(self.vacancy1 == self.vacancy2)  # Разные вакансии
         self.assertTrue(self.vacancy3 < self.vacancy1)  # None < 125000
         self.assertFalse(self.vacancy3 > self.vacancy1)  # None > 125000
         self.assertTrue(self.vacancy3 <= self.vacancy1)  # None <= 125000
         self.assertTrue(self.vacancy3 >= self.vacancy3)  # None >= None
 
+    def test_ordering_consistent_with_equality(self):
+        """Тест: при равной зарплате порядок определяется идентичностью, поэтому <= и >= вместе означают ==."""
+        python = Vacancy("Python Developer", "https://hh.ru/vacancy/1", 100000, None, "Python")
+        java = Vacancy("Java Developer", "https://hh.ru/vacancy/2", 100000, None, "Java")
+        python_site = Vacancy("Python Developer", "https://api.hh.ru/vacancies/1", 100000, None, "Python")
+
+        self.assertNotEqual(python, java)
+        self.assertFalse(python <= java and python >= java)
+        self.assertTrue(python < java or python > java)
+        self.assertTrue(python <= python_site and python >= python_site)
+        self.assertEqual(python, python_site)
+
+    def test_identity(self):
+        """Тест: равенство и хеш определяются идентификатором вакансии, а не зарплатой."""
+        api = Vacancy("Python Developer", "https://api.hh.ru/vacancies/93353083?host=hh.ru", 100000, None, "Python")
+        site = Vacancy("Python Developer", "https://hh.ru/vacancy/93353083", 120000, None, "Python, Django")
+        same_pay = Vacancy("Java Developer", "https://hh.ru/vacancy/1", 100000, None, "Java")
+
+        self.assertEqual(api.get_id(), "93353083")
+        self.assertIsNone(self.vacancy1.get_id())
+        self.assertEqual(api, site)
+        self.assertNotEqual(api, same_pay)
+        self.assertEqual(len({api, site, same_pay, self.vacancy1}), 3)
+
+    def test_identity_ignores_other_sites(self):
+        """Тест: ссылка другого сайта с путем /vacancy/<число> не считается вакансией hh.ru."""
+        hh = Vacancy("Python Developer", "https://spb.hh.ru/vacancy/123", 100000, None, "Python")
+        other = Vacancy("Python Developer", "https://jobs.example.com/vacancy/123", 100000, None, "Python")
+        lookalike = Vacancy("Python Developer", "https://nothh.ru/vacancy/123", 100000, None, "Python")
+
+        self.assertEqual(hh.identity(), "hh:123")
+        self.assertIsNone(other.get_id())
+        self.assertIsNone(lookalike.get_id())
+        self.assertEqual(other.identity(), "https://jobs.example.com/vacancy/123")
+        self.assertEqual(len({hh, other, lookalike}), 3)
+
+    def test_fingerprint(self):
+        """Тест: отпечаток меняется при изменении содержимого и не зависит от порядка ключей."""
+        copy = Vacancy.from_dict(self.vacancy1.to_dict())
+        changed = Vacancy.from_dict({**self.vacancy1.to_dict(), "description": "Работа с Python и SQL."})
+
+        self.assertEqual(self.vacancy1.fingerprint(), copy.fingerprint())
+        self.assertNotEqual(self.vacancy1.fingerprint(), changed.fingerprint())
+        self.assertEqual(Vacancy.fingerprint_of({"a": 1, "b": 2}), Vacancy.fingerprint_of({"b": 2, "a": 1}))
+
     def test_validation_success(self):
         """Тест: проверка успешной валидации входных данных."""
         vacancy = Vacancy(
@@ -89,7 +134,9 @@ class TestVacancy(unittest.TestCase):
             'url': "http://example.com/python",
             'salary_from': 100000,
             'salary_to': 150000,
-            'description': "Работа с Python."
+            'description': "Работа с Python.",
+            'currency': "RUR",
+            'gross': None
         }
         self.assertEqual(self.vacancy1.to_dict(), expected_dict)
 
@@ -101,6 +148,73 @@ class TestVacancy(unittest.TestCase):
         )
         self.assertEqual(repr(self.vacancy1), expected_repr)
 
+    def test_from_hh_items(self):
+        """Тест: пакетное создание вакансий из элементов ответа API hh.ru."""
+        items = [
+            {"name": "Python Developer", "url": "http://example.com/1",
+             "salary": {"from": 100000, "to": None, "currency": "USD", "gross": True},
+             "snippet": {"requirement": "Знание Python"}},
+            {"name": "Go Developer", "url": "http://example.com/2", "salary": None, "snippet": None},
+        ]
+        vacancies = Vacancy.from_hh_items(iter(items))
+
+        self.assertEqual(vacancies[0].to_dict(), {
+            'title': "Python Developer",
+            'url': "http://example.com/1",
+            'salary_from': 100000,
+            'salary_to': None,
+            'description': "Знание Python",
+            'currency': "USD",
+            'gross': True
+        })
+        self.assertIsNone(vacancies[1].get_salary_from())
+        self.assertEqual(vacancies[1].get_description(), "Нет описания")
+        with self.assertRaises(ValueError):
+            Vacancy.from_hh_items([{"name": "Developer", "url": "invalid-url", "salary": None}])
+
+    def test_from_hh_items_matches_from_hh_item(self):
+        """Тест: быстрый пакетный путь дает те же вакансии и ошибки, что и поштучная валидация."""
+        items = [
+            {"name": " Python Developer ", "url": "https://hh.ru/vacancy/1",
+             "salary": {"from": 1000, "to": 2000, "currency": " usd ", "gross": None},
+             "description": " Описание "},
+            {"name": "Go Developer", "url": "https://hh.ru/vacancy/2", "salary": {"from": True, "currency": "eur"}},
+        ]
+        self.assertEqual([vacancy.to_dict() for vacancy in Vacancy.from_hh_items(items)],
+                         [Vacancy.from_hh_item(item).to_dict() for item in items])
+        with self.assertRaises(ValueError):
+            Vacancy.from_hh_items([{"name": "Developer", "url": "https://hh.ru/vacancy/3", "salary": {"from": -1}}])
+        with self.assertRaises(KeyError):
+            Vacancy.from_hh_items([{"url": "https://hh.ru/vacancy/4"}])
+
+    def test_currency_validation(self):
+        """Тест: валидация валюты и признака gross, чтение старых записей без валюты."""
+        vacancy = Vacancy("Developer", "http://example.com", 1000, None, "Описание.", currency=" usd ", gross=False)
+        self.assertEqual(vacancy.get_currency(), "USD")
+        self.assertFalse(vacancy.get_gross())
+        with self.assertRaises(ValueError):
+            Vacancy("Developer", "http://example.com", 1000, None, "Описание.", currency="")
+        with self.assertRaises(ValueError):
+            Vacancy("Developer", "http://example.com", 1000, None, "Описание.", gross="yes")
+
+        legacy = {"title": "Developer", "url": "http://example.com", "salary_from": 1000, "salary_to": None,
+                  "description": "Описание."}
+        self.assertEqual(Vacancy.from_dict(legacy).get_currency(), "RUR")
+        self.assertIsNone(Vacancy.from_dict(legacy, trusted=True).get_gross())
+
+    def test_from_dicts(self):
+        """Тест: загрузка из словарей to_dict с валидацией и по доверенному пути."""
+        records = [self.vacancy1.to_dict(), self.vacancy3.to_dict()]
+        for trusted in (False, True):
+            vacancies = Vacancy.from_dicts(records, trusted=trusted)
+            self.assertEqual([vacancy.to_dict() for vacancy in vacancies], records)
+            self.assertEqual(vacancies[0].average_salary(), 125000.0)
+
+        invalid = dict(records[0], salary_from=-1)
+        with self.assertRaises(ValueError):
+            Vacancy.from_dicts([invalid])
+        self.assertEqual(Vacancy.from_dicts([invalid], trusted=True)[0].get_salary_from(), -1)
+
 
 if __name__ == "__main__":
     unittest.main()